@@ -1,6 +1,7 @@
 """Phase A compatibility layer delegating analysis to Phase B engine."""
 from __future__ import annotations
 
+from dataclasses import replace
 import os
 import sys
 
@@ -8,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from Phase_B.analysis_engine import AnalysisResult, PhaseBAnalysisEngine, ProposalResult
 from Shared.models import EVSignal, PriceSnapshot
+from Shared.ttl_cache import CacheStats
 
 _ENGINE = PhaseBAnalysisEngine()
 
@@ -15,16 +17,7 @@ _ENGINE = PhaseBAnalysisEngine()
 def compute_ev_for_signal(ticker: str, snapshot: PriceSnapshot) -> EVSignal:
     """Return EV signal for API compatibility."""
     if ticker != snapshot.ticker:
-        snapshot = PriceSnapshot(
-            ticker=ticker,
-            timestamp=snapshot.timestamp,
-            yes_bid=snapshot.yes_bid,
-            yes_ask=snapshot.yes_ask,
-            no_bid=snapshot.no_bid,
-            no_ask=snapshot.no_ask,
-            volume=snapshot.volume,
-            open_interest=snapshot.open_interest,
-        )
+        snapshot = replace(snapshot, ticker=ticker)
     return _ENGINE.analyze_snapshot(snapshot).signal
 
 
@@ -36,3 +29,8 @@ def analyze_snapshot_with_context(snapshot: PriceSnapshot) -> AnalysisResult:
 def propose_trade_with_context(snapshot: PriceSnapshot) -> ProposalResult:
     """Create a human-approval trade proposal after Phase B + C checks."""
     return _ENGINE.propose_trade(snapshot)
+
+
+def stress_cache_stats() -> CacheStats:
+    """Counters for the shared engine's Monte Carlo stress cache (health reporting)."""
+    return _ENGINE.risk_gateway.stress_tester.cache_stats()
@@ -11,10 +11,11 @@ from werkzeug.exceptions import HTTPException
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from Phase_A.analysis import analyze_snapshot_with_context, propose_trade_with_context
-from Phase_A.data_fetcher import fetch_markets, fetch_price_snapshots
+from Phase_A.analysis import analyze_snapshot_with_context, propose_trade_with_context, stress_cache_stats
+from Phase_A.data_fetcher import fetch_markets
+from Phase_A.ingestion import MarketDataIngestionService, SnapshotCache
 from Phase_A.logger import init_db, log_signal
-from Phase_C.imessage_proposal import REGISTRY
+from Phase_C.imessage_proposal import REGISTRY, log_trade_proposal
 from Phase_D.backtest_harness import BacktestHarness
 from Phase_F.model_retrainer import PhaseFModelRetrainer
 from Phase_F.version_rollback import VersionRollbackManager
@@ -24,6 +25,7 @@ from Phase_H.deployment_manager import PhaseHDeploymentManager
 from Shared.config import Config
 from Shared.logging_utils import configure_logging
 from Shared.order_executor import OrderExecutor, OrderRequest
+from Shared.time_utils import iso_to_epoch_ms
 
 configure_logging()
 app = Flask(__name__)
@@ -36,6 +38,11 @@ AUDIT_LOGGER = get_audit_logger()
 PHASE_H_DEPLOYMENT = PhaseHDeploymentManager(repo_root=Path(__file__).resolve().parent.parent, audit_logger=AUDIT_LOGGER)
 PHASE_H_ALERTING = PhaseHAlertingSystem(audit_logger=AUDIT_LOGGER)
 PHASE_H_DEPLOYMENT.ensure_assets()
+SNAPSHOT_CACHE = SnapshotCache()
+INGESTION = MarketDataIngestionService(SNAPSHOT_CACHE)
+INGESTION.refresh_now()
+if Config.INGESTION_BACKGROUND:
+    INGESTION.start(refresh_immediately=False)
 
 
 @app.route("/status")
@@ -59,6 +66,7 @@ def status():
 def health():
     """Production health snapshot for uptime monitors and orchestrators."""
     snapshot = PHASE_H_DEPLOYMENT.health_snapshot()
+    stress_cache = stress_cache_stats()
     AUDIT_LOGGER.log_event(
         component="api",
         event_type="health_check",
@@ -75,6 +83,9 @@ def health():
             "error_streak": snapshot.error_streak,
             "restart_recommended": snapshot.restart_recommended,
             "audit_db_path": Config.AUDIT_DB_PATH,
+            "stress_cache": {**stress_cache.__dict__, "hit_rate": stress_cache.hit_rate},
+            "audit_writer": AUDIT_LOGGER.writer_stats().__dict__,
+            "market_data": SNAPSHOT_CACHE.freshness(),
         }
     )
 
@@ -86,7 +97,11 @@ def logs():
     component = request.args.get("component")
     severity = request.args.get("severity")
     since = request.args.get("since")
-    events = AUDIT_LOGGER.query_events(limit=limit, component=component, severity=severity, since=since)
+    try:
+        since_ms = iso_to_epoch_ms(since) if since else None
+    except ValueError:
+        return jsonify({"error": f"Invalid ISO-8601 timestamp for since: {since}"}), 400
+    events = AUDIT_LOGGER.query_events(limit=limit, component=component, severity=severity, since=since_ms)
     return jsonify(
         {
             "count": len(events),
@@ -104,10 +119,10 @@ def markets():
 @app.route("/explain_trade/<ticker>")
 def explain_trade(ticker: str):
     """Structured explanation for a potential trade in read-only mode."""
-    snapshots = {s.ticker: s for s in fetch_price_snapshots()}
-    snap = snapshots.get(ticker)
+    view = SNAPSHOT_CACHE.view()
+    snap = view.get(ticker)
     if not snap:
-        return jsonify({"error": f"No data for ticker: {ticker}"}), 404
+        return jsonify({"error": f"No data for ticker: {ticker}", "data_freshness": SNAPSHOT_CACHE.freshness(view)}), 404
 
     result = analyze_snapshot_with_context(snap)
     signal = result.signal
@@ -133,8 +148,11 @@ def explain_trade(ticker: str):
             "risk_checks": result.edge_decision.threshold_checks,
             "risk_assessment": _serialize_risk(result.risk_assessment),
             "paper_trade_proposal": result.paper_trade_proposal.__dict__,
-            "proposal_preview": result.proposal_preview,
+            "proposal_preview": log_trade_proposal(result, result.risk_assessment),
+            "analysis_mode": result.mode,
+            "analysis_stages": list(result.stages),
             "action": "NO ACTION (Phase F learning active; live execution controls unchanged)",
+            "data_freshness": SNAPSHOT_CACHE.freshness(view),
         }
     )
 
@@ -142,22 +160,29 @@ def explain_trade(ticker: str):
 @app.route("/risk_assessment/<ticker>")
 def risk_assessment(ticker: str):
     """Return Phase C pre-trade risk output for one ticker."""
-    snapshots = {s.ticker: s for s in fetch_price_snapshots()}
-    snap = snapshots.get(ticker)
+    view = SNAPSHOT_CACHE.view()
+    snap = view.get(ticker)
     if not snap:
-        return jsonify({"error": f"No data for ticker: {ticker}"}), 404
+        return jsonify({"error": f"No data for ticker: {ticker}", "data_freshness": SNAPSHOT_CACHE.freshness(view)}), 404
 
     result = analyze_snapshot_with_context(snap)
-    return jsonify({"ticker": ticker, "risk_assessment": _serialize_risk(result.risk_assessment), "read_only": True})
+    return jsonify(
+        {
+            "ticker": ticker,
+            "risk_assessment": _serialize_risk(result.risk_assessment),
+            "read_only": True,
+            "data_freshness": SNAPSHOT_CACHE.freshness(view),
+        }
+    )
 
 
 @app.route("/paper_trade_sim/<ticker>")
 def paper_trade_sim(ticker: str):
     """Run a single proposal preview plus 100-trade deterministic backtest summary."""
-    snapshots = {s.ticker: s for s in fetch_price_snapshots()}
-    snap = snapshots.get(ticker)
+    view = SNAPSHOT_CACHE.view()
+    snap = view.get(ticker)
     if not snap:
-        return jsonify({"error": f"No data for ticker: {ticker}"}), 404
+        return jsonify({"error": f"No data for ticker: {ticker}", "data_freshness": SNAPSHOT_CACHE.freshness(view)}), 404
 
     result = analyze_snapshot_with_context(snap)
     backtest = BacktestHarness().run(trades=100)
@@ -167,6 +192,7 @@ def paper_trade_sim(ticker: str):
             "proposal": result.paper_trade_proposal.__dict__,
             "backtest_100_trade_summary": backtest.__dict__,
             "read_only": True,
+            "data_freshness": SNAPSHOT_CACHE.freshness(view),
         }
     )
 
@@ -178,8 +204,8 @@ def ios_dashboard():
     if token_error:
         return token_error
 
-    snapshots = fetch_price_snapshots()
-    tracked = snapshots[:5]
+    view = SNAPSHOT_CACHE.view()
+    tracked = view.values()[:5]
     now = datetime.now(timezone.utc)
 
     positions = []
@@ -224,6 +250,7 @@ def ios_dashboard():
             },
             "positions": positions,
             "history": history,
+            "data_freshness": SNAPSHOT_CACHE.freshness(view),
         }
     )
 
@@ -316,10 +343,10 @@ def execute_approved():
 
 @app.route("/propose_trade/<ticker>", methods=["POST"])
 def propose_trade(ticker: str):
-    snapshots = {s.ticker: s for s in fetch_price_snapshots()}
-    snap = snapshots.get(ticker)
+    view = SNAPSHOT_CACHE.view()
+    snap = view.get(ticker)
     if not snap:
-        return jsonify({"error": f"No data for ticker: {ticker}"}), 404
+        return jsonify({"error": f"No data for ticker: {ticker}", "data_freshness": SNAPSHOT_CACHE.freshness(view)}), 404
 
     result = propose_trade_with_context(snap)
     if result.proposal is None:
@@ -330,7 +357,9 @@ def propose_trade(ticker: str):
             message=f"Proposal rejected by risk for {ticker}",
             payload={"ticker": ticker, "reason": result.risk.reason},
         )
-        return jsonify({"status": "REJECTED_BY_RISK", "reason": result.risk.reason}), 200
+        return jsonify(
+            {"status": "REJECTED_BY_RISK", "reason": result.risk.reason, "data_freshness": SNAPSHOT_CACHE.freshness(view)}
+        ), 200
 
     AUDIT_LOGGER.log_event(
         component="api",
@@ -351,6 +380,7 @@ def propose_trade(ticker: str):
             "ticker": result.proposal.ticker,
             "side": result.proposal.side,
             "contracts": result.proposal.contracts,
+            "data_freshness": SNAPSHOT_CACHE.freshness(view),
         }
     )
 
@@ -366,7 +396,9 @@ def retrain_models():
     return jsonify(
         {
             "status": report.status,
+            "mode": report.mode,
             "sample_count": report.sample_count,
+            "new_sample_count": report.new_sample_count,
             "old_brier": report.old_brier,
             "new_brier": report.new_brier,
             "artifact_path": report.artifact_path,
@@ -487,6 +519,7 @@ def _serialize_risk(risk) -> dict:
             "p50_terminal": risk.stress_test.p50_terminal,
             "p95_terminal": risk.stress_test.p95_terminal,
             "pass_threshold": risk.stress_test.pass_threshold,
+            "mode": risk.stress_test.mode,
         },
     }
 
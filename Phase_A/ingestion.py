@@ -0,0 +1,198 @@
+"""Background market-data ingestion with a shared, versioned snapshot cache.
+
+An asyncio loop on a daemon thread refreshes snapshots on a fixed cadence and
+publishes each result as an immutable :class:`SnapshotView`. Publishing swaps a
+single reference, so request handlers read the current view without locks and
+look tickers up in O(1); a failed refresh keeps serving the previous view and
+reports it through the staleness metadata.
+
+The exchange connectors are blocking (pooled ``requests`` sessions; no async HTTP
+client is a dependency here), so each refresh runs them via ``asyncio.to_thread``.
+Exchange-backed sources never fall back to mock prices: an outage is recorded as
+a failure and the last good view is served as stale.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import sys
+from threading import Event, Thread
+import time
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+from Phase_A.data_fetcher import fetch_price_snapshots
+from Shared.config import Config
+from Shared.models import PriceSnapshot
+from Shared.time_utils import epoch_ms_to_iso
+
+logger = logging.getLogger(__name__)
+
+INGESTION_SOURCES = ("mock", "demo", "live")
+SnapshotSource = Callable[[], list[PriceSnapshot]]
+
+
+@dataclass(frozen=True)
+class SnapshotView:
+    """Immutable snapshot set published by one refresh."""
+
+    version: int
+    snapshots: Mapping[str, PriceSnapshot]
+    refreshed_at_ms: int
+    source: str
+
+    def get(self, ticker: str) -> PriceSnapshot | None:
+        return self.snapshots.get(ticker)
+
+    def values(self) -> list[PriceSnapshot]:
+        return list(self.snapshots.values())
+
+
+@dataclass
+class SnapshotCache:
+    """Copy-on-write snapshot cache; readers never block the ingestion writer."""
+
+    stale_after_seconds: float = field(default_factory=lambda: Config.INGESTION_STALE_AFTER_SECONDS)
+    clock_ms: Callable[[], int] = field(default=lambda: int(time.time() * 1000), repr=False)
+
+    def __post_init__(self) -> None:
+        self._view = SnapshotView(version=0, snapshots=MappingProxyType({}), refreshed_at_ms=0, source="empty")
+        self.last_error: str | None = None
+        self.consecutive_failures = 0
+
+    def view(self) -> SnapshotView:
+        return self._view
+
+    def get(self, ticker: str) -> PriceSnapshot | None:
+        return self._view.get(ticker)
+
+    def publish(self, snapshots: list[PriceSnapshot], source: str) -> SnapshotView:
+        """Swap in a new view; only the ingestion thread calls this."""
+        view = SnapshotView(
+            version=self._view.version + 1,
+            snapshots=MappingProxyType({snap.ticker: snap for snap in snapshots}),
+            refreshed_at_ms=self.clock_ms(),
+            source=source,
+        )
+        self._view = view
+        self.last_error = None
+        self.consecutive_failures = 0
+        return view
+
+    def merge(self, snapshots: list[PriceSnapshot], source: str) -> SnapshotView:
+        """Publish a new view that updates only ``snapshots``' tickers (streaming updates)."""
+        merged = dict(self._view.snapshots)
+        merged.update((snap.ticker, snap) for snap in snapshots)
+        view = SnapshotView(
+            version=self._view.version + 1,
+            snapshots=MappingProxyType(merged),
+            refreshed_at_ms=self.clock_ms(),
+            source=source,
+        )
+        self._view = view
+        return view
+
+    def record_failure(self, error: Exception) -> None:
+        self.last_error = f"{type(error).__name__}: {error}"
+        self.consecutive_failures += 1
+
+    def freshness(self, view: SnapshotView | None = None) -> dict:
+        """Staleness metadata attached to API responses."""
+        view = view or self._view
+        age_seconds = (self.clock_ms() - view.refreshed_at_ms) / 1000 if view.version else None
+        return {
+            "version": view.version,
+            "source": view.source,
+            "refreshed_at": epoch_ms_to_iso(view.refreshed_at_ms) if view.version else None,
+            "age_seconds": round(age_seconds, 3) if age_seconds is not None else None,
+            "stale": age_seconds is None or age_seconds > self.stale_after_seconds,
+            "last_error": self.last_error,
+        }
+
+
+class MarketDataIngestionService:
+    """Refresh a :class:`SnapshotCache` from ``source`` every ``interval_seconds``."""
+
+    def __init__(
+        self,
+        cache: SnapshotCache,
+        source: SnapshotSource | None = None,
+        source_name: str | None = None,
+        interval_seconds: float | None = None,
+    ) -> None:
+        self.cache = cache
+        self.source_name = source_name or Config.INGESTION_SOURCE
+        self.source = source or build_snapshot_source(self.source_name)
+        self.interval_seconds = Config.INGESTION_REFRESH_SECONDS if interval_seconds is None else interval_seconds
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._wake: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
+
+    def refresh_now(self) -> SnapshotView:
+        """Synchronous refresh, used to warm the cache before serving requests."""
+        return asyncio.run(self.refresh_once())
+
+    async def refresh_once(self) -> SnapshotView:
+        try:
+            # Connectors are blocking (pooled requests sessions); keep the loop responsive.
+            snapshots = await asyncio.to_thread(self.source)
+        except Exception as exc:  # noqa: BLE001 - any source failure keeps the previous view
+            if isinstance(exc, RuntimeError) and sys.is_finalizing():
+                # Interpreter shutdown: the default executor is gone; nothing to record.
+                return self.cache.view()
+            logger.warning("Snapshot ingestion from %s failed: %s", self.source_name, exc)
+            self.cache.record_failure(exc)
+            return self.cache.view()
+        return self.cache.publish(snapshots, self.source_name)
+
+    async def run(self, refresh_immediately: bool = True) -> None:
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        self._wake = (loop, wake)
+        while not self._stop.is_set():
+            if refresh_immediately:
+                await self.refresh_once()
+            refresh_immediately = True
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, refresh_immediately: bool = True) -> None:
+        """Run the refresh loop on a daemon thread; pass ``False`` after :meth:`refresh_now`."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(
+            target=asyncio.run, args=(self.run(refresh_immediately),), name="market-ingestion", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._wake is not None:
+            loop, wake = self._wake
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:  # loop already closed
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._wake = None
+
+
+def build_snapshot_source(name: str) -> SnapshotSource:
+    """Map an ``INGESTION_SOURCE`` name to a snapshot callable."""
+    if name not in INGESTION_SOURCES:
+        raise ValueError(f"Unknown ingestion source: {name}")
+    if name == "mock":
+        return fetch_price_snapshots
+
+    from Phase_D.demo_connector import DemoKalshiConnector
+    from Phase_E.live_connector import KalshiLiveConnector
+
+    base_url = KalshiLiveConnector.base_url if name == "live" else None
+    connector = DemoKalshiConnector(base_url=base_url, mock_fallback=False)
+    return lambda: connector.fetch_market_snapshots(status="open")
@@ -1,46 +1,361 @@
-"""SQLite audit logger for trade signals and decisions."""
-import sqlite3, json, datetime, os
-
-DB_PATH = os.path.join(os.path.dirname(__file__), "..", "kalshi_data.db")
-
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""CREATE TABLE IF NOT EXISTS markets (
-        ticker TEXT PRIMARY KEY,
-        title TEXT,
-        category TEXT,
-        status TEXT,
-        last_updated TEXT
-    )""")
-    c.execute("""CREATE TABLE IF NOT EXISTS price_snapshots (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        ticker TEXT,
-        timestamp TEXT,
-        yes_bid REAL, yes_ask REAL,
-        no_bid REAL, no_ask REAL,
-        volume INTEGER, open_interest INTEGER
-    )""")
-    c.execute("""CREATE TABLE IF NOT EXISTS trade_signals (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        ticker TEXT,
-        timestamp TEXT,
-        ev_percent REAL,
-        confidence REAL,
-        side TEXT,
-        explanation TEXT,
-        status TEXT DEFAULT 'LOGGED'
-    )""")
-    conn.commit()
-    conn.close()
-
-def log_signal(signal):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        "INSERT INTO trade_signals (ticker,timestamp,ev_percent,confidence,side,explanation) VALUES (?,?,?,?,?,?)",
-        (signal.ticker, datetime.datetime.utcnow().isoformat(),
-         signal.ev_percent, signal.confidence, signal.side, signal.explanation)
+"""SQLite audit logger for trade signals and decisions.
+
+Event times are stored as integer epoch milliseconds (``timestamp_ms``) and
+indexed for range scans and ordering. The ISO-8601 ``timestamp`` text column is
+kept as a legacy mirror for external readers; nothing in the pipeline parses it.
+
+Writes go through one pooled :class:`LogWriter` per database, a long-lived WAL
+connection. Signals are decisions and are committed on every call. Snapshots
+are buffered and inserted with ``executemany`` once ``LOG_WRITE_BATCH_SIZE``
+rows are pending or every ``LOG_FLUSH_INTERVAL_SECONDS``; a crash loses at most
+that window of market data (``LOG_WRITE_BATCH_SIZE=1`` writes them through
+too). Readers open connections with :func:`connect_reader`, which flushes
+pending rows first.
+
+With ``SNAPSHOT_PARTITIONING=monthly`` new snapshots land in per-month tables
+(``price_snapshots_YYYYMM``) that share the base table's id sequence. The
+``price_snapshots_all`` view unions every partition for ad-hoc queries; hot
+readers instead query each table through its covering index and merge the
+already-ordered streams (:func:`iter_snapshot_rows`), which avoids a sort.
+"""
+from __future__ import annotations
+
+import atexit
+import heapq
+import os
+import sqlite3
+import time
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from Shared.config import Config
+from Shared.sqlite_migrations import Migration, add_epoch_ms_column, migrate, table_exists
+from Shared.time_utils import epoch_ms_to_iso
+
+DB_PATH = Config.KALSHI_DB_PATH
+
+SNAPSHOT_PARTITIONING_MODES = ("none", "monthly")
+SNAPSHOT_VIEW = "price_snapshots_all"
+SNAPSHOT_COLUMNS = (
+    "id", "ticker", "timestamp", "yes_bid", "yes_ask", "no_bid", "no_ask", "volume", "open_interest", "timestamp_ms",
+)
+_PARTITION_PREFIX = "price_snapshots_"
+
+_INSERT_SIGNAL_SQL = (
+    "INSERT INTO trade_signals (ticker,timestamp,timestamp_ms,ev_percent,confidence,side,explanation) "
+    "VALUES (?,?,?,?,?,?,?)"
+)
+_INSERT_SNAPSHOT_SQL = (
+    "INSERT INTO {table} (id,ticker,timestamp,yes_bid,yes_ask,no_bid,no_ask,volume,open_interest,timestamp_ms) "
+    "VALUES (?,?,?,?,?,?,?,?,?,?)"
+)
+
+
+def _snapshot_indexes(conn, table):
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table}(timestamp_ms, id)")
+    # Covers the retrainer's read, so it never touches the table rows.
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_{table}_retrain ON {table}(ticker, timestamp_ms, yes_bid, yes_ask, volume)"
+    )
+
+
+def _add_timestamp_ms(conn):
+    for table in ("price_snapshots", "trade_signals"):
+        add_epoch_ms_column(conn, table)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_price_snapshots_ts ON price_snapshots(timestamp_ms, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_price_snapshots_ticker_ts ON price_snapshots(ticker, timestamp_ms)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_trade_signals_ts ON trade_signals(timestamp_ms)")
+
+
+def _add_covering_indexes(conn):
+    conn.execute("DROP INDEX IF EXISTS idx_price_snapshots_ticker_ts")
+    _snapshot_indexes(conn, "price_snapshots")
+    # Governance only replays non-HOLD signals in id order.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_trade_signals_review "
+        "ON trade_signals(id, side, confidence, ev_percent) WHERE side IS NOT 'HOLD'"
     )
-    conn.commit()
-    conn.close()
+    _refresh_snapshot_view(conn)
+
+
+SCHEMA_MIGRATIONS = (
+    Migration(
+        1,
+        "baseline tables",
+        (
+            """CREATE TABLE IF NOT EXISTS markets (
+                ticker TEXT PRIMARY KEY,
+                title TEXT,
+                category TEXT,
+                status TEXT,
+                last_updated TEXT
+            )""",
+            """CREATE TABLE IF NOT EXISTS price_snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticker TEXT,
+                timestamp TEXT,
+                yes_bid REAL, yes_ask REAL,
+                no_bid REAL, no_ask REAL,
+                volume INTEGER, open_interest INTEGER
+            )""",
+            """CREATE TABLE IF NOT EXISTS trade_signals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticker TEXT,
+                timestamp TEXT,
+                ev_percent REAL,
+                confidence REAL,
+                side TEXT,
+                explanation TEXT,
+                status TEXT DEFAULT 'LOGGED'
+            )""",
+        ),
+    ),
+    Migration(2, "integer epoch-ms timestamps with indexes", apply=_add_timestamp_ms),
+    Migration(3, "covering read indexes and snapshot union view", apply=_add_covering_indexes),
+)
+
+
+def init_db(db_path=None):
+    """Create or upgrade the schema; returns the migration versions applied."""
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        return migrate(conn, SCHEMA_MIGRATIONS)
+    finally:
+        conn.close()
+
+
+def ensure_schema(db_path):
+    """Upgrade an existing database in place before reading ``timestamp_ms``."""
+    conn = sqlite3.connect(db_path)
+    try:
+        if table_exists(conn, "price_snapshots") or table_exists(conn, "trade_signals"):
+            migrate(conn, SCHEMA_MIGRATIONS)
+    finally:
+        conn.close()
+
+
+def connect_reader(db_path=None):
+    """Connection that sees every buffered write, on an up-to-date schema."""
+    db_path = db_path or DB_PATH
+    flush(db_path)
+    ensure_schema(db_path)
+    return sqlite3.connect(db_path)
+
+
+def snapshot_tables(conn) -> list[str]:
+    """The base snapshot table followed by its monthly partitions, oldest first."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ? ORDER BY name",
+        (_PARTITION_PREFIX + "[0-9][0-9][0-9][0-9][0-9][0-9]",),
+    ).fetchall()
+    return ["price_snapshots"] + [row[0] for row in rows]
+
+
+def iter_snapshot_rows(
+    conn, select_sql: str, params: Sequence[Any], key: Callable[[tuple], Any]
+) -> Iterator[tuple]:
+    """Run ``select_sql`` (with a ``{table}`` placeholder) on every snapshot table.
+
+    Each statement must return rows already ordered by ``key``; the per-table
+    streams are merged lazily so the overall order matches one big ``ORDER BY``.
+    ``None`` key parts sort first, like SQLite's ``NULL`` (untimed rows stay in
+    the base table while timed rows of the same ticker go to partitions).
+    """
+    cursors = [conn.execute(select_sql.format(table=table), params) for table in snapshot_tables(conn)]
+    if len(cursors) == 1:
+        return iter(cursors[0])
+
+    def nulls_first(row: tuple) -> tuple:
+        value = key(row)
+        return tuple((part is not None, part) for part in (value if isinstance(value, tuple) else (value,)))
+
+    return heapq.merge(*cursors, key=nulls_first)
+
+
+def partition_for(timestamp_ms: int) -> str:
+    moment = time.gmtime(timestamp_ms // 1000)
+    return f"{_PARTITION_PREFIX}{moment.tm_year:04d}{moment.tm_mon:02d}"
+
+
+def ensure_partition(conn, table: str) -> bool:
+    """Create a monthly partition (same columns and indexes) and refresh the view."""
+    if table_exists(conn, table):
+        return False
+    with conn:
+        conn.execute(
+            f"""CREATE TABLE {table} (
+                id INTEGER PRIMARY KEY,
+                ticker TEXT,
+                timestamp TEXT,
+                yes_bid REAL, yes_ask REAL,
+                no_bid REAL, no_ask REAL,
+                volume INTEGER, open_interest INTEGER,
+                timestamp_ms INTEGER
+            )"""
+        )
+        _snapshot_indexes(conn, table)
+        _refresh_snapshot_view(conn)
+    return True
+
+
+def _refresh_snapshot_view(conn):
+    select = ", ".join(SNAPSHOT_COLUMNS)
+    union = " UNION ALL ".join(f"SELECT {select} FROM {table}" for table in snapshot_tables(conn))
+    conn.execute(f"DROP VIEW IF EXISTS {SNAPSHOT_VIEW}")
+    conn.execute(f"CREATE VIEW {SNAPSHOT_VIEW} AS {union}")
+
+
+def _reserve_snapshot_ids(conn, count: int) -> int:
+    """Take ``count`` ids from the base table's AUTOINCREMENT sequence; returns the first."""
+    conn.execute(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'price_snapshots', COALESCE(MAX(id), 0) FROM price_snapshots "
+        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'price_snapshots')"
+    )
+    last = conn.execute(
+        "UPDATE sqlite_sequence SET seq = seq + ? WHERE name = 'price_snapshots' RETURNING seq", (count,)
+    ).fetchone()[0]
+    return int(last) - count + 1
+
+
+class LogWriter:
+    """Pooled writer for one database: signals write through, snapshots are batched."""
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int | None = None,
+        flush_interval_seconds: float | None = None,
+        partitioning: str | None = None,
+    ) -> None:
+        self.db_path = db_path
+        self.batch_size = max(int(batch_size or Config.LOG_WRITE_BATCH_SIZE), 1)
+        self.flush_interval_seconds = float(flush_interval_seconds or Config.LOG_FLUSH_INTERVAL_SECONDS)
+        self.partitioning = partitioning or Config.SNAPSHOT_PARTITIONING
+        if self.partitioning not in SNAPSHOT_PARTITIONING_MODES:
+            raise ValueError(f"Unsupported snapshot partitioning: {self.partitioning}")
+        init_db(db_path)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, cached_statements=256)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = Lock()
+        self._signals: list[tuple] = []
+        self._snapshots: list = []
+        self._stop = Event()
+        self._closed = False
+        self._flusher: Thread | None = None
+        if self.batch_size > 1:
+            self._flusher = Thread(target=self._flush_loop, name="signal-log-writer", daemon=True)
+            self._flusher.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self._signals) + len(self._snapshots)
+
+    def add_signal(self, signal) -> None:
+        now_ms = time.time_ns() // 1_000_000
+        row = (
+            signal.ticker, epoch_ms_to_iso(now_ms), now_ms,
+            signal.ev_percent, signal.confidence, signal.side, signal.explanation,
+        )
+        with self._lock:
+            self._signals.append(row)
+        self.flush()
+
+    def add_snapshots(self, snapshots: Iterable) -> None:
+        with self._lock:
+            self._snapshots.extend(snapshots)
+            due = self.pending >= self.batch_size or self._closed
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            signals, self._signals = self._signals, []
+            snapshots, self._snapshots = self._snapshots, []
+            if not signals and not snapshots:
+                return
+            by_table = self._route(snapshots)
+            with self._conn:
+                if signals:
+                    self._conn.executemany(_INSERT_SIGNAL_SQL, signals)
+                for table, rows in by_table.items():
+                    first_id = _reserve_snapshot_ids(self._conn, len(rows)) if table != "price_snapshots" else None
+                    self._conn.executemany(
+                        _INSERT_SNAPSHOT_SQL.format(table=table),
+                        [
+                            (None if first_id is None else first_id + offset, s.ticker, s.timestamp, s.yes_bid,
+                             s.yes_ask, s.no_bid, s.no_ask, s.volume, s.open_interest, s.timestamp_ms)
+                            for offset, s in enumerate(rows)
+                        ],
+                    )
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def _route(self, snapshots: list) -> dict[str, list]:
+        if self.partitioning == "none":
+            return {"price_snapshots": snapshots} if snapshots else {}
+        by_table: dict[str, list] = {}
+        for snapshot in snapshots:
+            # Rows without an event time cannot be placed in a month; keep them in the base table.
+            table = partition_for(snapshot.timestamp_ms) if snapshot.timestamp_ms is not None else "price_snapshots"
+            by_table.setdefault(table, []).append(snapshot)
+        for table in by_table:
+            if table != "price_snapshots":
+                ensure_partition(self._conn, table)
+        return by_table
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval_seconds):
+            if self.pending:
+                self.flush()
+
+
+_WRITERS: dict[str, LogWriter] = {}
+_WRITERS_LOCK = Lock()
+
+
+def get_writer(db_path=None) -> LogWriter:
+    """The process-wide writer for ``db_path`` (created and migrated on first use)."""
+    key = os.path.abspath(db_path or DB_PATH)
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = _WRITERS[key] = LogWriter(key)
+        return writer
+
+
+def flush(db_path=None) -> None:
+    """Write out anything buffered for ``db_path`` (no-op without a writer)."""
+    writer = _WRITERS.get(os.path.abspath(db_path or DB_PATH))
+    if writer is not None:
+        writer.flush()
+
+
+@atexit.register
+def close_writers() -> None:
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for writer in writers:
+        writer.close()
+
+
+def log_signal(signal, db_path=None):
+    get_writer(db_path).add_signal(signal)
+
+
+def log_snapshots(snapshots, store=None, db_path=None):
+    """Persist price snapshots to SQLite and, when given, a columnar snapshot store."""
+    snapshots = list(snapshots)
+    get_writer(db_path).add_snapshots(snapshots)
+    if store is not None:
+        store.append(snapshots, strict=False)
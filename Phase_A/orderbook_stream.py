@@ -0,0 +1,365 @@
+"""Streaming order book consumer for Kalshi's ``orderbook_delta`` channel.
+
+Each ticker keeps a compact book: two integer arrays (YES bids, NO bids) indexed
+by price in cents 1–99. ``orderbook_snapshot`` messages replace a book and
+``orderbook_delta`` messages adjust one level. Kalshi only quotes bids, so the
+top of book is derived as ``yes_ask = 100 - best_no_bid`` and
+``no_ask = 100 - best_yes_bid``.
+
+Messages carry a per-subscription (``sid``) sequence number. A gap, a delta
+that would drive a level negative, or a price outside 1–99 invalidates every
+book on that sid; the sid is unsubscribed and retired (late messages from it are
+dropped) and the tickers are resubscribed to obtain a fresh snapshot. Top-of-book
+changes are coalesced and merged into the shared :class:`SnapshotCache`.
+
+Transports are pluggable: :class:`WebSocketTransport` talks to the exchange
+(requires the optional ``websockets>=14`` package) and :class:`JsonLinesTransport`
+speaks newline-delimited JSON to :class:`OrderbookReplayServer`, which replays
+recorded message files for tests and local development.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any, AsyncIterator, Iterable, Protocol
+
+import numpy as np
+
+from Phase_A.ingestion import SnapshotCache
+from Shared.config import Config
+from Shared.models import PriceSnapshot
+from Shared.time_utils import epoch_ms_to_iso
+
+logger = logging.getLogger(__name__)
+
+ORDERBOOK_CHANNEL = "orderbook_delta"
+PRICE_LEVELS = 100  # index 0 unused; prices are 1..99 cents
+_SIDES = {"yes": 0, "no": 1}
+
+
+class OrderBook:
+    """Per-ticker resting quantity by side and price level."""
+
+    __slots__ = ("ticker", "levels", "sid", "valid")
+
+    def __init__(self, ticker: str) -> None:
+        self.ticker = ticker
+        self.levels = np.zeros((2, PRICE_LEVELS), dtype=np.int64)
+        self.sid: int | None = None
+        self.valid = False
+
+    def apply_snapshot(self, yes: Iterable[Iterable[int]], no: Iterable[Iterable[int]], sid: int | None) -> None:
+        self.levels[:] = 0
+        for side, levels in ((0, yes), (1, no)):
+            for price, quantity in levels:
+                self.levels[side, _price_index(price)] = int(quantity)
+        self.sid = sid
+        self.valid = True
+
+    def apply_delta(self, side: str, price: int, delta: int) -> bool:
+        """Adjust one level; returns ``False`` when the book is inconsistent."""
+        row, index = _SIDES[side], _price_index(price)
+        updated = self.levels[row, index] + int(delta)
+        if updated < 0:
+            self.valid = False
+            return False
+        self.levels[row, index] = updated
+        return True
+
+    def best_bid(self, side: str) -> int | None:
+        prices = np.flatnonzero(self.levels[_SIDES[side]])
+        return int(prices[-1]) if prices.size else None
+
+    def top_of_book(self) -> tuple[float, float, float, float] | None:
+        """``(yes_bid, yes_ask, no_bid, no_ask)`` in cents, or ``None`` if a side is empty."""
+        yes_bid, no_bid = self.best_bid("yes"), self.best_bid("no")
+        if yes_bid is None or no_bid is None:
+            return None
+        return float(yes_bid), float(100 - no_bid), float(no_bid), float(100 - yes_bid)
+
+
+@dataclass
+class StreamStats:
+    messages: int = 0
+    snapshots: int = 0
+    deltas: int = 0
+    gaps: int = 0
+    resyncs: int = 0
+    dropped_deltas: int = 0
+    published: int = 0
+
+
+class MessageTransport(Protocol):
+    async def send(self, message: dict[str, Any]) -> None: ...
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]: ...
+
+
+@dataclass
+class OrderbookStreamConsumer:
+    """Apply orderbook snapshot/delta messages and publish top of book into ``cache``."""
+
+    cache: SnapshotCache
+    publish_interval_ms: float = field(default_factory=lambda: Config.ORDERBOOK_PUBLISH_INTERVAL_MS)
+    source: str = "orderbook_stream"
+
+    def __post_init__(self) -> None:
+        self.books: dict[str, OrderBook] = {}
+        self.stats = StreamStats()
+        self._last_seq: dict[int, int] = {}
+        self._retired_sids: set[int] = set()
+        self._unsubscribe: list[int] = []
+        self._dirty: set[str] = set()
+        self._last_publish = time.monotonic()
+        self._command_id = 0
+
+    async def run(self, transport: MessageTransport, tickers: list[str]) -> None:
+        """Subscribe and consume until the transport closes."""
+        await transport.send(self.subscribe_command(tickers))
+        async for message in transport:
+            resync = self.handle(message)
+            if resync:
+                self.stats.resyncs += 1
+                if self._unsubscribe:
+                    await transport.send(self.unsubscribe_command(self._unsubscribe))
+                    self._unsubscribe = []
+                await transport.send(self.subscribe_command(sorted(resync)))
+            if self._publish_due():
+                self.flush()
+        self.flush()
+
+    def subscribe_command(self, tickers: list[str]) -> dict[str, Any]:
+        self._command_id += 1
+        return {
+            "id": self._command_id,
+            "cmd": "subscribe",
+            "params": {"channels": [ORDERBOOK_CHANNEL], "market_tickers": list(tickers)},
+        }
+
+    def unsubscribe_command(self, sids: list[int]) -> dict[str, Any]:
+        self._command_id += 1
+        return {"id": self._command_id, "cmd": "unsubscribe", "params": {"sids": list(sids)}}
+
+    def handle(self, message: dict[str, Any]) -> set[str]:
+        """Apply one message; returns tickers that need a resubscribe."""
+        self.stats.messages += 1
+        kind = message.get("type")
+        body = message.get("msg") or {}
+        sid, seq = message.get("sid"), message.get("seq")
+        if sid is not None and sid in self._retired_sids:
+            # Late traffic from a subscription we already replaced.
+            if kind == "orderbook_delta":
+                self.stats.dropped_deltas += 1
+            return set()
+
+        if kind == "orderbook_snapshot":
+            book = self.books.setdefault(body["market_ticker"], OrderBook(body["market_ticker"]))
+            try:
+                book.apply_snapshot(body.get("yes") or [], body.get("no") or [], sid)
+            except ValueError as exc:
+                return self._resync(book, sid, exc)
+            if sid is not None and seq is not None:
+                self._last_seq[sid] = seq
+            self.stats.snapshots += 1
+            self._dirty.add(book.ticker)
+            return set()
+
+        if kind == "orderbook_delta":
+            if sid is not None and seq is not None:
+                expected = self._last_seq.get(sid)
+                if expected is not None and seq != expected + 1:
+                    self.stats.gaps += 1
+                    logger.warning("Orderbook sequence gap on sid=%s: expected %s, got %s", sid, expected + 1, seq)
+                    return self._invalidate_sid(sid)
+                self._last_seq[sid] = seq
+
+            book = self.books.get(body.get("market_ticker"))
+            if book is None or not book.valid or (sid is not None and book.sid != sid):
+                self.stats.dropped_deltas += 1
+                return set()
+            self.stats.deltas += 1
+            try:
+                consistent = book.apply_delta(body["side"], body["price"], body["delta"])
+            except ValueError as exc:
+                return self._resync(book, sid, exc)
+            if not consistent:
+                logger.warning("Orderbook for %s went negative; resyncing", book.ticker)
+                return self._resync(book, sid)
+            self._dirty.add(book.ticker)
+            return set()
+
+        if kind == "error":
+            logger.warning("Orderbook stream error: %s", body)
+        return set()
+
+    def flush(self) -> None:
+        """Merge changed top-of-book quotes into the snapshot cache."""
+        self._last_publish = time.monotonic()
+        if not self._dirty:
+            return
+        now_ms = self.cache.clock_ms()
+        timestamp = epoch_ms_to_iso(now_ms)
+        view = self.cache.view()
+        updates: list[PriceSnapshot] = []
+        for ticker in sorted(self._dirty):
+            book = self.books[ticker]
+            quote = book.top_of_book() if book.valid else None
+            if quote is None:
+                continue
+            previous = view.get(ticker)
+            yes_bid, yes_ask, no_bid, no_ask = quote
+            updates.append(
+                PriceSnapshot(
+                    ticker=ticker,
+                    timestamp=timestamp,
+                    timestamp_ms=now_ms,
+                    yes_bid=yes_bid,
+                    yes_ask=yes_ask,
+                    no_bid=no_bid,
+                    no_ask=no_ask,
+                    volume=previous.volume if previous else 0,
+                    open_interest=previous.open_interest if previous else 0,
+                )
+            )
+        self._dirty.clear()
+        if updates:
+            self.cache.merge(updates, self.source)
+            self.stats.published += len(updates)
+
+    def _resync(self, book: OrderBook, sid: int | None, error: ValueError | None = None) -> set[str]:
+        if error is not None:
+            self.stats.gaps += 1
+            logger.warning("Malformed orderbook message for %s (%s); resyncing", book.ticker, error)
+        book.valid = False
+        if sid is None:
+            return {book.ticker}
+        # A snapshot that failed mid-apply leaves the book on its previous sid.
+        return self._invalidate_sid(sid) | {book.ticker}
+
+    def _invalidate_sid(self, sid: int) -> set[str]:
+        """Retire ``sid`` (queued for unsubscribe) and return the tickers it carried."""
+        self._last_seq.pop(sid, None)
+        if sid not in self._retired_sids:
+            self._retired_sids.add(sid)
+            self._unsubscribe.append(sid)
+        affected = {book.ticker for book in self.books.values() if book.sid == sid}
+        for ticker in affected:
+            self.books[ticker].valid = False
+        return affected
+
+    def _publish_due(self) -> bool:
+        return (time.monotonic() - self._last_publish) * 1000 >= self.publish_interval_ms
+
+
+class JsonLinesTransport:
+    """Newline-delimited JSON over TCP (replay server and local tooling)."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "JsonLinesTransport":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send(self, message: dict[str, Any]) -> None:
+        self._writer.write(json.dumps(message).encode("utf-8") + b"\n")
+        await self._writer.drain()
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        while line := await self._reader.readline():
+            if line.strip():
+                yield json.loads(line)
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+class WebSocketTransport:
+    """Kalshi WebSocket transport; requires the optional ``websockets`` package."""
+
+    def __init__(self, connection: Any) -> None:
+        self._connection = connection
+
+    @classmethod
+    async def connect(cls, url: str, headers: dict[str, str] | None = None) -> "WebSocketTransport":
+        try:
+            import websockets
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("Install the 'websockets' package to stream orderbooks from Kalshi.") from exc
+        return cls(await websockets.connect(url, additional_headers=headers or {}))
+
+    async def send(self, message: dict[str, Any]) -> None:
+        await self._connection.send(json.dumps(message))
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        async for raw in self._connection:
+            yield json.loads(raw)
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+
+class OrderbookReplayServer:
+    """Replay recorded JSON-lines sessions: the n-th subscribe streams the n-th file."""
+
+    def __init__(self, sessions: list[str | Path], host: str = "127.0.0.1", port: int = 0) -> None:
+        self.sessions = [Path(path) for path in sessions]
+        self.host = host
+        self.port = port
+        self.commands: list[dict[str, Any]] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    async def __aenter__(self) -> "OrderbookReplayServer":
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending = list(self.sessions)
+        while line := await reader.readline():
+            command = json.loads(line)
+            self.commands.append(command)
+            if command.get("cmd") != "subscribe":
+                continue
+            if pending:
+                writer.write(pending.pop(0).read_bytes())
+                await writer.drain()
+            if not pending:
+                # Every recorded session has been sent; end the stream.
+                break
+        writer.close()
+        await writer.wait_closed()
+
+
+async def stream_orderbooks(cache: SnapshotCache, tickers: list[str], url: str | None = None) -> StreamStats:
+    """Consume the exchange orderbook channel for ``tickers`` until the socket closes."""
+    from Phase_E.live_connector import KalshiLiveConnector
+
+    url = url or Config.KALSHI_WS_URL
+    headers = KalshiLiveConnector()._headers("GET", "/trade-api/ws/v2")
+    headers.pop("Content-Type", None)
+    transport = await WebSocketTransport.connect(url, headers)
+    consumer = OrderbookStreamConsumer(cache)
+    try:
+        await consumer.run(transport, tickers)
+    finally:
+        await transport.close()
+    return consumer.stats
+
+
+def _price_index(price: int) -> int:
+    price = int(price)
+    if not 1 <= price < PRICE_LEVELS:
+        raise ValueError(f"Orderbook price out of range: {price}")
+    return price
@@ -152,6 +152,8 @@ def test_health_endpoint():
     assert payload["status"] == "ok"
     assert "uptime_seconds" in payload
     assert "restart_recommended" in payload
+    assert {"hits", "misses", "size", "max_size"} <= set(payload["stress_cache"])
+    assert payload["audit_writer"]["mode"] in {"sync", "async"}
 
 
 def test_logs_endpoint_returns_audit_events():
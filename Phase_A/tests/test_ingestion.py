@@ -0,0 +1,109 @@
+"""Market-data ingestion service and snapshot cache tests."""
+import time
+
+from Phase_A import api
+from Phase_A.data_fetcher import fetch_price_snapshots
+from Phase_A.ingestion import MarketDataIngestionService, SnapshotCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now_ms = 1_700_000_000_000
+
+    def __call__(self) -> int:
+        return self.now_ms
+
+
+def test_snapshot_cache_versions_and_staleness():
+    clock = _Clock()
+    cache = SnapshotCache(stale_after_seconds=30, clock_ms=clock)
+    assert cache.freshness()["stale"] is True
+
+    view = cache.publish(fetch_price_snapshots(), "mock")
+    assert view.version == 1
+    assert cache.get("FED-RATE-25MAR").yes_ask == 74
+    assert cache.freshness()["stale"] is False
+
+    clock.now_ms += 31_000
+    freshness = cache.freshness()
+    assert freshness["age_seconds"] == 31.0
+    assert freshness["stale"] is True
+    assert cache.publish(fetch_price_snapshots(), "mock").version == 2
+
+
+def test_failed_refresh_keeps_previous_view():
+    cache = SnapshotCache()
+    calls = {"count": 0}
+
+    def flaky_source():
+        calls["count"] += 1
+        if calls["count"] > 1:
+            raise ConnectionError("upstream down")
+        return fetch_price_snapshots()
+
+    service = MarketDataIngestionService(cache, source=flaky_source, source_name="mock")
+    first = service.refresh_now()
+    second = service.refresh_now()
+
+    assert second is first
+    assert cache.freshness()["last_error"] == "ConnectionError: upstream down"
+    assert cache.consecutive_failures == 1
+
+
+def test_runtime_error_from_source_is_recorded_and_loop_survives():
+    cache = SnapshotCache()
+
+    def broken_source():
+        raise RuntimeError("connector bug")
+
+    service = MarketDataIngestionService(cache, source=broken_source, source_name="demo", interval_seconds=0.01)
+    service.start()
+    deadline = time.monotonic() + 2
+    while cache.consecutive_failures < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    alive = service._thread.is_alive()
+    service.stop()
+
+    assert alive
+    assert cache.consecutive_failures >= 3
+    assert cache.freshness()["last_error"] == "RuntimeError: connector bug"
+
+
+def test_exchange_source_outage_keeps_last_view_instead_of_mocks():
+    from Phase_D.demo_connector import DemoKalshiConnector
+    from Shared.http_client import PooledHttpClient
+
+    cache = SnapshotCache()
+    good = cache.publish(fetch_price_snapshots(), "live")
+    connector = DemoKalshiConnector(client=PooledHttpClient("http://127.0.0.1:9", max_retries=0), mock_fallback=False)
+    service = MarketDataIngestionService(
+        cache, source=lambda: connector.fetch_market_snapshots(status="open"), source_name="live"
+    )
+
+    assert service.refresh_now() is good
+    assert cache.consecutive_failures == 1
+    assert cache.freshness()["last_error"].startswith("ConnectionError")
+    connector.close()
+
+
+def test_background_loop_refreshes_on_cadence():
+    cache = SnapshotCache()
+    service = MarketDataIngestionService(cache, source=fetch_price_snapshots, source_name="mock", interval_seconds=0.01)
+    service.start()
+    deadline = time.monotonic() + 2
+    while cache.view().version < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    service.stop()
+
+    assert cache.view().version >= 3
+
+
+def test_routes_report_data_freshness():
+    client = api.app.test_client()
+    payload = client.get("/risk_assessment/FED-RATE-25MAR").get_json()
+    assert payload["data_freshness"]["version"] >= 1
+    assert payload["data_freshness"]["source"] == "mock"
+
+    missing = client.get("/risk_assessment/UNKNOWN")
+    assert missing.status_code == 404
+    assert "data_freshness" in missing.get_json()
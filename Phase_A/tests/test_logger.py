@@ -0,0 +1,180 @@
+"""Phase A SQLite schema migrations, read plans, and the batched log writer."""
+import sqlite3
+
+import pytest
+
+from Phase_A.logger import LogWriter, connect_reader, init_db, iter_snapshot_rows, log_snapshots, snapshot_tables
+from Shared.models import EVSignal, PriceSnapshot
+from Shared.snapshot_store import ColumnarSnapshotStore
+from Shared.time_utils import epoch_ms_to_iso, iso_to_epoch_ms
+
+
+def _legacy_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE price_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT, timestamp TEXT, "
+        "yes_bid REAL, yes_ask REAL, no_bid REAL, no_ask REAL, volume INTEGER, open_interest INTEGER)"
+    )
+    conn.executemany(
+        "INSERT INTO price_snapshots (ticker, timestamp, yes_bid, yes_ask, no_bid, no_ask) VALUES (?, ?, 40, 42, 56, 58)",
+        [("A", "2026-02-15T12:00:00.250Z"), ("A", "2026-02-15T07:00:00-05:00"), ("B", "2026-02-15T12:00:01")],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _plan(conn, sql, params=()):
+    return " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+def _snapshot(ticker, iso):
+    return PriceSnapshot(ticker, iso, 40, 42, 56, 58, volume=10)
+
+
+def test_init_db_migrates_legacy_text_timestamps(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    _legacy_db(db_path)
+
+    assert init_db(db_path) == [1, 2, 3]
+    assert init_db(db_path) == []
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT timestamp, timestamp_ms FROM price_snapshots ORDER BY id").fetchall()
+    assert [ms for _, ms in rows] == [iso_to_epoch_ms(text) for text, _ in rows]
+
+    # Writers that only know the text column are still filled in by the trigger.
+    conn.execute("INSERT INTO price_snapshots (ticker, timestamp) VALUES ('C', '2026-02-16T00:00:00Z')")
+    assert conn.execute("SELECT timestamp_ms FROM price_snapshots WHERE ticker = 'C'").fetchone()[0] == iso_to_epoch_ms(
+        "2026-02-16T00:00:00Z"
+    )
+
+    plan = _plan(conn, "SELECT id FROM price_snapshots WHERE timestamp_ms >= ? ORDER BY timestamp_ms, id", (0,))
+    conn.close()
+    assert "idx_price_snapshots_ts" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_retrain_and_governance_reads_are_index_only(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    init_db(db_path)
+    conn = sqlite3.connect(db_path)
+
+    retrain = _plan(
+        conn,
+        "SELECT id, ticker, yes_bid, yes_ask, volume, timestamp_ms FROM price_snapshots WHERE id > ? "
+        "ORDER BY ticker, timestamp_ms ASC",
+        (0,),
+    )
+    governance = _plan(
+        conn, "SELECT side, confidence, ev_percent FROM trade_signals WHERE side IS NOT 'HOLD' ORDER BY id ASC"
+    )
+    conn.close()
+
+    assert "COVERING INDEX idx_price_snapshots_retrain" in retrain
+    assert "COVERING INDEX idx_trade_signals_review" in governance
+    assert "TEMP B-TREE" not in retrain + governance
+
+
+def test_log_writer_writes_signals_through_and_batches_snapshots(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    writer = LogWriter(db_path, batch_size=3, flush_interval_seconds=60)
+    writer.add_snapshots([_snapshot("A", "2026-02-15T12:00:00Z")])
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 0
+    writer.add_signal(EVSignal(ticker="A", ev_percent=1.5, confidence=0.98, explanation="x", side="BUY_YES"))
+    assert conn.execute("SELECT timestamp_ms FROM trade_signals").fetchone()[0] is not None
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 1  # committed with the signal
+
+    writer.add_snapshots([_snapshot("A", "2026-02-15T12:00:01Z"), _snapshot("A", "2026-02-15T12:00:02Z")])
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 1
+    writer.add_snapshots([_snapshot("A", "2026-02-15T12:00:03Z")])  # third pending row reaches the batch size
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 4
+    conn.close()
+    writer.close()
+
+
+def test_log_snapshots_is_visible_to_readers(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    snapshot = PriceSnapshot("A", "2026-02-15T12:00:00Z", 40, 42, 56, 58, timestamp_ms=1_771_156_800_000)
+
+    log_snapshots([snapshot], db_path=db_path)
+
+    conn = connect_reader(db_path)  # flushes the pooled writer first
+    assert conn.execute("SELECT timestamp_ms FROM price_snapshots").fetchone()[0] == 1_771_156_800_000
+    conn.close()
+
+
+def test_log_snapshots_drops_late_ticks_from_store_but_keeps_them_in_sqlite(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    store = ColumnarSnapshotStore(tmp_path / "store")
+    log_snapshots([_snapshot("A", "2026-02-15T12:00:05Z")], store=store, db_path=db_path)
+
+    late = [_snapshot("A", "2026-02-15T12:00:09Z"), _snapshot("A", "2026-02-15T12:00:01Z"), _snapshot("A", "")]
+    log_snapshots(late, store=store, db_path=db_path)
+
+    assert store.read("A").timestamp_ms.tolist() == [
+        iso_to_epoch_ms("2026-02-15T12:00:05Z"),
+        iso_to_epoch_ms("2026-02-15T12:00:09Z"),
+    ]
+    conn = connect_reader(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 4
+    conn.close()
+    with pytest.raises(ValueError, match="must not precede stored rows"):
+        store.append([_snapshot("A", "2026-02-15T12:00:01Z")])
+
+
+def test_monthly_partitions_share_ids_and_merge_in_order(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    base = iso_to_epoch_ms("2026-01-31T23:00:00Z")
+    snapshots = [_snapshot(ticker, epoch_ms_to_iso(base + hour * 3_600_000)) for hour in range(4) for ticker in "BA"]
+    writer = LogWriter(db_path, batch_size=1000, partitioning="monthly")
+    writer.add_snapshots(snapshots[:1])
+    writer.flush()
+    writer.partitioning = "none"  # a later unpartitioned write must not reuse partition ids
+    writer.add_snapshots([_snapshot("C", "2026-03-01T00:00:00Z")])
+    writer.flush()
+    writer.partitioning = "monthly"
+    writer.add_snapshots(snapshots[1:])
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert snapshot_tables(conn) == ["price_snapshots", "price_snapshots_202601", "price_snapshots_202602"]
+    ids = [row[0] for row in conn.execute("SELECT id FROM price_snapshots_all")]
+    assert len(ids) == len(set(ids)) == 9
+
+    merged = list(
+        iter_snapshot_rows(
+            conn,
+            "SELECT id, ticker, timestamp_ms FROM {table} ORDER BY ticker, timestamp_ms",
+            (),
+            key=lambda row: (row[1], row[2]),
+        )
+    )
+    conn.close()
+    assert [(row[1], row[2]) for row in merged] == sorted((row[1], row[2]) for row in merged)
+    assert [row[1] for row in merged] == ["A"] * 4 + ["B"] * 4 + ["C"]
+
+
+def test_merge_orders_untimed_base_rows_before_timed_partition_rows(tmp_path):
+    db_path = str(tmp_path / "kalshi.db")
+    writer = LogWriter(db_path, batch_size=1000, partitioning="monthly")
+    writer.add_snapshots(
+        [_snapshot("A", "2026-02-15T12:00:00Z"), _snapshot("A", ""), _snapshot("A", "2026-03-01T00:00:00Z")]
+    )
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert snapshot_tables(conn) == ["price_snapshots", "price_snapshots_202602", "price_snapshots_202603"]
+    merged = list(
+        iter_snapshot_rows(
+            conn,
+            "SELECT id, ticker, timestamp_ms FROM {table} ORDER BY ticker, timestamp_ms",
+            (),
+            key=lambda row: (row[1], row[2]),
+        )
+    )
+    conn.close()
+    assert [row[2] for row in merged] == [
+        None, iso_to_epoch_ms("2026-02-15T12:00:00Z"), iso_to_epoch_ms("2026-03-01T00:00:00Z")
+    ]
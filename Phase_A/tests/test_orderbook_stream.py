@@ -0,0 +1,115 @@
+"""Orderbook stream consumer tests against the local replay server."""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from Phase_A.ingestion import SnapshotCache
+from Phase_A.orderbook_stream import JsonLinesTransport, OrderBook, OrderbookReplayServer, OrderbookStreamConsumer
+from Shared.models import PriceSnapshot
+
+DATA = Path(__file__).parent / "data"
+
+
+async def _replay(consumer: OrderbookStreamConsumer, sessions: list[str], tickers: list[str]) -> OrderbookReplayServer:
+    async with OrderbookReplayServer([DATA / name for name in sessions]) as server:
+        transport = await JsonLinesTransport.connect(server.host, server.port)
+        await asyncio.wait_for(consumer.run(transport, tickers), timeout=5)
+        await transport.close()
+    return server
+
+
+def test_order_book_top_of_book_from_bid_arrays():
+    book = OrderBook("T")
+    book.apply_snapshot(yes=[[40, 5], [42, 1]], no=[[55, 3]], sid=1)
+    assert book.top_of_book() == (42.0, 45.0, 55.0, 58.0)
+
+    assert book.apply_delta("yes", 42, -1)
+    assert book.top_of_book() == (40.0, 45.0, 55.0, 60.0)
+    assert not book.apply_delta("no", 55, -4)
+    assert book.valid is False
+    with pytest.raises(ValueError):
+        book.apply_delta("yes", 100, 1)
+
+
+def test_replayed_deltas_publish_top_of_book_into_cache():
+    cache = SnapshotCache()
+    cache.publish(
+        [PriceSnapshot("FED-RATE-25MAR", "2026-02-15T12:00:00Z", 72, 74, 26, 28, volume=45000, open_interest=820000)],
+        "mock",
+    )
+    consumer = OrderbookStreamConsumer(cache, publish_interval_ms=0)
+    asyncio.run(_replay(consumer, ["orderbook_session.jsonl"], ["FED-RATE-25MAR", "WEATHER-NYC-SNOW"]))
+
+    fed = cache.get("FED-RATE-25MAR")
+    assert (fed.yes_bid, fed.yes_ask, fed.no_bid, fed.no_ask) == (73.0, 76.0, 24.0, 27.0)
+    assert fed.volume == 45000
+    weather = cache.get("WEATHER-NYC-SNOW")
+    assert (weather.yes_bid, weather.yes_ask) == (36.0, 38.0)
+    assert cache.view().source == "orderbook_stream"
+    assert consumer.stats.snapshots == 2
+    assert consumer.stats.deltas == 3
+    assert consumer.stats.gaps == 0
+
+
+def test_sequence_gap_triggers_resubscribe_and_resync():
+    cache = SnapshotCache()
+    consumer = OrderbookStreamConsumer(cache, publish_interval_ms=0)
+    server = asyncio.run(_replay(consumer, ["orderbook_gap.jsonl", "orderbook_resync.jsonl"], ["FED-RATE-25MAR"]))
+
+    assert consumer.stats.gaps == 1
+    assert consumer.stats.resyncs == 1
+    assert consumer.stats.dropped_deltas == 1
+    assert [command["cmd"] for command in server.commands] == ["subscribe", "unsubscribe", "subscribe"]
+    assert server.commands[1]["params"]["sids"] == [1]
+    assert server.commands[2]["params"]["market_tickers"] == ["FED-RATE-25MAR"]
+
+    fed = cache.get("FED-RATE-25MAR")
+    # Rebuilt from the fresh snapshot; deltas after the gap on the old sid were ignored.
+    assert (fed.yes_bid, fed.yes_ask, fed.no_bid, fed.no_ask) == (74.0, 75.0, 25.0, 26.0)
+
+
+def _snapshot(sid, seq, yes, no, ticker="FED-RATE-25MAR"):
+    return {"type": "orderbook_snapshot", "sid": sid, "seq": seq, "msg": {"market_ticker": ticker, "yes": yes, "no": no}}
+
+
+def _delta(sid, seq, price, delta, side="yes", ticker="FED-RATE-25MAR"):
+    return {
+        "type": "orderbook_delta",
+        "sid": sid,
+        "seq": seq,
+        "msg": {"market_ticker": ticker, "price": price, "delta": delta, "side": side},
+    }
+
+
+def test_late_deltas_from_replaced_sid_are_not_applied_to_new_snapshot():
+    consumer = OrderbookStreamConsumer(SnapshotCache(), publish_interval_ms=0)
+    consumer.handle(_snapshot(1, 1, [[72, 50]], [[26, 40]]))
+    assert consumer.handle(_delta(1, 3, 73, 5)) == {"FED-RATE-25MAR"}
+    assert consumer.unsubscribe_command(consumer._unsubscribe)["params"] == {"sids": [1]}
+
+    consumer.handle(_snapshot(2, 1, [[74, 15]], [[25, 60]]))
+    # Stragglers from sid 1 arrive after the new snapshot; neither restarts seq tracking nor mutates the book.
+    assert consumer.handle(_delta(1, 4, 90, 100)) == set()
+    assert consumer.handle(_snapshot(1, 5, [[10, 1]], [[10, 1]])) == set()
+    assert consumer.handle(_delta(2, 2, 74, 5)) == set()
+
+    book = consumer.books["FED-RATE-25MAR"]
+    assert book.sid == 2 and book.valid
+    assert book.top_of_book() == (74.0, 75.0, 25.0, 26.0)
+    assert book.levels[0, 74] == 20 and book.levels[0, 90] == 0
+    assert consumer.stats.dropped_deltas == 1
+
+
+def test_out_of_range_price_resyncs_instead_of_raising():
+    consumer = OrderbookStreamConsumer(SnapshotCache(), publish_interval_ms=0)
+    consumer.handle(_snapshot(1, 1, [[72, 50]], [[26, 40]]))
+    consumer.handle(_snapshot(1, 2, [[40, 5]], [[55, 5]], ticker="WEATHER-NYC-SNOW"))
+
+    assert consumer.handle(_delta(1, 3, 100, 1)) == {"FED-RATE-25MAR", "WEATHER-NYC-SNOW"}
+    assert consumer.stats.gaps == 1
+    assert not consumer.books["FED-RATE-25MAR"].valid
+
+    assert consumer.handle(_snapshot(2, 1, [[0, 5]], [[26, 40]])) == {"FED-RATE-25MAR"}
+    assert consumer.stats.gaps == 2
+    assert not consumer.books["FED-RATE-25MAR"].valid
@@ -1,5 +1,5 @@
 """Phase B analysis engine package."""
 
-from Phase_B.analysis_engine import PhaseBAnalysisEngine, AnalysisResult
+from Phase_B.analysis_engine import PhaseBAnalysisEngine, AnalysisResult, BatchAnalysis
 
-__all__ = ["PhaseBAnalysisEngine", "AnalysisResult"]
+__all__ = ["PhaseBAnalysisEngine", "AnalysisResult", "BatchAnalysis"]
@@ -2,13 +2,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Sequence
 
-from Phase_B.edge_detector import EdgeDecision, EdgeDetector
-from Phase_B.external_data import ExternalDataProvider
-from Phase_B.probability_engine import ProbabilityEngine, ProbabilityEstimate
-from Phase_C.imessage_proposal import REGISTRY, TradeProposal, log_trade_proposal
+import numpy as np
+
+from Phase_B.edge_detector import EdgeBatch, EdgeDecision, EdgeDetector
+from Phase_B.external_data import AnchorAggregate, ExternalDataProvider
+from Phase_B.probability_engine import ProbabilityBatch, ProbabilityEngine, ProbabilityEstimate
+from Phase_C.imessage_proposal import REGISTRY, TradeProposal, format_trade_proposal, log_trade_proposal
 from Phase_C.risk_gateway import RiskAssessment, RiskDecision, RiskGateway
+from Shared.config import Config, StrategyParameters
 from Shared.models import EVSignal, PriceSnapshot
+from Shared.snapshot_batch import SnapshotBatch
+
+ANALYSIS_MODES = ("full", "gate_first", "diagnostics")
 
 
 @dataclass(frozen=True)
@@ -27,15 +35,47 @@ class PaperTradeProposal:
 
 @dataclass(frozen=True)
 class AnalysisResult:
-    """Full analysis payload for API and logging."""
+    """Full analysis payload for API and logging.
 
-    signal: EVSignal
+    ``explanation``, ``signal`` and ``proposal_preview`` are rendered on first access,
+    so scans and backtests that never read them skip the formatting. Reading them
+    has no side effects; callers that publish a proposal log it themselves.
+    """
+
+    snapshot: PriceSnapshot
     probability_estimate: ProbabilityEstimate
     edge_decision: EdgeDecision
+    confidence: float
     external_payload: dict
     risk_assessment: RiskAssessment
     paper_trade_proposal: PaperTradeProposal
-    proposal_preview: str
+    mode: str = "full"
+    stages: tuple[str, ...] = ()
+
+    @property
+    def ticker(self) -> str:
+        return self.snapshot.ticker
+
+    @cached_property
+    def explanation(self) -> str:
+        return PhaseBAnalysisEngine._build_explanation(
+            self.snapshot, self.probability_estimate, self.edge_decision, self.external_payload, self.risk_assessment
+        )
+
+    @cached_property
+    def signal(self) -> EVSignal:
+        return EVSignal(
+            ticker=self.snapshot.ticker,
+            ev_percent=round(self.edge_decision.ev_percent, 2),
+            confidence=round(self.confidence, 4),
+            explanation=self.explanation,
+            data_sources=[s["name"] for s in self.external_payload["sources"]],
+            side=self.edge_decision.side,
+        )
+
+    @cached_property
+    def proposal_preview(self) -> str:
+        return format_trade_proposal(self, self.risk_assessment)
 
 
 @dataclass(frozen=True)
@@ -47,75 +87,163 @@ class ProposalResult:
     proposal: TradeProposal | None
 
 
+@dataclass(frozen=True)
+class BatchAnalysis:
+    """Universe-scan output: probability/EV columns for every snapshot, full results for survivors."""
+
+    probabilities: ProbabilityBatch
+    edges: EdgeBatch
+    results: list[AnalysisResult]
+
+    @property
+    def yes_ev_percent(self) -> np.ndarray:
+        return self.edges.yes_ev_percent
+
+    @property
+    def no_ev_percent(self) -> np.ndarray:
+        return self.edges.no_ev_percent
+
+    @property
+    def tickers(self) -> list[str]:
+        return self.probabilities.tickers
+
+
 class PhaseBAnalysisEngine:
-    """High-level engine that computes edge and explanation for one market snapshot."""
+    """High-level engine that computes edge and explanation for one market snapshot.
+
+    ``mode`` controls how much risk work runs per snapshot:
+
+    - ``full``: stress-test every snapshot and risk-check its paper trade.
+    - ``gate_first``: skip the stress test and trade risk check for HOLD decisions.
+    - ``diagnostics``: never stress-test; sizing and fail-safes still run so the
+      explanation is complete, but nothing is approved.
+
+    ``params`` overrides the edge and sizing thresholds in ``Config``. Passing an
+    ``upstream_cache`` dict memoizes anchors, probability and confidence per
+    snapshot; those do not depend on ``params``, so engines in a parameter sweep
+    can share one cache while anchor data is held fixed.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        mode: str | None = None,
+        params: StrategyParameters | None = None,
+        upstream_cache: dict | None = None,
+    ) -> None:
+        self.mode = _validate_mode(mode or Config.ANALYSIS_MODE)
         self.external_data = ExternalDataProvider()
         self.probability_engine = ProbabilityEngine()
-        self.edge_detector = EdgeDetector()
-        self.risk_gateway = RiskGateway()
+        self.edge_detector = EdgeDetector(params)
+        self.risk_gateway = RiskGateway(params=params)
+        self.upstream_cache = upstream_cache
 
-    def analyze_snapshot(self, snapshot: PriceSnapshot) -> AnalysisResult:
-        anchors = self.external_data.get_probability_anchors(snapshot.ticker)
-        external_payload = self.external_data.get_source_payload(snapshot.ticker)
-        estimate = self.probability_engine.estimate_yes_probability(snapshot, anchors)
-        confidence = self.probability_engine.aggregate_confidence(estimate, anchors)
+    def analyze_snapshot(self, snapshot: PriceSnapshot, mode: str | None = None) -> AnalysisResult:
+        mode = _validate_mode(mode or self.mode)
+        anchors, estimate, confidence = self._upstream(snapshot)
+        external_payload = anchors.payload
         decision = self.edge_detector.evaluate(snapshot, estimate, confidence)
-        risk_assessment = self.risk_gateway.assess_snapshot(snapshot, decision.side, estimate.ensemble_yes)
+        stages = ["probability", "edge"]
+
+        run_risk = mode == "full" or (mode == "gate_first" and decision.side in {"YES", "NO"})
+        risk_assessment = self.risk_gateway.assess_snapshot(
+            snapshot, decision.side, estimate.ensemble_yes, run_stress=run_risk
+        )
+        stages.append("risk_assessment")
+        if run_risk:
+            stages.append("stress_test")
+
         paper_side, generation_mode = self._select_paper_side(decision, estimate)
         entry_price = snapshot.yes_ask if paper_side == "YES" else snapshot.no_ask
         adjusted_probability = estimate.ensemble_yes if paper_side == "YES" else (1 - estimate.ensemble_yes)
-        risk_decision = self.risk_gateway.assess_trade(
-            bankroll_tracker=self.risk_gateway.tracker,
-            probability_yes=adjusted_probability,
-            entry_price_cents=entry_price,
-            active_exposure=self.risk_gateway.tracker.open_exposure,
-            trials=1000,
-        )
+        if run_risk:
+            reuses = self.risk_gateway.stress_reuses
+            risk_decision = self.risk_gateway.assess_trade(
+                bankroll_tracker=self.risk_gateway.tracker,
+                probability_yes=adjusted_probability,
+                entry_price_cents=entry_price,
+                active_exposure=self.risk_gateway.tracker.open_exposure,
+                trials=Config.MONTE_CARLO_SIMS,
+            )
+            stages.append("trade_risk")
+            if self.risk_gateway.stress_reuses > reuses:
+                stages.append("stress_reused")
+            approved, stake, reasons = (
+                risk_decision.approved,
+                risk_decision.proposed_stake,
+                risk_decision.fail_safe_reasons,
+            )
+        else:
+            approved, stake, reasons = False, 0.0, [f"risk_skipped_{mode}"]
+
         paper_trade_proposal = PaperTradeProposal(
             ticker=snapshot.ticker,
             side=paper_side,
             entry_price_cents=entry_price,
             probability_yes=adjusted_probability,
-            approved_by_risk=risk_decision.approved,
-            proposed_stake=risk_decision.proposed_stake,
-            risk_reasons=risk_decision.fail_safe_reasons,
+            approved_by_risk=approved,
+            proposed_stake=stake,
+            risk_reasons=reasons,
             generation_mode=generation_mode,
         )
-        explanation = self._build_explanation(snapshot, estimate, decision, external_payload, risk_assessment)
-
-        signal = EVSignal(
-            ticker=snapshot.ticker,
-            ev_percent=round(decision.ev_percent, 2),
-            confidence=round(confidence, 4),
-            explanation=explanation,
-            data_sources=[s["name"] for s in external_payload["sources"]],
-            side=decision.side,
-        )
-        final_result = AnalysisResult(
-            signal=signal,
-            probability_estimate=estimate,
-            edge_decision=decision,
-            external_payload=external_payload,
-            risk_assessment=risk_assessment,
-            paper_trade_proposal=paper_trade_proposal,
-            proposal_preview="",
-        )
-        proposal_preview = log_trade_proposal(final_result, risk_assessment)
         return AnalysisResult(
-            signal=signal,
+            snapshot=snapshot,
             probability_estimate=estimate,
             edge_decision=decision,
+            confidence=confidence,
             external_payload=external_payload,
             risk_assessment=risk_assessment,
             paper_trade_proposal=paper_trade_proposal,
-            proposal_preview=proposal_preview,
+            mode=mode,
+            stages=tuple(stages),
         )
 
+    def _upstream(self, snapshot: PriceSnapshot) -> tuple[AnchorAggregate, ProbabilityEstimate, float]:
+        """Anchors, probability estimate and confidence: the parameter-independent work."""
+        key = (
+            (snapshot.ticker, snapshot.timestamp, snapshot.yes_bid, snapshot.yes_ask, snapshot.no_bid, snapshot.no_ask,
+             snapshot.volume, snapshot.open_interest)
+            if self.upstream_cache is not None
+            else None
+        )
+        if key is not None and key in self.upstream_cache:
+            return self.upstream_cache[key]
+        anchors = self.external_data.get_anchor_aggregate(snapshot.ticker)
+        estimate = self.probability_engine.estimate_yes_probability(snapshot, anchors)
+        confidence = self.probability_engine.aggregate_confidence(estimate, anchors)
+        if key is not None:
+            self.upstream_cache[key] = (anchors, estimate, confidence)
+        return anchors, estimate, confidence
+
+    def analyze_many(
+        self, snapshots: SnapshotBatch | Sequence[PriceSnapshot], mode: str | None = None
+    ) -> BatchAnalysis:
+        """Scan a snapshot universe in one vectorized pass.
+
+        Probabilities, EV, every confirmation rule and every `EdgeDetector` gate are
+        computed as arrays for all snapshots; only tickers that clear every gate are
+        materialized as full `AnalysisResult` objects.
+        """
+        if not isinstance(snapshots, (SnapshotBatch, Sequence)):
+            snapshots = list(snapshots)
+        batch = SnapshotBatch.coerce(snapshots)
+        anchors_by_ticker = {ticker: self.external_data.get_anchor_aggregate(ticker) for ticker in batch.symbols}
+        probabilities = self.probability_engine.estimate_batch(batch, anchors_by_ticker)
+        edges = self.edge_detector.evaluate_batch(
+            yes_ask=batch.yes_ask,
+            yes_bid=batch.yes_bid,
+            no_ask=batch.no_ask,
+            volume=batch.volume.astype(float),
+            probabilities=probabilities,
+        )
+        # Survivors keep the caller's snapshot objects (original timestamp text) when given a list.
+        materialize = batch.snapshot_at if snapshots is batch else snapshots.__getitem__
+        results = [self.analyze_snapshot(materialize(index), mode) for index in edges.survivor_indices]
+        return BatchAnalysis(probabilities=probabilities, edges=edges, results=results)
+
     def propose_trade(self, snapshot: PriceSnapshot) -> ProposalResult:
         """Analyze, risk-check, and (if approved by risk) send human approval proposal."""
         analysis = self.analyze_snapshot(snapshot)
+        log_trade_proposal(analysis, analysis.risk_assessment)
         risk = self.risk_gateway.assess(analysis.signal, snapshot)
         proposal = REGISTRY.create_and_send(analysis.signal, snapshot, risk) if risk.approved else None
         return ProposalResult(analysis=analysis, risk=risk, proposal=proposal)
@@ -143,6 +271,11 @@ class PhaseBAnalysisEngine:
     ) -> str:
         source_names = ", ".join(s["name"] for s in external_payload["sources"])
         stress = risk_assessment.stress_test
+        stress_line = (
+            f"- Stress ruin probability: {stress.ruin_probability:.2%} (n={stress.simulations})\n"
+            if stress.ran
+            else "- Stress test: skipped\n"
+        )
         return (
             f"Phase B+C Analysis for {snapshot.ticker}\n"
             f"- Market implied YES: {estimate.market_implied_yes:.1%}\n"
@@ -155,8 +288,14 @@ class PhaseBAnalysisEngine:
             f"- Side: {decision.side} | EV: {decision.ev_percent:.2f}%\n"
             f"- Proposed risk: ${risk_assessment.sizing.recommended_risk:.2f} "
             f"(Kelly={risk_assessment.sizing.kelly_fraction_applied:.4f})\n"
-            f"- Stress ruin probability: {stress.ruin_probability:.2%} (n={stress.simulations})\n"
+            f"{stress_line}"
             f"- Fail-safe approved: {risk_assessment.fail_safe_report.approved} | "
             f"Blockers: {', '.join(risk_assessment.blockers) or 'none'}\n"
             f"- Sources: {source_names}"
         )
+
+
+def _validate_mode(mode: str) -> str:
+    if mode not in ANALYSIS_MODES:
+        raise ValueError(f"Unknown analysis mode: {mode}")
+    return mode
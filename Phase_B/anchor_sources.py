@@ -0,0 +1,206 @@
+"""Pluggable external anchor sources with per-source TTL and stale-while-revalidate.
+
+Each :class:`AnchorAdapter` declares how often its data should be refreshed.
+:class:`AnchorSourceRegistry` fetches due sources concurrently on a small thread
+pool and keeps the last good result per source. Readers never wait on an
+upstream: stale data keeps being served while a background refresh runs, and a
+failed refresh leaves the previous result in place until the next attempt.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+from threading import Lock
+import time
+from typing import Callable, Protocol, Sequence
+
+from Phase_B.external_data import ExternalAnchor
+from Shared.config import Config
+
+logger = logging.getLogger(__name__)
+
+AnchorsByTicker = dict[str, list[ExternalAnchor]]
+RefreshListener = Callable[[str, AnchorsByTicker, AnchorsByTicker], None]
+
+
+class AnchorAdapter(Protocol):
+    """One upstream feed (CME, FRED, NOAA, ...) normalized to :class:`ExternalAnchor`."""
+
+    name: str
+    refresh_interval_seconds: float
+
+    def fetch(self) -> AnchorsByTicker: ...
+
+
+@dataclass
+class JsonFileAnchorAdapter:
+    """File-backed stand-in adapter: ``{ticker: [{probability_yes, confidence, context}]}``.
+
+    ``delay_seconds`` simulates a slow upstream.
+    """
+
+    name: str
+    path: Path
+    refresh_interval_seconds: float = 300.0
+    delay_seconds: float = 0.0
+
+    def fetch(self) -> AnchorsByTicker:
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        payload = json.loads(Path(self.path).read_text(encoding="utf-8"))
+        return {
+            ticker: [
+                ExternalAnchor(
+                    source=self.name,
+                    probability_yes=float(row["probability_yes"]),
+                    confidence=float(row["confidence"]),
+                    context=str(row.get("context", "")),
+                )
+                for row in rows
+            ]
+            for ticker, rows in payload.items()
+        }
+
+
+@dataclass(frozen=True)
+class SourceStatus:
+    """Cache state for one adapter, for health reporting."""
+
+    name: str
+    fetched_at: float | None
+    age_seconds: float | None
+    stale: bool
+    refreshing: bool
+    ticker_count: int
+    last_error: str | None
+
+
+@dataclass
+class _SourceEntry:
+    adapter: AnchorAdapter
+    anchors: AnchorsByTicker
+    fetched_at: float | None = None
+    next_due: float = 0.0
+    future: Future | None = None
+    last_error: str | None = None
+
+
+class AnchorSourceRegistry:
+    """Concurrent, TTL-cached fetches for a set of anchor adapters."""
+
+    def __init__(
+        self,
+        adapters: Sequence[AnchorAdapter],
+        max_workers: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        names = [adapter.name for adapter in adapters]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate anchor source names: {names}")
+        self._entries = {adapter.name: _SourceEntry(adapter=adapter, anchors={}) for adapter in adapters}
+        self._clock = clock
+        self._lock = Lock()
+        self._listeners: list[RefreshListener] = []
+        self._next_due = 0.0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers or Config.ANCHOR_FETCH_WORKERS, len(self._entries) or 1)),
+            thread_name_prefix="anchor-source",
+        )
+
+    @property
+    def source_names(self) -> list[str]:
+        return list(self._entries)
+
+    def subscribe(self, listener: RefreshListener) -> None:
+        """Call ``listener(source, previous, current)`` after each successful refresh."""
+        self._listeners.append(listener)
+
+    def anchors_for(self, source: str) -> AnchorsByTicker:
+        return self._entries[source].anchors
+
+    def revalidate(self) -> list[Future]:
+        """Start background refreshes for due sources; never waits on them."""
+        if self._clock() < self._next_due:
+            return []
+        return self._submit_due(force=False)
+
+    def refresh_all(self, timeout: float | None = None) -> None:
+        """Fetch every source now and wait (startup warm-up and tests)."""
+        wait(self._submit_due(force=True), timeout=timeout)
+
+    def wait_idle(self, timeout: float | None = None) -> None:
+        with self._lock:
+            pending = [entry.future for entry in self._entries.values() if entry.future is not None]
+        wait(pending, timeout=timeout)
+
+    def status(self) -> list[SourceStatus]:
+        now = self._clock()
+        with self._lock:
+            return [
+                SourceStatus(
+                    name=name,
+                    fetched_at=entry.fetched_at,
+                    age_seconds=round(now - entry.fetched_at, 3) if entry.fetched_at is not None else None,
+                    stale=entry.fetched_at is None or now - entry.fetched_at > entry.adapter.refresh_interval_seconds,
+                    refreshing=entry.future is not None,
+                    ticker_count=len(entry.anchors),
+                    last_error=entry.last_error,
+                )
+                for name, entry in self._entries.items()
+            ]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_due(self, *, force: bool) -> list[Future]:
+        now = self._clock()
+        submitted: list[Future] = []
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.future is not None:
+                    if force:
+                        submitted.append(entry.future)
+                    continue
+                if force or now >= entry.next_due:
+                    entry.future = self._executor.submit(self._refresh, entry)
+                    submitted.append(entry.future)
+            self._update_next_due()
+        return submitted
+
+    def _refresh(self, entry: _SourceEntry) -> None:
+        name = entry.adapter.name
+        try:
+            anchors = entry.adapter.fetch()
+        except Exception as exc:  # noqa: BLE001 - any upstream failure keeps the stale data
+            logger.warning("Anchor source %s refresh failed: %s", name, exc)
+            with self._lock:
+                entry.last_error = f"{type(exc).__name__}: {exc}"
+                entry.next_due = self._clock() + entry.adapter.refresh_interval_seconds
+                entry.future = None
+                self._update_next_due()
+            return
+
+        try:
+            with self._lock:
+                previous = entry.anchors
+                entry.anchors = anchors
+                entry.fetched_at = self._clock()
+                entry.next_due = entry.fetched_at + entry.adapter.refresh_interval_seconds
+                entry.last_error = None
+            for listener in self._listeners:
+                try:
+                    listener(name, previous, anchors)
+                except Exception:  # noqa: BLE001 - one bad listener must not wedge the source
+                    logger.exception("Anchor listener failed for source %s", name)
+        finally:
+            # Clear in-flight state only after listeners ran, so wait_idle() covers them.
+            with self._lock:
+                entry.future = None
+                self._update_next_due()
+
+    def _update_next_due(self) -> None:
+        idle = [entry.next_due for entry in self._entries.values() if entry.future is None]
+        self._next_due = min(idle) if idle else float("inf")
@@ -3,10 +3,28 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from Phase_B.probability_engine import ProbabilityEstimate
-from Shared.config import Config
+import numpy as np
+
+from Phase_B.probability_engine import ProbabilityBatch, ProbabilityEstimate
+from Shared.config import StrategyParameters
 from Shared.models import PriceSnapshot
 
+# Confirmation rules in reporting order; thresholds are shared by the scalar and batch paths.
+CONFIRMATION_RULES = (
+    "external_calibration_gap",
+    "bayesian_repricing",
+    "ensemble_agreement",
+    "liquidity_check",
+    "tight_spread",
+    "positive_raw_ev",
+)
+EXTERNAL_GAP_MIN = 0.03
+BAYESIAN_GAP_MIN = 0.02
+AGREEMENT_MIN = 0.88
+LIQUIDITY_MIN_VOLUME = 5_000
+TIGHT_SPREAD_MAX = 4
+RAW_EV_MIN_PERCENT = 5.0
+
 
 @dataclass(frozen=True)
 class EdgeDecision:
@@ -18,9 +36,48 @@ class EdgeDecision:
     threshold_checks: dict[str, bool]
 
 
+@dataclass(frozen=True)
+class EdgeBatch:
+    """Gate masks and EV arrays for a snapshot universe; decisions only for survivors."""
+
+    tickers: list[str]
+    yes_ev_percent: np.ndarray
+    no_ev_percent: np.ndarray
+    confirmations: dict[str, np.ndarray]
+    confirmation_count: np.ndarray
+    threshold_checks: dict[str, np.ndarray]
+    passed: np.ndarray
+    decisions: list[EdgeDecision]
+
+    @property
+    def ev_percent(self) -> np.ndarray:
+        return np.maximum(self.yes_ev_percent, self.no_ev_percent)
+
+    @property
+    def survivor_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.passed)
+
+    def decision_at(self, index: int) -> EdgeDecision:
+        """Materialize the :class:`EdgeDecision` for any row (e.g. HOLD diagnostics)."""
+        yes_ev, no_ev = float(self.yes_ev_percent[index]), float(self.no_ev_percent[index])
+        confirmations = [name for name in CONFIRMATION_RULES if self.confirmations[name][index]]
+        passed = bool(self.passed[index])
+        return EdgeDecision(
+            ticker=self.tickers[index],
+            side=("YES" if yes_ev >= no_ev else "NO") if passed else "HOLD",
+            ev_percent=max(yes_ev, no_ev),
+            confirmations=confirmations,
+            confirmation_count=len(confirmations),
+            threshold_checks={name: bool(mask[index]) for name, mask in self.threshold_checks.items()},
+        )
+
+
 class EdgeDetector:
     """Detect and validate edges with strict confirmation and EV gates."""
 
+    def __init__(self, params: StrategyParameters | None = None) -> None:
+        self.params = params
+
     def evaluate(self, snapshot: PriceSnapshot, estimate: ProbabilityEstimate, confidence: float) -> EdgeDecision:
         yes_ev_pct = self._ev_percent_yes(snapshot.yes_ask, estimate.ensemble_yes)
         no_ev_pct = self._ev_percent_no(snapshot.no_ask, estimate.ensemble_yes)
@@ -29,10 +86,11 @@ class EdgeDetector:
         ev_pct = max(yes_ev_pct, no_ev_pct)
         confirmations = self._build_confirmations(snapshot, estimate, yes_ev_pct, no_ev_pct)
 
+        params = self.params or StrategyParameters.from_config()
         threshold_checks = {
-            "min_ev": ev_pct >= (Config.MIN_EV_THRESHOLD * 100),
-            "min_confirmations": len(confirmations) >= Config.MIN_CONFIRMATIONS,
-            "min_confidence": confidence >= Config.MIN_CONFIDENCE,
+            "min_ev": ev_pct >= (params.min_ev_threshold * 100),
+            "min_confirmations": len(confirmations) >= params.min_confirmations,
+            "min_confidence": confidence >= params.min_confidence,
         }
 
         if not all(threshold_checks.values()):
@@ -47,6 +105,66 @@ class EdgeDetector:
             threshold_checks=threshold_checks,
         )
 
+    def evaluate_batch(
+        self,
+        *,
+        yes_ask: np.ndarray,
+        yes_bid: np.ndarray,
+        no_ask: np.ndarray,
+        volume: np.ndarray,
+        probabilities: ProbabilityBatch,
+        confidence: np.ndarray | None = None,
+    ) -> EdgeBatch:
+        """Vectorized :meth:`evaluate`: every rule and gate is a boolean mask over the universe."""
+        confidence = probabilities.confidence if confidence is None else confidence
+        yes_ev, no_ev = self.ev_percent_arrays(yes_ask, no_ask, probabilities.ensemble_yes)
+        ev = np.maximum(yes_ev, no_ev)
+
+        confirmations = {
+            "external_calibration_gap": np.abs(probabilities.external_yes - probabilities.market_implied_yes)
+            >= EXTERNAL_GAP_MIN,
+            "bayesian_repricing": np.abs(probabilities.bayesian_yes - probabilities.market_implied_yes)
+            >= BAYESIAN_GAP_MIN,
+            "ensemble_agreement": probabilities.model_agreement >= AGREEMENT_MIN,
+            "liquidity_check": volume >= LIQUIDITY_MIN_VOLUME,
+            "tight_spread": (yes_ask - yes_bid) <= TIGHT_SPREAD_MAX,
+            "positive_raw_ev": ev >= RAW_EV_MIN_PERCENT,
+        }
+        confirmation_count = np.sum(np.stack([confirmations[name] for name in CONFIRMATION_RULES]), axis=0)
+        params = self.params or StrategyParameters.from_config()
+        threshold_checks = {
+            "min_ev": ev >= (params.min_ev_threshold * 100),
+            "min_confirmations": confirmation_count >= params.min_confirmations,
+            "min_confidence": confidence >= params.min_confidence,
+        }
+        passed = threshold_checks["min_ev"] & threshold_checks["min_confirmations"] & threshold_checks["min_confidence"]
+
+        batch = EdgeBatch(
+            tickers=list(probabilities.tickers),
+            yes_ev_percent=yes_ev,
+            no_ev_percent=no_ev,
+            confirmations=confirmations,
+            confirmation_count=confirmation_count,
+            threshold_checks=threshold_checks,
+            passed=passed,
+            decisions=[],
+        )
+        batch.decisions.extend(batch.decision_at(int(index)) for index in np.flatnonzero(passed))
+        return batch
+
+    @staticmethod
+    def ev_percent_arrays(
+        yes_ask: np.ndarray, no_ask: np.ndarray, prob_yes: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized YES/NO EV percentages; non-positive asks score -100%."""
+        prob_no = 1 - prob_yes
+        yes_cents = (prob_yes * (100 - yes_ask)) - ((1 - prob_yes) * yes_ask)
+        no_cents = (prob_no * (100 - no_ask)) - ((1 - prob_no) * no_ask)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yes_ev = np.where(yes_ask > 0, (yes_cents / yes_ask) * 100, -100.0)
+            no_ev = np.where(no_ask > 0, (no_cents / no_ask) * 100, -100.0)
+        return yes_ev, no_ev
+
     @staticmethod
     def _ev_percent_yes(yes_ask: float, prob_yes: float) -> float:
         expected_cents = (prob_yes * (100 - yes_ask)) - ((1 - prob_yes) * yes_ask)
@@ -70,16 +188,16 @@ class EdgeDetector:
         no_ev_pct: float,
     ) -> list[str]:
         confirmations: list[str] = []
-        if abs(estimate.external_yes - estimate.market_implied_yes) >= 0.03:
+        if abs(estimate.external_yes - estimate.market_implied_yes) >= EXTERNAL_GAP_MIN:
             confirmations.append("external_calibration_gap")
-        if abs(estimate.bayesian_yes - estimate.market_implied_yes) >= 0.02:
+        if abs(estimate.bayesian_yes - estimate.market_implied_yes) >= BAYESIAN_GAP_MIN:
             confirmations.append("bayesian_repricing")
-        if estimate.model_agreement >= 0.88:
+        if estimate.model_agreement >= AGREEMENT_MIN:
             confirmations.append("ensemble_agreement")
-        if snapshot.volume >= 5_000:
+        if snapshot.volume >= LIQUIDITY_MIN_VOLUME:
             confirmations.append("liquidity_check")
-        if (snapshot.yes_ask - snapshot.yes_bid) <= 4:
+        if (snapshot.yes_ask - snapshot.yes_bid) <= TIGHT_SPREAD_MAX:
             confirmations.append("tight_spread")
-        if max(yes_ev_pct, no_ev_pct) >= 5.0:
+        if max(yes_ev_pct, no_ev_pct) >= RAW_EV_MIN_PERCENT:
             confirmations.append("positive_raw_ev")
         return confirmations
@@ -2,11 +2,24 @@
 
 This module intentionally defaults to deterministic mock anchors so the analysis engine
 can run offline and in CI without third-party dependencies.
+
+Per-ticker anchor aggregates (confidence-weighted consensus, confidence sums and the
+serialized source payload) are computed once and kept in an index, so the analysis
+hot path is a single dict lookup. Replacing a ticker's anchors drops its entry.
+
+When constructed with an :class:`~Phase_B.anchor_sources.AnchorSourceRegistry`, anchors
+come from the registered adapters instead of the mock table; lookups only nudge due
+sources to refresh in the background and never wait on them.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from statistics import fmean
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from Phase_B.anchor_sources import AnchorSourceRegistry
 
 
 @dataclass(frozen=True)
@@ -19,6 +32,50 @@ class ExternalAnchor:
     context: str
 
 
+@dataclass(frozen=True)
+class AnchorAggregate:
+    """Precomputed anchor statistics for one ticker.
+
+    ``payload`` is shared between callers and must be treated as read-only.
+    """
+
+    ticker: str
+    anchors: tuple[ExternalAnchor, ...]
+    consensus_yes: float
+    total_confidence: float
+    mean_confidence: float
+    payload: dict[str, Any]
+
+
+def aggregate_anchors(ticker: str, anchors: Iterable[ExternalAnchor]) -> AnchorAggregate:
+    """Confidence-weighted consensus (neutral 0.50 without confidence) and payload for ``anchors``."""
+    anchors = tuple(anchors)
+    total_conf = sum(a.confidence for a in anchors)
+    if total_conf <= 0:
+        consensus = 0.50
+    else:
+        consensus = min(max(sum(a.probability_yes * a.confidence for a in anchors) / total_conf, 0.01), 0.99)
+    return AnchorAggregate(
+        ticker=ticker,
+        anchors=anchors,
+        consensus_yes=consensus,
+        total_confidence=total_conf,
+        mean_confidence=fmean([a.confidence for a in anchors]) if anchors else 0.4,
+        payload={
+            "ticker": ticker,
+            "sources": [
+                {
+                    "name": anchor.source,
+                    "probability_yes": anchor.probability_yes,
+                    "confidence": anchor.confidence,
+                    "context": anchor.context,
+                }
+                for anchor in anchors
+            ],
+        },
+    )
+
+
 class ExternalDataProvider:
     """Provides external probability anchors.
 
@@ -40,15 +97,77 @@ class ExternalDataProvider:
         ],
     }
 
+    def __init__(self, sources: AnchorSourceRegistry | None = None) -> None:
+        self._index: dict[str, AnchorAggregate] = {}
+        self._lock = Lock()
+        self.sources = sources
+        if sources is None:
+            self._anchors: dict[str, list[ExternalAnchor]] = {t: list(a) for t, a in self._MOCK_ANCHORS.items()}
+        else:
+            self._anchors = {}
+            sources.subscribe(self._on_source_refresh)
+            for name in sources.source_names:
+                self._on_source_refresh(name, {}, sources.anchors_for(name))
+
+    def get_anchor_aggregate(self, ticker: str) -> AnchorAggregate:
+        """Indexed aggregate for ``ticker``, built on first use after each refresh."""
+        if self.sources is not None:
+            self.sources.revalidate()
+        aggregate = self._index.get(ticker)
+        if aggregate is None:
+            with self._lock:
+                aggregate = aggregate_anchors(ticker, self._anchors.get(ticker) or self._fallback_anchors())
+                self._index[ticker] = aggregate
+        return aggregate
+
     def get_probability_anchors(self, ticker: str) -> list[ExternalAnchor]:
         """Return available anchors for a market ticker.
 
         Unknown tickers return a conservative fallback set with low confidence.
         """
-        anchors = self._MOCK_ANCHORS.get(ticker)
-        if anchors:
-            return anchors
+        return list(self.get_anchor_aggregate(ticker).anchors)
+
+    def get_source_payload(self, ticker: str) -> dict[str, Any]:
+        """Structured payload useful for logging and API explanations."""
+        return self.get_anchor_aggregate(ticker).payload
+
+    def refresh_anchors(self, anchors_by_ticker: dict[str, list[ExternalAnchor]]) -> None:
+        """Replace anchors for the given tickers and invalidate their index entries."""
+        with self._lock:
+            for ticker, anchors in anchors_by_ticker.items():
+                self._anchors[ticker] = list(anchors)
+                self._index.pop(ticker, None)
 
+    def invalidate(self, tickers: Iterable[str] | None = None) -> None:
+        """Drop indexed aggregates (all of them when ``tickers`` is None)."""
+        with self._lock:
+            if tickers is None:
+                self._index.clear()
+                return
+            for ticker in tickers:
+                self._index.pop(ticker, None)
+
+    def _on_source_refresh(
+        self,
+        source: str,
+        previous: dict[str, list[ExternalAnchor]],
+        current: dict[str, list[ExternalAnchor]],
+    ) -> None:
+        # Rebuild combined anchors (in source registration order) only for touched tickers.
+        affected = set(previous) | set(current)
+        self.refresh_anchors(
+            {
+                ticker: [
+                    anchor
+                    for name in self.sources.source_names
+                    for anchor in self.sources.anchors_for(name).get(ticker, [])
+                ]
+                for ticker in affected
+            }
+        )
+
+    @staticmethod
+    def _fallback_anchors() -> list[ExternalAnchor]:
         return [
             ExternalAnchor(
                 source="fallback_baseline",
@@ -57,19 +176,3 @@ class ExternalDataProvider:
                 context="No external coverage; using neutral baseline",
             )
         ]
-
-    def get_source_payload(self, ticker: str) -> dict[str, Any]:
-        """Structured payload useful for logging and API explanations."""
-        anchors = self.get_probability_anchors(ticker)
-        return {
-            "ticker": ticker,
-            "sources": [
-                {
-                    "name": anchor.source,
-                    "probability_yes": anchor.probability_yes,
-                    "confidence": anchor.confidence,
-                    "context": anchor.context,
-                }
-                for anchor in anchors
-            ],
-        }
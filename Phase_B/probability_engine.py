@@ -7,11 +7,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from statistics import fmean
+from typing import Sequence, Union
 import json
 
-from Phase_B.external_data import ExternalAnchor
+import numpy as np
+
+from Phase_B.external_data import AnchorAggregate, ExternalAnchor, aggregate_anchors
 from Shared.models import PriceSnapshot
+from Shared.snapshot_batch import SnapshotBatch
+
+# Callers may pass raw anchors or the provider's precomputed aggregate.
+AnchorInput = Union[list[ExternalAnchor], AnchorAggregate]
 
 
 @dataclass(frozen=True)
@@ -27,6 +33,31 @@ class ProbabilityEstimate:
     model_agreement: float
 
 
+@dataclass(frozen=True)
+class ProbabilityBatch:
+    """Column-wise ensemble estimates for many snapshots, aligned with ``tickers``."""
+
+    tickers: list[str]
+    market_implied_yes: np.ndarray
+    external_yes: np.ndarray
+    bayesian_yes: np.ndarray
+    internal_yes: np.ndarray
+    ensemble_yes: np.ndarray
+    model_agreement: np.ndarray
+    confidence: np.ndarray
+
+    def estimate_at(self, index: int) -> ProbabilityEstimate:
+        return ProbabilityEstimate(
+            ticker=self.tickers[index],
+            market_implied_yes=float(self.market_implied_yes[index]),
+            external_yes=float(self.external_yes[index]),
+            bayesian_yes=float(self.bayesian_yes[index]),
+            internal_yes=float(self.internal_yes[index]),
+            ensemble_yes=float(self.ensemble_yes[index]),
+            model_agreement=float(self.model_agreement[index]),
+        )
+
+
 class ProbabilityEngine:
     """Compute conservative YES probabilities from several low-latency components."""
 
@@ -49,11 +80,12 @@ class ProbabilityEngine:
     def estimate_yes_probability(
         self,
         snapshot: PriceSnapshot,
-        anchors: list[ExternalAnchor],
+        anchors: AnchorInput,
     ) -> ProbabilityEstimate:
+        aggregate = self._as_aggregate(anchors)
         market_implied = self._market_implied(snapshot)
-        external_yes = self._external_consensus(anchors)
-        bayesian_yes = self._bayesian_blend(market_implied, external_yes, anchors)
+        external_yes = aggregate.consensus_yes
+        bayesian_yes = self._bayesian_blend(market_implied, external_yes, aggregate.total_confidence)
         internal_yes = self._internal_signal(snapshot, market_implied)
 
         ensemble_yes = (
@@ -77,25 +109,76 @@ class ProbabilityEngine:
             model_agreement=min(max(model_agreement, 0.0), 1.0),
         )
 
+    def estimate_batch(
+        self,
+        snapshots: SnapshotBatch | Sequence[PriceSnapshot],
+        anchors_by_ticker: dict[str, AnchorInput],
+    ) -> ProbabilityBatch:
+        """Vectorized :meth:`estimate_yes_probability` plus confidence for a snapshot universe."""
+        batch = SnapshotBatch.coerce(snapshots)
+        yes_bid, yes_ask, no_bid = batch.yes_bid, batch.yes_ask, batch.no_bid
+        volume = batch.volume.astype(float)
+
+        # Anchor aggregates are per ticker, so compute them once and broadcast by ticker code.
+        aggregates = [self._as_aggregate(anchors_by_ticker.get(ticker, [])) for ticker in batch.symbols]
+        external_yes = np.array([a.consensus_yes for a in aggregates], dtype=float)[batch.ticker_index]
+        total_conf = np.array([a.total_confidence for a in aggregates], dtype=float)[batch.ticker_index]
+        anchor_conf = np.array([a.mean_confidence for a in aggregates], dtype=float)[batch.ticker_index]
+
+        market_implied = np.clip(((yes_bid + yes_ask) / 2) / 100.0, 0.01, 0.99)
+
+        prior_alpha = 1 + (market_implied * 8)
+        prior_beta = 1 + ((1 - market_implied) * 8)
+        ext_strength = np.maximum(total_conf, 0.1) * 4
+        post_alpha = prior_alpha + external_yes * ext_strength
+        post_beta = prior_beta + (1 - external_yes) * ext_strength
+        bayesian_yes = np.clip(post_alpha / (post_alpha + post_beta), 0.01, 0.99)
+
+        spread_penalty = np.maximum(0.0, (yes_ask - yes_bid) / 100)
+        depth_bias = ((yes_bid - no_bid) / 100) * 0.15
+        liquidity_bonus = np.minimum(volume / 200_000, 1.0) * 0.03
+        internal_yes = np.clip(market_implied + depth_bias + liquidity_bonus - spread_penalty, 0.01, 0.99)
+
+        ensemble_yes = (
+            self.weights["market_implied_yes"] * market_implied
+            + self.weights["external_yes"] * external_yes
+            + self.weights["bayesian_yes"] * bayesian_yes
+            + self.weights["internal_yes"] * internal_yes
+        )
+        ensemble_yes = np.clip((ensemble_yes - 0.5) / self.calibration_temperature + 0.5 + self.calibration_bias, 0.01, 0.99)
+
+        components = np.stack([market_implied, external_yes, bayesian_yes, internal_yes])
+        model_agreement = np.clip(1.0 - (components.max(axis=0) - components.min(axis=0)), 0.0, 1.0)
+        confidence = np.clip(0.45 * model_agreement + 0.35 * anchor_conf + 0.20, 0.0, 0.99)
+
+        return ProbabilityBatch(
+            tickers=batch.tickers,
+            market_implied_yes=market_implied,
+            external_yes=external_yes,
+            bayesian_yes=bayesian_yes,
+            internal_yes=internal_yes,
+            ensemble_yes=ensemble_yes,
+            model_agreement=model_agreement,
+            confidence=confidence,
+        )
+
+    @staticmethod
+    def _as_aggregate(anchors: AnchorInput) -> AnchorAggregate:
+        if isinstance(anchors, AnchorAggregate):
+            return anchors
+        return aggregate_anchors("", anchors)
+
     @staticmethod
     def _market_implied(snapshot: PriceSnapshot) -> float:
         mid_yes = (snapshot.yes_bid + snapshot.yes_ask) / 2
         return min(max(mid_yes / 100.0, 0.01), 0.99)
 
     @staticmethod
-    def _external_consensus(anchors: list[ExternalAnchor]) -> float:
-        weighted = [a.probability_yes * a.confidence for a in anchors]
-        total_conf = sum(a.confidence for a in anchors)
-        if total_conf <= 0:
-            return 0.50
-        return min(max(sum(weighted) / total_conf, 0.01), 0.99)
-
-    @staticmethod
-    def _bayesian_blend(market_implied: float, external_yes: float, anchors: list[ExternalAnchor]) -> float:
+    def _bayesian_blend(market_implied: float, external_yes: float, total_confidence: float) -> float:
         # Treat external consensus confidence as pseudo-observations.
         prior_alpha = 1 + (market_implied * 8)
         prior_beta = 1 + ((1 - market_implied) * 8)
-        ext_strength = max(sum(a.confidence for a in anchors), 0.1) * 4
+        ext_strength = max(total_confidence, 0.1) * 4
         post_alpha = prior_alpha + external_yes * ext_strength
         post_beta = prior_beta + (1 - external_yes) * ext_strength
         return min(max(post_alpha / (post_alpha + post_beta), 0.01), 0.99)
@@ -109,10 +192,10 @@ class ProbabilityEngine:
         internal = market_implied + depth_bias + liquidity_bonus - spread_penalty
         return min(max(internal, 0.01), 0.99)
 
-    @staticmethod
-    def aggregate_confidence(estimate: ProbabilityEstimate, anchors: list[ExternalAnchor]) -> float:
+    @classmethod
+    def aggregate_confidence(cls, estimate: ProbabilityEstimate, anchors: AnchorInput) -> float:
         """Confidence score for minimum-gate checks."""
-        anchor_conf = fmean([a.confidence for a in anchors]) if anchors else 0.4
+        anchor_conf = cls._as_aggregate(anchors).mean_confidence
         confidence = 0.45 * estimate.model_agreement + 0.35 * anchor_conf + 0.20
         return min(max(confidence, 0.0), 0.99)
 
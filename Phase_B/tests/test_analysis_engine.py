@@ -1,6 +1,9 @@
 from types import SimpleNamespace
 
+import pytest
+
 from Phase_B.analysis_engine import PhaseBAnalysisEngine
+from Shared.config import Config
 from Shared.models import PriceSnapshot
 
 
@@ -42,3 +45,182 @@ def test_analysis_engine_uses_no_adjusted_probability_for_no_proposals(monkeypat
 
     assert result.paper_trade_proposal.side == "NO"
     assert captured["probability_yes"] == (1 - result.probability_estimate.ensemble_yes)
+
+
+def _universe() -> list[PriceSnapshot]:
+    return [
+        PriceSnapshot("FED-RATE-25MAR", "2026-02-15T12:00:00Z", 72, 74, 26, 28, 45000, 820000),
+        PriceSnapshot("WEATHER-NYC-SNOW", "2026-02-15T12:00:00Z", 35, 38, 62, 65, 8200, 95000),
+        PriceSnapshot("UNKNOWN-MKT", "2026-02-15T12:00:00Z", 10, 20, 80, 90, 100, 1000),
+        PriceSnapshot("CHEAP-YES", "2026-02-15T12:00:00Z", 4, 5, 94, 96, 90000, 1000),
+    ]
+
+
+def test_analyze_many_matches_scalar_probabilities():
+    engine = PhaseBAnalysisEngine()
+    snapshots = _universe()
+
+    batch = engine.analyze_many(snapshots)
+
+    assert batch.tickers == [s.ticker for s in snapshots]
+    for index, snapshot in enumerate(snapshots):
+        anchors = engine.external_data.get_probability_anchors(snapshot.ticker)
+        estimate = engine.probability_engine.estimate_yes_probability(snapshot, anchors)
+        confidence = engine.probability_engine.aggregate_confidence(estimate, anchors)
+        decision = engine.edge_detector.evaluate(snapshot, estimate, confidence)
+
+        batched = batch.probabilities.estimate_at(index)
+        assert batched.ticker == estimate.ticker
+        for field in ("market_implied_yes", "external_yes", "bayesian_yes", "internal_yes", "ensemble_yes"):
+            assert getattr(batched, field) == pytest.approx(getattr(estimate, field))
+        assert batch.probabilities.confidence[index] == pytest.approx(confidence)
+        assert max(batch.yes_ev_percent[index], batch.no_ev_percent[index]) == pytest.approx(decision.ev_percent)
+
+
+def test_analyze_many_materializes_only_gate_survivors(monkeypatch):
+    monkeypatch.setattr(Config, "MIN_CONFIDENCE", 0.0)
+    monkeypatch.setattr(Config, "MIN_EV_THRESHOLD", 0.0)
+    monkeypatch.setattr(Config, "MIN_CONFIRMATIONS", 0)
+    engine = PhaseBAnalysisEngine()
+
+    batch = engine.analyze_many(_universe())
+    survivors = {r.signal.ticker for r in batch.results}
+    assert survivors
+    assert all(r.edge_decision.side in {"YES", "NO"} for r in batch.results)
+
+    monkeypatch.setattr(Config, "MIN_EV_THRESHOLD", 10_000.0)
+    assert engine.analyze_many(_universe()).results == []
+
+
+def test_explanation_and_proposal_preview_render_on_first_access(monkeypatch, caplog):
+    import logging
+
+    import Phase_B.analysis_engine as analysis_engine
+
+    calls = {"explanation": 0, "proposal": 0}
+    build_explanation = PhaseBAnalysisEngine._build_explanation
+    format_trade_proposal = analysis_engine.format_trade_proposal
+
+    def counting_explanation(*args):
+        calls["explanation"] += 1
+        return build_explanation(*args)
+
+    def counting_proposal(*args):
+        calls["proposal"] += 1
+        return format_trade_proposal(*args)
+
+    monkeypatch.setattr(PhaseBAnalysisEngine, "_build_explanation", staticmethod(counting_explanation))
+    monkeypatch.setattr(analysis_engine, "format_trade_proposal", counting_proposal)
+
+    result = PhaseBAnalysisEngine().analyze_snapshot(_universe()[0])
+    assert result.ticker == "FED-RATE-25MAR"
+    assert calls == {"explanation": 0, "proposal": 0}
+
+    assert "Proposed risk" in result.signal.explanation
+    with caplog.at_level(logging.INFO, logger="Phase_C.imessage_proposal"):
+        assert "PROPOSAL ONLY" in result.proposal_preview
+    assert result.proposal_preview is result.proposal_preview
+    assert calls == {"explanation": 1, "proposal": 1}
+    assert not caplog.records  # reading the preview is not proposing
+
+
+def test_gate_first_mode_skips_risk_work_for_hold_decisions():
+    engine = PhaseBAnalysisEngine(mode="gate_first")
+
+    result = engine.analyze_snapshot(_universe()[2])
+
+    assert result.edge_decision.side == "HOLD"
+    assert engine.risk_gateway.stress_runs == 0
+    assert result.stages == ("probability", "edge", "risk_assessment")
+    assert not result.risk_assessment.stress_test.ran
+    assert "stress_test_skipped" in result.risk_assessment.blockers
+    assert not result.paper_trade_proposal.approved_by_risk
+    assert "Stress test: skipped" in result.explanation
+
+    full = engine.analyze_snapshot(_universe()[2], mode="full")
+    assert full.mode == "full"
+    assert "stress_test" in full.stages and "trade_risk" in full.stages
+
+
+def test_full_mode_reuses_one_stress_run_for_shared_inputs(monkeypatch):
+    monkeypatch.setattr(Config, "MIN_CONFIDENCE", 0.0)
+    monkeypatch.setattr(Config, "MIN_EV_THRESHOLD", 0.0)
+    monkeypatch.setattr(Config, "MIN_CONFIRMATIONS", 0)
+    engine = PhaseBAnalysisEngine(mode="full")
+
+    result = engine.analyze_snapshot(_universe()[0])
+
+    assert result.edge_decision.side in {"YES", "NO"}
+    assert result.stages[-1] == "stress_reused"
+    assert engine.risk_gateway.stress_runs == 1
+    assert engine.risk_gateway.stress_reuses == 1
+
+
+def test_diagnostics_mode_never_stress_tests():
+    engine = PhaseBAnalysisEngine(mode="diagnostics")
+
+    results = [engine.analyze_snapshot(snapshot) for snapshot in _universe()]
+
+    assert engine.risk_gateway.stress_runs == 0
+    assert all("stress_test" not in r.stages for r in results)
+    with pytest.raises(ValueError):
+        PhaseBAnalysisEngine(mode="fastest")
+
+
+def test_snapshot_batch_round_trips_and_feeds_analyze_many():
+    from dataclasses import FrozenInstanceError
+
+    from Shared.snapshot_batch import SnapshotBatch
+
+    snapshots = _universe() + [_universe()[0]]
+    batch = SnapshotBatch.from_snapshots(snapshots)
+
+    assert len(batch) == len(snapshots)
+    assert batch.symbols == ("FED-RATE-25MAR", "WEATHER-NYC-SNOW", "UNKNOWN-MKT", "CHEAP-YES")
+    assert batch.timestamp_ms.dtype.name == "int64"
+    assert batch.nbytes == len(snapshots) * 60
+    restored = batch.to_snapshots()
+    assert [s.ticker for s in restored] == [s.ticker for s in snapshots]
+    assert restored[1].yes_ask == snapshots[1].yes_ask and restored[1].timestamp == "2026-02-15T12:00:00.000Z"
+    assert not hasattr(restored[0], "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        restored[0].yes_ask = 1
+
+    engine = PhaseBAnalysisEngine()
+    from_batch = engine.analyze_many(batch)
+    from_list = engine.analyze_many(snapshots)
+    assert from_batch.tickers == from_list.tickers
+    assert from_batch.probabilities.ensemble_yes.tolist() == pytest.approx(from_list.probabilities.ensemble_yes.tolist())
+    assert batch.take(slice(1, 3)).tickers == ["WEATHER-NYC-SNOW", "UNKNOWN-MKT"]
+
+
+@pytest.mark.parametrize("timestamp", ["", "Feb 15, noon"])
+def test_snapshots_without_iso_timestamp_score_but_are_rejected_by_time_indexed_paths(tmp_path, monkeypatch, timestamp):
+    from Shared.snapshot_batch import SnapshotBatch
+    from Shared.snapshot_store import ColumnarSnapshotStore
+
+    snapshot = PriceSnapshot("FED-RATE-25MAR", timestamp, 72, 74, 26, 28, volume=45000, open_interest=820000)
+    assert snapshot.timestamp_ms is None
+    engine = PhaseBAnalysisEngine()
+    scalar = engine.analyze_snapshot(snapshot)
+    assert scalar.snapshot is snapshot
+
+    # Universe scans are scoring, not time indexing: the untimed row scores like the scalar path.
+    universe = _universe()[1:] + [snapshot]
+    batch = SnapshotBatch.from_snapshots(universe)
+    assert batch.timestamp_valid.tolist() == [True, True, True, False]
+    assert batch.snapshot_at(3).timestamp == "" and batch.snapshot_at(3).timestamp_ms is None
+    scanned = engine.analyze_many(universe)
+    assert scanned.probabilities.ensemble_yes[3] == pytest.approx(scalar.probability_estimate.ensemble_yes)
+    assert max(scanned.yes_ev_percent[3], scanned.no_ev_percent[3]) == pytest.approx(scalar.edge_decision.ev_percent)
+
+    monkeypatch.setattr(Config, "MIN_CONFIDENCE", 0.0)
+    monkeypatch.setattr(Config, "MIN_EV_THRESHOLD", 0.0)
+    monkeypatch.setattr(Config, "MIN_CONFIRMATIONS", 0)
+    survivors = {r.signal.ticker: r for r in engine.analyze_many(batch).results}
+    assert survivors["FED-RATE-25MAR"].snapshot.timestamp_ms is None
+
+    store = ColumnarSnapshotStore(tmp_path / "store")
+    with pytest.raises(ValueError, match="no ISO-8601 timestamp"):
+        store.append([snapshot])
+    assert store.row_count("FED-RATE-25MAR") == 0
@@ -0,0 +1,107 @@
+import json
+import time
+
+import pytest
+
+from Phase_B.anchor_sources import AnchorSourceRegistry, JsonFileAnchorAdapter
+from Phase_B.external_data import ExternalDataProvider
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _write(path, rows):
+    path.write_text(json.dumps(rows), encoding="utf-8")
+    return path
+
+
+def test_sources_fetch_concurrently_and_combine_per_ticker(tmp_path):
+    cme = _write(tmp_path / "cme.json", {"FED-RATE-25MAR": [{"probability_yes": 0.70, "confidence": 0.8}]})
+    fred = _write(tmp_path / "fred.json", {"FED-RATE-25MAR": [{"probability_yes": 0.60, "confidence": 0.4}]})
+    registry = AnchorSourceRegistry(
+        [
+            JsonFileAnchorAdapter("cme_fedwatch", cme, delay_seconds=0.2),
+            JsonFileAnchorAdapter("fred_rates_regime", fred, delay_seconds=0.2),
+        ],
+        max_workers=2,
+    )
+    started = time.perf_counter()
+    registry.refresh_all(timeout=5)
+    assert time.perf_counter() - started < 0.39
+
+    provider = ExternalDataProvider(sources=registry)
+    aggregate = provider.get_anchor_aggregate("FED-RATE-25MAR")
+    assert [a.source for a in aggregate.anchors] == ["cme_fedwatch", "fred_rates_regime"]
+    assert round(aggregate.consensus_yes, 4) == round((0.70 * 0.8 + 0.60 * 0.4) / 1.2, 4)
+    assert provider.get_anchor_aggregate("UNKNOWN").anchors[0].source == "fallback_baseline"
+    registry.close()
+
+
+def test_stale_source_is_served_while_revalidating(tmp_path):
+    clock = _Clock()
+    path = _write(tmp_path / "noaa.json", {"WEATHER-NYC-SNOW": [{"probability_yes": 0.40, "confidence": 0.8}]})
+    registry = AnchorSourceRegistry(
+        [JsonFileAnchorAdapter("noaa_blend", path, refresh_interval_seconds=60, delay_seconds=0.3)], clock=clock
+    )
+    registry.refresh_all(timeout=5)
+    provider = ExternalDataProvider(sources=registry)
+    assert provider.get_anchor_aggregate("WEATHER-NYC-SNOW").consensus_yes == pytest.approx(0.40)
+
+    _write(path, {"WEATHER-NYC-SNOW": [{"probability_yes": 0.55, "confidence": 0.8}]})
+    clock.now += 61
+    started = time.perf_counter()
+    stale = provider.get_anchor_aggregate("WEATHER-NYC-SNOW")
+    assert time.perf_counter() - started < 0.1
+    assert stale.consensus_yes == pytest.approx(0.40)
+    assert registry.status()[0].refreshing is True
+
+    registry.wait_idle(timeout=5)
+    assert provider.get_anchor_aggregate("WEATHER-NYC-SNOW").consensus_yes == pytest.approx(0.55)
+    assert registry.status()[0].stale is False
+    registry.close()
+
+
+def test_failed_refresh_keeps_last_good_anchors(tmp_path):
+    clock = _Clock()
+    path = _write(tmp_path / "cme.json", {"FED-RATE-25MAR": [{"probability_yes": 0.70, "confidence": 0.8}]})
+    registry = AnchorSourceRegistry([JsonFileAnchorAdapter("cme_fedwatch", path, refresh_interval_seconds=10)], clock=clock)
+    registry.refresh_all(timeout=5)
+    provider = ExternalDataProvider(sources=registry)
+
+    path.write_text("{not json", encoding="utf-8")
+    clock.now += 11
+    provider.get_anchor_aggregate("FED-RATE-25MAR")
+    registry.wait_idle(timeout=5)
+
+    status = registry.status()[0]
+    assert status.last_error.startswith("JSONDecodeError")
+    assert provider.get_anchor_aggregate("FED-RATE-25MAR").consensus_yes == pytest.approx(0.70)
+    registry.close()
+
+
+def test_failing_listener_does_not_leave_source_in_flight(tmp_path):
+    clock = _Clock()
+    path = _write(tmp_path / "cme.json", {"FED-RATE-25MAR": [{"probability_yes": 0.70, "confidence": 0.8}]})
+    registry = AnchorSourceRegistry([JsonFileAnchorAdapter("cme_fedwatch", path, refresh_interval_seconds=10)], clock=clock)
+    seen = []
+
+    def broken(source, previous, current):
+        raise RuntimeError("listener bug")
+
+    registry.subscribe(broken)
+    registry.subscribe(lambda source, previous, current: seen.append(source))
+    registry.refresh_all(timeout=5)
+
+    assert seen == ["cme_fedwatch"]
+    status = registry.status()[0]
+    assert status.refreshing is False and status.ticker_count == 1
+
+    clock.now += 11
+    registry.refresh_all(timeout=5)
+    assert seen == ["cme_fedwatch", "cme_fedwatch"]
+    registry.close()
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from Phase_B.edge_detector import EdgeDetector
 from Phase_B.probability_engine import ProbabilityEstimate
 from Shared.models import PriceSnapshot
@@ -29,3 +32,43 @@ def test_edge_detector_returns_hold_when_thresholds_fail():
 
     assert decision.side == "HOLD"
     assert decision.threshold_checks["min_confirmations"] is False
+
+
+def test_evaluate_batch_masks_match_scalar_decisions(monkeypatch):
+    from Phase_B.analysis_engine import PhaseBAnalysisEngine
+    from Shared.config import Config
+
+    monkeypatch.setattr(Config, "MIN_CONFIDENCE", 0.5)
+    monkeypatch.setattr(Config, "MIN_EV_THRESHOLD", 0.0)
+    engine = PhaseBAnalysisEngine()
+    rng = np.random.default_rng(3)
+    snapshots = []
+    for index in range(200):
+        yes_bid = float(rng.integers(2, 95))
+        yes_ask = yes_bid + float(rng.integers(1, 6))
+        no_bid = float(100 - yes_ask)
+        snapshots.append(
+            PriceSnapshot(f"MKT-{index}", "2026-02-15T12:00:00Z", yes_bid, yes_ask, no_bid, no_bid + 2, int(rng.integers(0, 20_000)))
+        )
+
+    anchors = {s.ticker: engine.external_data.get_anchor_aggregate(s.ticker) for s in snapshots}
+    probabilities = engine.probability_engine.estimate_batch(snapshots, anchors)
+    batch = engine.edge_detector.evaluate_batch(
+        yes_ask=np.array([s.yes_ask for s in snapshots]),
+        yes_bid=np.array([s.yes_bid for s in snapshots]),
+        no_ask=np.array([s.no_ask for s in snapshots]),
+        volume=np.array([s.volume for s in snapshots], dtype=float),
+        probabilities=probabilities,
+    )
+
+    assert batch.passed.any() and not batch.passed.all()
+    assert [d.ticker for d in batch.decisions] == [snapshots[i].ticker for i in batch.survivor_indices]
+    for index, snapshot in enumerate(snapshots):
+        scalar = engine.edge_detector.evaluate(
+            snapshot, probabilities.estimate_at(index), float(probabilities.confidence[index])
+        )
+        batched = batch.decision_at(index)
+        assert batched.side == scalar.side
+        assert batched.confirmations == scalar.confirmations
+        assert batched.threshold_checks == scalar.threshold_checks
+        assert batched.ev_percent == pytest.approx(scalar.ev_percent)
@@ -1,4 +1,4 @@
-from Phase_B.external_data import ExternalDataProvider
+from Phase_B.external_data import ExternalAnchor, ExternalDataProvider
 from Phase_B.probability_engine import ProbabilityEngine
 from Shared.models import PriceSnapshot
 
@@ -24,3 +24,25 @@ def test_probability_estimate_ranges():
     assert 0.0 < estimate.ensemble_yes < 1.0
     assert 0.0 <= estimate.model_agreement <= 1.0
     assert 0.0 <= confidence <= 0.99
+
+
+def test_anchor_index_matches_raw_anchors_and_invalidates_on_refresh():
+    provider = ExternalDataProvider()
+    engine = ProbabilityEngine()
+    snapshot = PriceSnapshot("FED-RATE-25MAR", "2026-02-15T12:00:00Z", 72, 74, 26, 28, 45000, 820000)
+
+    aggregate = provider.get_anchor_aggregate(snapshot.ticker)
+    assert provider.get_anchor_aggregate(snapshot.ticker) is aggregate
+    assert provider.get_source_payload(snapshot.ticker) is aggregate.payload
+
+    anchors = provider.get_probability_anchors(snapshot.ticker)
+    from_raw = engine.estimate_yes_probability(snapshot, anchors)
+    from_index = engine.estimate_yes_probability(snapshot, aggregate)
+    assert from_index == from_raw
+    assert engine.aggregate_confidence(from_index, aggregate) == engine.aggregate_confidence(from_raw, anchors)
+
+    provider.refresh_anchors({snapshot.ticker: [ExternalAnchor("cme_fedwatch", 0.90, 0.80, "repriced")]})
+    refreshed = provider.get_anchor_aggregate(snapshot.ticker)
+    assert refreshed is not aggregate
+    assert refreshed.consensus_yes == 0.90
+    assert provider.get_anchor_aggregate("WEATHER-NYC-SNOW").anchors[0].source == "noaa_blend"
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from Shared.config import Config
+from Shared.config import StrategyParameters
 
 
 @dataclass(frozen=True)
@@ -20,6 +20,9 @@ class PositionSizeDecision:
 class FractionalKellySizer:
     """Computes conservative position risk in dollars for a single trade."""
 
+    def __init__(self, params: StrategyParameters | None = None) -> None:
+        self.params = params
+
     def size_risk(
         self,
         *,
@@ -31,8 +34,9 @@ class FractionalKellySizer:
     ) -> PositionSizeDecision:
         """Return risk budget in dollars, bounded by strict hard caps."""
 
+        max_trade_risk = (self.params or StrategyParameters.from_config()).max_trade_risk
         if side not in {"YES", "NO"}:
-            return PositionSizeDecision(side, 0.0, 0.0, 0.0, Config.MAX_TRADE_RISK, exposure_cap_remaining, ["hold_side"])
+            return PositionSizeDecision(side, 0.0, 0.0, 0.0, max_trade_risk, exposure_cap_remaining, ["hold_side"])
 
         p_win = prob_yes if side == "YES" else (1 - prob_yes)
         p_win = min(max(p_win, 0.0), 1.0)
@@ -43,7 +47,7 @@ class FractionalKellySizer:
         kelly_applied = kelly_raw * kelly_multiplier
 
         uncapped_risk = bankroll * kelly_applied
-        cap = min(Config.MAX_TRADE_RISK, exposure_cap_remaining)
+        cap = min(max_trade_risk, exposure_cap_remaining)
         recommended = round(max(min(uncapped_risk, cap), 0.0), 4)
 
         rationale = [
@@ -59,7 +63,7 @@ class FractionalKellySizer:
             recommended_risk=recommended,
             kelly_fraction_raw=round(kelly_raw, 6),
             kelly_fraction_applied=round(kelly_applied, 6),
-            max_risk_cap=Config.MAX_TRADE_RISK,
+            max_risk_cap=max_trade_risk,
             exposure_cap_remaining=exposure_cap_remaining,
             rationale=rationale,
         )
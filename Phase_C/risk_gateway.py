@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from Phase_C.fail_safes import FailSafeEvaluator, FailSafeReport
 from Phase_C.kelly_sizing import FractionalKellySizer, PositionSizeDecision
 from Phase_C.monte_carlo_stress import MonteCarloStressTester, StressTestReport
 from Phase_F.governance_engine import GovernanceEngine, GovernanceReport
 from Shared.bankroll_tracker import BankrollTracker
-from Shared.config import Config
+from Shared.config import Config, StrategyParameters
 from Shared.models import PriceSnapshot
 
 
@@ -52,13 +53,23 @@ class LegacyRiskDecision:
 class RiskGateway:
     """Central Phase C decisioning object for pre-trade risk assessment."""
 
-    def __init__(self, tracker: BankrollTracker | None = None) -> None:
+    def __init__(
+        self,
+        tracker: BankrollTracker | None = None,
+        params: StrategyParameters | None = None,
+        stress_tester: MonteCarloStressTester | None = None,
+    ) -> None:
         self.tracker = tracker or BankrollTracker()
-        self.sizer = FractionalKellySizer()
+        self.sizer = FractionalKellySizer(params)
         self.fail_safes = FailSafeEvaluator()
-        self.stress_tester = MonteCarloStressTester()
+        self.stress_tester = stress_tester or MonteCarloStressTester()
         self.governance_engine = GovernanceEngine()
         self.kelly_scale_factor = 1.0
+        # Single-entry memo: assess_snapshot() and assess_trade() for the same analysis
+        # usually stress the same inputs, so the second call reuses the first report.
+        self._last_stress: tuple[tuple, StressTestReport] | None = None
+        self.stress_runs = 0
+        self.stress_reuses = 0
 
     def assess(
         self,
@@ -84,8 +95,15 @@ class RiskGateway:
             raise ValueError("ensemble_yes is required for RiskAssessment mode")
         return self.assess_snapshot(snapshot, side, ensemble_yes)
 
-    def assess_snapshot(self, snapshot: PriceSnapshot, side: str, ensemble_yes: float) -> RiskAssessment:
-        
+    def assess_snapshot(
+        self,
+        snapshot: PriceSnapshot,
+        side: str,
+        ensemble_yes: float,
+        *,
+        run_stress: bool = True,
+    ) -> RiskAssessment:
+        """Size, fail-safe and stress-test one trade; ``run_stress=False`` blocks instead of simulating."""
         fail_safe_report = self.fail_safes.evaluate(
             snapshot=snapshot,
             buying_power=self.tracker.buying_power,
@@ -106,13 +124,17 @@ class RiskGateway:
         price = snapshot.yes_ask / 100.0 if side == "YES" else snapshot.no_ask / 100.0
         payout_multiple = 0.0 if price <= 0 else (1 - price) / price
 
-        stress = self.stress_tester.run(
-            bankroll=self.tracker.current_bankroll,
-            risk_amount=sizing.recommended_risk,
-            win_probability=p_win,
-            payout_multiple=payout_multiple,
-            simulations=Config.MONTE_CARLO_SIMS,
-        )
+        if run_stress:
+            stress = self._stress(
+                bankroll=self.tracker.current_bankroll,
+                risk_amount=sizing.recommended_risk,
+                win_probability=p_win,
+                payout_multiple=payout_multiple,
+                simulations=Config.MONTE_CARLO_SIMS,
+                steps=Config.MONTE_CARLO_STEPS,
+            )
+        else:
+            stress = StressTestReport.skipped()
 
         blockers: list[str] = []
         if side == "HOLD":
@@ -121,7 +143,9 @@ class RiskGateway:
             blockers.append("zero_position_size")
         if not fail_safe_report.approved:
             blockers.extend(fail_safe_report.reasons)
-        if not stress.pass_threshold:
+        if not stress.ran:
+            blockers.append("stress_test_skipped")
+        elif not stress.pass_threshold:
             blockers.append("stress_test_ruin_probability")
 
         approved = len(blockers) == 0
@@ -173,16 +197,7 @@ class RiskGateway:
         p_win = min(max(probability_yes, 0.0), 1.0)
 
         fail_safe_report = self.fail_safes.evaluate(
-            snapshot=PriceSnapshot(
-                ticker="SIMULATED",
-                timestamp="",
-                yes_bid=max(1.0, entry_price_cents - 2),
-                yes_ask=entry_price_cents,
-                no_bid=max(1.0, 100 - entry_price_cents - 2),
-                no_ask=max(1.0, 100 - entry_price_cents),
-                volume=10_000,
-                open_interest=100_000,
-            ),
+            snapshot=_simulated_snapshot(entry_price_cents),
             buying_power=bankroll_tracker.buying_power,
             daily_loss=daily_loss,
             weekly_loss=weekly_loss,
@@ -199,7 +214,7 @@ class RiskGateway:
 
         price = max(entry_price_cents / 100.0, 0.01)
         payout_multiple = (1 - price) / price
-        stress = self.stress_tester.run(
+        stress = self._stress(
             bankroll=bankroll_tracker.current_bankroll,
             risk_amount=sizing.recommended_risk,
             win_probability=p_win,
@@ -240,3 +255,54 @@ class RiskGateway:
             average_pnl=average_pnl,
             risk_assessment=risk_assessment,
         )
+
+    def _stress(
+        self,
+        *,
+        bankroll: float,
+        risk_amount: float,
+        win_probability: float,
+        payout_multiple: float,
+        simulations: int,
+        steps: int,
+    ) -> StressTestReport:
+        key = (
+            bankroll,
+            risk_amount,
+            win_probability,
+            payout_multiple,
+            simulations,
+            steps,
+            self.stress_tester.mode,
+            Config.MIN_BUYING_POWER,
+            Config.MAX_RUIN_PROBABILITY,
+        )
+        if self._last_stress is not None and self._last_stress[0] == key:
+            self.stress_reuses += 1
+            return self._last_stress[1]
+        report = self.stress_tester.run(
+            bankroll=bankroll,
+            risk_amount=risk_amount,
+            win_probability=win_probability,
+            payout_multiple=payout_multiple,
+            simulations=simulations,
+            steps=steps,
+        )
+        self.stress_runs += 1
+        self._last_stress = (key, report)
+        return report
+
+
+@lru_cache(maxsize=256)
+def _simulated_snapshot(entry_price_cents: float) -> PriceSnapshot:
+    """Liquid synthetic quote around ``entry_price_cents``; snapshots are frozen, so it is shared."""
+    return PriceSnapshot(
+        ticker="SIMULATED",
+        timestamp="",
+        yes_bid=max(1.0, entry_price_cents - 2),
+        yes_ask=entry_price_cents,
+        no_bid=max(1.0, 100 - entry_price_cents - 2),
+        no_ask=max(1.0, 100 - entry_price_cents),
+        volume=10_000,
+        open_interest=100_000,
+    )
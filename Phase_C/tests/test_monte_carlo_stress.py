@@ -0,0 +1,134 @@
+from Phase_C.monte_carlo_stress import MonteCarloStressTester
+from Shared.monte_carlo import exact_bankroll_summary, simulate_bankroll_paths
+from Shared.ttl_cache import LRUTTLCache
+
+
+def _paths(engine: str, seed: int = 7):
+    return simulate_bankroll_paths(
+        initial_bankroll=50.0,
+        risk_fraction=0.05,
+        win_probability=0.45,
+        payout_multiple=1.0,
+        simulations=4000,
+        steps=25,
+        ruin_threshold=40.0,
+        seed=seed,
+        engine=engine,
+    )
+
+
+def test_vectorized_engine_is_reproducible_per_seed():
+    assert _paths("vectorized", seed=11) == _paths("vectorized", seed=11)
+    assert _paths("vectorized", seed=11) != _paths("vectorized", seed=12)
+
+
+def test_vectorized_engine_matches_reference_ruin_statistics():
+    vectorized = _paths("vectorized")
+    reference = _paths("reference")
+
+    assert 0.05 < reference.ruin_probability < 0.95
+    assert abs(vectorized.ruin_probability - reference.ruin_probability) < 0.03
+    assert abs(vectorized.p50_terminal - reference.p50_terminal) < 2.0
+    assert vectorized.p5_terminal <= vectorized.p50_terminal <= vectorized.p95_terminal
+
+
+def test_zero_risk_fraction_never_ruins():
+    summary = simulate_bankroll_paths(
+        initial_bankroll=35.0,
+        risk_fraction=0.0,
+        win_probability=0.5,
+        payout_multiple=1.0,
+    )
+    assert summary.ruin_probability == 0.0
+    assert summary.p50_terminal == 35.0
+
+
+def test_stress_tester_reference_engine_flag():
+    report = MonteCarloStressTester(engine="reference").run(
+        bankroll=50.0,
+        risk_amount=0.5,
+        win_probability=0.58,
+        payout_multiple=0.35,
+    )
+    assert report.simulations == 1000
+    assert report.pass_threshold is True
+
+
+def test_exact_lattice_matches_large_sample():
+    exact = exact_bankroll_summary(
+        initial_bankroll=50.0,
+        risk_fraction=0.05,
+        win_probability=0.45,
+        payout_multiple=1.0,
+        steps=25,
+        ruin_threshold=40.0,
+    )
+    sampled = simulate_bankroll_paths(
+        initial_bankroll=50.0,
+        risk_fraction=0.05,
+        win_probability=0.45,
+        payout_multiple=1.0,
+        simulations=50_000,
+    )
+    assert abs(exact.ruin_probability - sampled.ruin_probability) < 0.01
+    assert abs(exact.p50_terminal - sampled.p50_terminal) < 1e-9
+
+
+def test_stress_tester_exact_mode_is_deterministic():
+    tester = MonteCarloStressTester(mode="exact")
+    kwargs = dict(bankroll=50.0, risk_amount=2.5, win_probability=0.45, payout_multiple=1.0)
+    first = tester.run(**kwargs)
+    second = tester.run(**kwargs, simulations=10)
+
+    assert first.mode == "exact"
+    assert first.ruin_probability == second.ruin_probability
+    assert first.pass_threshold is False
+
+
+def test_stress_tester_exact_mode_falls_back_for_long_horizons():
+    report = MonteCarloStressTester(mode="exact").run(
+        bankroll=50.0,
+        risk_amount=0.5,
+        win_probability=0.58,
+        payout_multiple=0.35,
+        simulations=10,
+        steps=10_000,
+    )
+    assert report.mode == "sampled"
+
+
+def test_stress_tester_cache_hits_on_quantized_inputs():
+    tester = MonteCarloStressTester(cache_size=8, cache_ttl_seconds=60)
+    first = tester.run(bankroll=50.0, risk_amount=0.5, win_probability=0.58, payout_multiple=0.35)
+    second = tester.run(bankroll=50.001, risk_amount=0.5001, win_probability=0.58001, payout_multiple=0.35)
+
+    assert first == second
+    stats = tester.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_stress_results_do_not_depend_on_the_cache():
+    inputs = dict(bankroll=50.004, risk_amount=9.996, win_probability=0.58004, payout_multiple=0.35004, mode="exact")
+    cached = MonteCarloStressTester(cache_size=8, cache_ttl_seconds=60)
+    cached.run(**{**inputs, "bankroll": 49.996})  # a neighbour fills the same cache slot first
+    uncached = MonteCarloStressTester(cache_size=0)
+
+    assert cached.run(**inputs) == uncached.run(**inputs)
+    assert cached.cache_stats().hits == 1
+
+
+def test_lru_ttl_cache_evicts_and_expires():
+    now = [0.0]
+    cache = LRUTTLCache(max_size=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+    now[0] = 11.0
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.hits == 1
+    assert stats.misses == 2
@@ -1,15 +1,30 @@
-"""Backtest harness to execute >=100 paper trades under risk-first constraints."""
+"""Backtest harness to execute >=100 paper trades under risk-first constraints.
+
+Independent replay scenarios (perturbation seeds, snapshot windows, bankrolls)
+can be fanned out over a process pool with :meth:`BacktestHarness.run_scenarios`.
+Each worker process builds its own harness once and reuses it for every scenario
+it receives; summaries come back in scenario order, so results do not depend on
+the worker count.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+import os
+from pathlib import Path
+import time
+from typing import Sequence
 
 from Phase_A.data_fetcher import fetch_price_snapshots
 from Phase_B.analysis_engine import PhaseBAnalysisEngine
+from Phase_C.monte_carlo_stress import MonteCarloStressTester
 from Phase_C.risk_gateway import RiskGateway
 from Phase_D.paper_trader import PaperTradeResult, PaperTrader
 from Shared.bankroll_tracker import BankrollTracker
 from Shared.codex_client import get_codex_client
+from Shared.config import Config, StrategyParameters
 from Shared.models import PriceSnapshot
+from Shared.snapshot_store import ColumnarSnapshotStore
 
 
 @dataclass(frozen=True)
@@ -22,44 +37,110 @@ class BacktestSummary:
     max_drawdown_pct: float
     ruin_detected: bool
     codex_notes: str | None
+    scenario: str = "default"
+
+
+@dataclass(frozen=True)
+class BacktestScenario:
+    """One independent replay: ``seed`` shifts the perturbation phase, ``window`` slices base snapshots."""
+
+    name: str = "default"
+    trades: int = 100
+    seed: int = 0
+    window: tuple[int, int] | None = None
+    starting_bankroll: float = 50.0
+
+
+@dataclass(frozen=True)
+class BacktestBatchSummary:
+    """Scenario summaries in input order plus pooled aggregates."""
+
+    summaries: tuple[BacktestSummary, ...]
+    total_trades_executed: int
+    approved_trades: int
+    total_pnl: float
+    mean_final_bankroll: float
+    worst_drawdown_pct: float
+    ruin_count: int
+    workers: int
+    elapsed_seconds: float
+    trades_per_second: float
+
+    @classmethod
+    def merge(
+        cls, summaries: Sequence[BacktestSummary], workers: int, elapsed_seconds: float
+    ) -> "BacktestBatchSummary":
+        executed = sum(s.total_trades_executed for s in summaries)
+        return cls(
+            summaries=tuple(summaries),
+            total_trades_executed=executed,
+            approved_trades=sum(s.approved_trades for s in summaries),
+            total_pnl=round(sum(s.total_pnl for s in summaries), 4),
+            mean_final_bankroll=round(sum(s.final_bankroll for s in summaries) / len(summaries), 4) if summaries else 0.0,
+            worst_drawdown_pct=max((s.max_drawdown_pct for s in summaries), default=0.0),
+            ruin_count=sum(int(s.ruin_detected) for s in summaries),
+            workers=workers,
+            elapsed_seconds=round(elapsed_seconds, 3),
+            trades_per_second=round(executed / elapsed_seconds, 1) if elapsed_seconds > 0 else 0.0,
+        )
 
 
 class BacktestHarness:
     """Runs deterministic replay-style paper-trade simulation batches."""
 
-    def __init__(self) -> None:
-        self.engine = PhaseBAnalysisEngine()
-        self.risk = RiskGateway()
+    def __init__(
+        self,
+        snapshot_store: ColumnarSnapshotStore | None = None,
+        params: StrategyParameters | None = None,
+        *,
+        upstream_cache: dict | None = None,
+        stress_tester: MonteCarloStressTester | None = None,
+        edge_gate: bool = False,
+    ) -> None:
+        """``edge_gate=True`` skips snapshots whose edge decision is HOLD under ``params``.
+
+        By default every snapshot is paper-traded through risk (the >=100-trade
+        exercise); parameter sweeps enable the gate so edge thresholds take effect.
+        """
+        # The harness risk-checks every trade itself; analysis only supplies the proposal.
+        self.engine = PhaseBAnalysisEngine(mode="diagnostics", params=params, upstream_cache=upstream_cache)
+        self.risk = RiskGateway(params=params, stress_tester=stress_tester)
         self.trader = PaperTrader()
+        self.snapshot_store = snapshot_store
+        self.params = params
+        self.edge_gate = edge_gate
 
     def run(self, trades: int = 100) -> BacktestSummary:
-        snapshots = fetch_price_snapshots()
-        tracker = BankrollTracker(starting_bankroll=50.0)
+        return self.run_scenario(BacktestScenario(trades=trades), codex_summary=True)
+
+    def run_scenario(self, scenario: BacktestScenario, codex_summary: bool = False) -> BacktestSummary:
+        snapshots = self._base_snapshots()
+        if scenario.window is not None:
+            snapshots = snapshots[scenario.window[0] : scenario.window[1]]
+            if not snapshots:
+                raise ValueError(f"Scenario {scenario.name!r} window {scenario.window} selects no snapshots")
+        tracker = BankrollTracker(
+            starting_bankroll=scenario.starting_bankroll,
+            kelly_base_multiplier=self.params.kelly_base_multiplier if self.params else None,
+        )
         executed = 0
         approved = 0
 
-        for idx in range(trades):
+        for step in range(scenario.trades):
+            idx = step + scenario.seed
             snapshot = self._derive_snapshot(snapshots[idx % len(snapshots)], idx)
-            analysis = self.engine.analyze_snapshot(snapshot)
-            entry = analysis.paper_trade_proposal.entry_price_cents
-            assessment = self.risk.assess_trade(
-                bankroll_tracker=tracker,
-                probability_yes=analysis.probability_estimate.ensemble_yes,
-                entry_price_cents=entry,
-                active_exposure=0.0,
-            )
-            result: PaperTradeResult = self.trader.run_single_simulation(
-                analysis, assessment, tracker, log_i_message_stub=False
-            )
+            result = self.simulate_trade(snapshot, tracker)
+            if result.side == "HOLD" and self.edge_gate:
+                continue
             executed += 1
             approved += int(result.approved and result.simulated_trade is not None)
 
             if tracker.current_bankroll <= 0:
                 break
 
-        codex_notes = self._optional_codex_summary(executed, tracker)
+        codex_notes = self._optional_codex_summary(executed, tracker) if codex_summary else None
         return BacktestSummary(
-            total_trades_requested=trades,
+            total_trades_requested=scenario.trades,
             total_trades_executed=executed,
             approved_trades=approved,
             final_bankroll=round(tracker.current_bankroll, 4),
@@ -67,23 +148,81 @@ class BacktestHarness:
             max_drawdown_pct=tracker.max_drawdown_pct,
             ruin_detected=tracker.current_bankroll <= 0,
             codex_notes=codex_notes,
+            scenario=scenario.name,
         )
 
+    def simulate_trade(self, snapshot: PriceSnapshot, tracker: BankrollTracker) -> PaperTradeResult:
+        """Analysis → risk → paper trade for one snapshot, applying PnL to ``tracker``."""
+        analysis = self.engine.analyze_snapshot(snapshot)
+        if self.edge_gate and analysis.edge_decision.side == "HOLD":
+            return PaperTradeResult(
+                ticker=analysis.ticker,
+                side="HOLD",
+                approved=False,
+                risk=analysis.risk_assessment,
+                simulated_trade=None,
+                bankroll_after=tracker.current_bankroll,
+            )
+        assessment = self.risk.assess_trade(
+            bankroll_tracker=tracker,
+            probability_yes=analysis.probability_estimate.ensemble_yes,
+            entry_price_cents=analysis.paper_trade_proposal.entry_price_cents,
+            active_exposure=0.0,
+        )
+        return self.trader.run_single_simulation(analysis, assessment, tracker, log_i_message_stub=False)
+
+    def run_scenarios(
+        self, scenarios: Sequence[BacktestScenario], max_workers: int | None = None
+    ) -> BacktestBatchSummary:
+        """Run scenarios across a process pool; ``max_workers=1`` runs them in this process."""
+        scenarios = list(scenarios)
+        workers = max_workers or Config.BACKTEST_WORKERS or os.cpu_count() or 1
+        workers = max(1, min(workers, len(scenarios) or 1))
+        started = time.perf_counter()
+        if workers == 1:
+            summaries = [self.run_scenario(scenario) for scenario in scenarios]
+        else:
+            store_root = self.snapshot_store.root if self.snapshot_store is not None else None
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(store_root, *self.worker_config())
+            ) as pool:
+                # map() yields in submission order, keeping the merge deterministic.
+                summaries = list(pool.map(_run_worker_scenario, scenarios))
+        return BacktestBatchSummary.merge(summaries, workers, time.perf_counter() - started)
+
+    def worker_config(self) -> tuple[StrategyParameters | None, dict, bool]:
+        """Picklable settings that rebuild an equivalent harness in a worker process."""
+        tester = self.risk.stress_tester
+        stress = {
+            "engine": tester.engine,
+            "mode": tester.mode,
+            "cache_size": tester.cache.max_size,
+            "cache_ttl_seconds": tester.cache.ttl_seconds,
+        }
+        return self.params, stress, self.edge_gate
+
+    def _base_snapshots(self) -> list[PriceSnapshot]:
+        """Latest stored snapshot per ticker when a store is attached, else Phase A mocks."""
+        if self.snapshot_store is not None:
+            stored = [self.snapshot_store.latest(ticker) for ticker in self.snapshot_store.tickers()]
+            stored = [snapshot for snapshot in stored if snapshot is not None]
+            if stored:
+                return stored
+        return fetch_price_snapshots()
+
     @staticmethod
     def _derive_snapshot(base: PriceSnapshot, idx: int) -> PriceSnapshot:
         """Create slight deterministic perturbations for replay diversity."""
         shift = (idx % 5) - 2
         yes_ask = min(99, max(1, base.yes_ask + shift))
         no_ask = min(99, max(1, 100 - yes_ask))
-        return PriceSnapshot(
-            ticker=base.ticker,
-            timestamp=base.timestamp,
+        return replace(
+            base,
             yes_bid=max(1, yes_ask - 2),
             yes_ask=yes_ask,
             no_bid=max(1, no_ask - 2),
             no_ask=no_ask,
             volume=base.volume + (idx * 11),
-            open_interest=base.open_interest,
         )
 
     @staticmethod
@@ -94,3 +233,27 @@ class BacktestHarness:
             f"trades={executed}, final_bankroll={tracker.current_bankroll:.2f}, drawdown_pct={tracker.max_drawdown_pct:.2f}."
         )
         return client.generate_text(prompt, max_tokens=80) if client.is_available() else None
+
+
+_WORKER_HARNESS: BacktestHarness | None = None
+
+
+def _init_worker(
+    store_root: Path | None,
+    params: StrategyParameters | None = None,
+    stress: dict | None = None,
+    edge_gate: bool = False,
+) -> None:
+    """Build one harness (engine, risk gateway, caches) per worker process."""
+    global _WORKER_HARNESS
+    store = ColumnarSnapshotStore(store_root) if store_root is not None else None
+    _WORKER_HARNESS = BacktestHarness(
+        snapshot_store=store,
+        params=params,
+        stress_tester=MonteCarloStressTester(**stress) if stress is not None else None,
+        edge_gate=edge_gate,
+    )
+
+
+def _run_worker_scenario(scenario: BacktestScenario) -> BacktestSummary:
+    return _WORKER_HARNESS.run_scenario(scenario)
@@ -1,18 +1,28 @@
 """Kalshi demo API connector for paper trading workflows.
 
 Uses demo credentials from environment when available. Falls back to Phase A mock data
-for offline/local deterministic operation.
+for offline/local deterministic operation. Market reads share one pooled
+keep-alive session with retry/backoff on transient failures.
+
+Bulk refreshes use the paginated ``/markets`` listing: requested tickers are
+split into chunks that are fetched concurrently (bounded by
+``KALSHI_FETCH_CONCURRENCY``), each chunk following its own cursor chain.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
-from typing import Any
+import time
+from typing import Any, Iterable
 
 import requests
 
 from Phase_A.data_fetcher import fetch_price_snapshots
 from Shared.config import Config
+from Shared.http_client import LatencySnapshot, PooledHttpClient
+from Shared.models import PriceSnapshot
+from Shared.time_utils import epoch_ms_to_iso
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +38,39 @@ class DemoKalshiConnector:
     """Read-only connector for demo exchange market snapshots."""
 
     base_url: str = "https://demo-api.kalshi.co/trade-api/v2"
-
-    def __init__(self) -> None:
+    market_timeout_s: float = 10.0
+    tickers_per_request: int = 100
+    max_pages: int = 1_000
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        client: PooledHttpClient | None = None,
+        mock_fallback: bool = True,
+    ) -> None:
+        """``mock_fallback=False`` makes bulk fetches raise on transport errors instead of
+        returning mock snapshots (ingestion must never publish mocks as exchange data)."""
+        self.mock_fallback = mock_fallback
         self.api_key = Config.DEMO_KALSHI_API_KEY
         self.api_secret = Config.DEMO_KALSHI_API_SECRET
+        if base_url:
+            self.base_url = base_url
+        self.client = client or PooledHttpClient(
+            self.base_url,
+            default_timeout_s=self.market_timeout_s,
+            endpoint_timeouts={"GET /markets/{ticker}": self.market_timeout_s, "GET /markets": self.market_timeout_s},
+        )
+        self._mock_snapshots: dict[str, PriceSnapshot] | None = None
 
     def credentials_status(self) -> DemoCredentialsStatus:
         return DemoCredentialsStatus(api_key_set=bool(self.api_key), api_secret_set=bool(self.api_secret))
 
+    def latency_stats(self) -> dict[str, LatencySnapshot]:
+        return self.client.latency_stats()
+
+    def close(self) -> None:
+        self.client.close()
+
     def fetch_market_snapshot(self, ticker: str) -> dict[str, Any]:
         """Fetch one market from demo API; fallback to local mock snapshot if unavailable."""
         try:
@@ -45,8 +80,7 @@ class DemoKalshiConnector:
         except requests.RequestException as exc:
             logger.warning("Demo API unavailable for %s; using mock snapshot. error=%s", ticker, exc)
 
-        snapshot_lookup = {s.ticker: s for s in fetch_price_snapshots()}
-        snap = snapshot_lookup.get(ticker)
+        snap = self._mock_lookup().get(ticker)
         if not snap:
             raise ValueError(f"Ticker not found in demo or local fallback: {ticker}")
 
@@ -62,32 +96,143 @@ class DemoKalshiConnector:
         }
 
     def _fetch_remote_market(self, ticker: str) -> dict[str, Any] | None:
-        endpoint = f"{self.base_url}/markets/{ticker}"
         headers = {}
         if self.api_key:
             headers["KALSHI-ACCESS-KEY"] = self.api_key
 
-        response = requests.get(endpoint, timeout=10, headers=headers)
+        response = self.client.get(f"/markets/{ticker}", endpoint="/markets/{ticker}", headers=headers)
         if response.status_code >= 400:
             return None
 
         payload = response.json()
         market = payload.get("market") or payload
-        yes_ask = market.get("yes_ask") or market.get("yes_ask_price")
-        no_ask = market.get("no_ask") or market.get("no_ask_price")
-        yes_bid = market.get("yes_bid") or market.get("yes_bid_price")
-        no_bid = market.get("no_bid") or market.get("no_bid_price")
-
-        if yes_ask is None or no_ask is None:
+        prices = _market_prices(market)
+        if prices is None:
             return None
 
         return {
             "ticker": ticker,
-            "yes_ask": float(yes_ask),
-            "no_ask": float(no_ask),
-            "yes_bid": float(yes_bid or max(0.0, yes_ask - 2)),
-            "no_bid": float(no_bid or max(0.0, no_ask - 2)),
+            **prices,
             "volume": int(market.get("volume", 0)),
             "open_interest": int(market.get("open_interest", 0)),
             "source": "demo_api",
         }
+
+    def fetch_market_snapshots(
+        self,
+        tickers: Iterable[str] | None = None,
+        *,
+        status: str | None = None,
+        event_ticker: str | None = None,
+        series_ticker: str | None = None,
+        page_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> list[PriceSnapshot]:
+        """Bulk snapshots from the paginated ``/markets`` listing.
+
+        With ``tickers`` the result follows the requested order; tickers the API does
+        not return are omitted. Without ``tickers`` the filters select the universe.
+        Chunks that fail fall back to the local mock snapshots unless
+        ``mock_fallback`` is off, in which case the transport error is raised.
+        """
+        filters = {"status": status, "event_ticker": event_ticker, "series_ticker": series_ticker}
+        filters = {key: value for key, value in filters.items() if value}
+        filters["limit"] = page_size or Config.KALSHI_MARKETS_PAGE_SIZE
+
+        requested = list(dict.fromkeys(tickers)) if tickers is not None else None
+        if requested is None:
+            chunks: list[list[str] | None] = [None]
+        else:
+            size = max(self.tickers_per_request, 1)
+            chunks = [requested[i : i + size] for i in range(0, len(requested), size)]
+        if not chunks:
+            return []
+
+        workers = max(1, min(max_workers or Config.KALSHI_FETCH_CONCURRENCY, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="demo-markets") as pool:
+            pages = list(pool.map(lambda chunk: self._fetch_chunk(chunk, filters), chunks))
+
+        by_ticker: dict[str, PriceSnapshot] = {}
+        for chunk_snapshots in pages:
+            for snapshot in chunk_snapshots:
+                by_ticker[snapshot.ticker] = snapshot
+        if requested is None:
+            return list(by_ticker.values())
+        return [by_ticker[ticker] for ticker in requested if ticker in by_ticker]
+
+    def _fetch_chunk(self, chunk: list[str] | None, filters: dict[str, Any]) -> list[PriceSnapshot]:
+        try:
+            return self._fetch_market_pages({**filters, **({"tickers": ",".join(chunk)} if chunk else {})})
+        except requests.RequestException as exc:
+            if not self.mock_fallback:
+                raise
+            logger.warning("Demo markets listing unavailable; using mock snapshots. error=%s", exc)
+        mocks = self._mock_lookup()
+        if chunk is None:
+            return list(mocks.values())
+        return [mocks[ticker] for ticker in chunk if ticker in mocks]
+
+    def _fetch_market_pages(self, params: dict[str, Any]) -> list[PriceSnapshot]:
+        headers = {}
+        if self.api_key:
+            headers["KALSHI-ACCESS-KEY"] = self.api_key
+
+        snapshots: list[PriceSnapshot] = []
+        seen_cursors: set[str] = set()
+        cursor: str | None = None
+        for _ in range(self.max_pages):
+            page_params = {**params, **({"cursor": cursor} if cursor else {})}
+            response = self.client.get("/markets", endpoint="/markets", params=page_params, headers=headers)
+            response.raise_for_status()
+            payload = response.json()
+            now_ms = int(time.time() * 1000)
+            timestamp = epoch_ms_to_iso(now_ms)
+            for market in payload.get("markets") or []:
+                snapshot = _snapshot_from_market(market, timestamp, now_ms)
+                if snapshot is not None:
+                    snapshots.append(snapshot)
+
+            cursor = payload.get("cursor") or None
+            # A repeated cursor would loop forever; treat it as the end of the listing.
+            if not cursor or cursor in seen_cursors:
+                break
+            seen_cursors.add(cursor)
+        return snapshots
+
+    def _mock_lookup(self) -> dict[str, PriceSnapshot]:
+        if self._mock_snapshots is None:
+            self._mock_snapshots = {snap.ticker: snap for snap in fetch_price_snapshots()}
+        return self._mock_snapshots
+
+
+def _market_prices(market: dict[str, Any]) -> dict[str, float] | None:
+    yes_ask = market.get("yes_ask") or market.get("yes_ask_price")
+    no_ask = market.get("no_ask") or market.get("no_ask_price")
+    yes_bid = market.get("yes_bid") or market.get("yes_bid_price")
+    no_bid = market.get("no_bid") or market.get("no_bid_price")
+
+    if yes_ask is None or no_ask is None:
+        return None
+
+    return {
+        "yes_ask": float(yes_ask),
+        "no_ask": float(no_ask),
+        "yes_bid": float(yes_bid or max(0.0, yes_ask - 2)),
+        "no_bid": float(no_bid or max(0.0, no_ask - 2)),
+    }
+
+
+def _snapshot_from_market(
+    market: dict[str, Any], timestamp: str, timestamp_ms: int | None = None
+) -> PriceSnapshot | None:
+    prices = _market_prices(market)
+    if prices is None or not market.get("ticker"):
+        return None
+    return PriceSnapshot(
+        ticker=market["ticker"],
+        timestamp=timestamp,
+        timestamp_ms=timestamp_ms,
+        volume=int(market.get("volume") or 0),
+        open_interest=int(market.get("open_interest") or 0),
+        **prices,
+    )
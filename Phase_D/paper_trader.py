@@ -32,17 +32,17 @@ class PaperTrader:
     ) -> PaperTradeResult:
         if log_i_message_stub:
             proposal = IMessageProposal(
-                ticker=analysis.signal.ticker,
+                ticker=analysis.ticker,
                 side=analysis.paper_trade_proposal.side,
                 stake_dollars=risk.proposed_stake,
-                rationale=analysis.signal.explanation.splitlines()[0],
+                rationale=analysis.explanation.splitlines()[0],
             )
             log_proposal(proposal)
 
         simulated: SimulatedTrade | None = None
         if risk.approved and analysis.paper_trade_proposal.side in {"YES", "NO"}:
             simulated = TradeSimulator.simulate_resolution(
-                ticker=analysis.signal.ticker,
+                ticker=analysis.ticker,
                 side=analysis.paper_trade_proposal.side,
                 stake_dollars=risk.proposed_stake,
                 entry_price_cents=analysis.paper_trade_proposal.entry_price_cents,
@@ -51,7 +51,7 @@ class PaperTrader:
             bankroll_tracker.apply_pnl(simulated.pnl_dollars)
 
         return PaperTradeResult(
-            ticker=analysis.signal.ticker,
+            ticker=analysis.ticker,
             side=analysis.paper_trade_proposal.side,
             approved=risk.approved,
             risk=risk,
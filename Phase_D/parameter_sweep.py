@@ -0,0 +1,176 @@
+"""Grid sweeps over edge and sizing thresholds for the backtest harness.
+
+Every grid point is an immutable :class:`StrategyParameters` handed to its own
+:class:`BacktestHarness`, so ``Config`` is never mutated and points can run side
+by side. Harnesses gate on the edge decision: snapshots that are HOLD under a
+point's edge thresholds are not traded. Points are split into contiguous chunks
+across a process pool. Within a chunk, all harnesses share one upstream cache
+(anchors, probability estimates and confidence do not depend on the swept
+thresholds), cleared per chunk so it never outgrows one scenario, and each
+worker keeps one stress tester whose LRU cache serves every point. Results keep
+grid order and can be written as a compact CSV table.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, fields, replace
+import itertools
+import os
+from pathlib import Path
+import time
+from typing import Mapping, Sequence
+
+from Phase_C.monte_carlo_stress import MonteCarloStressTester
+from Phase_D.backtest_harness import BacktestHarness, BacktestScenario
+from Shared.config import Config, StrategyParameters
+from Shared.snapshot_store import ColumnarSnapshotStore
+
+SWEEP_PARAMETERS = tuple(f.name for f in fields(StrategyParameters))
+RESULT_COLUMNS = SWEEP_PARAMETERS + (
+    "trades",
+    "approved_trades",
+    "final_bankroll",
+    "total_pnl",
+    "max_drawdown_pct",
+    "ruin_detected",
+)
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    params: StrategyParameters
+    trades: int
+    approved_trades: int
+    final_bankroll: float
+    total_pnl: float
+    max_drawdown_pct: float
+    ruin_detected: bool
+
+    def row(self) -> tuple:
+        return tuple(getattr(self.params, name) for name in SWEEP_PARAMETERS) + (
+            self.trades,
+            self.approved_trades,
+            self.final_bankroll,
+            self.total_pnl,
+            self.max_drawdown_pct,
+            self.ruin_detected,
+        )
+
+
+@dataclass(frozen=True)
+class SweepReport:
+    results: tuple[SweepResult, ...]
+    workers: int
+    elapsed_seconds: float
+    points_per_second: float
+
+    def best(self, metric: str = "total_pnl") -> SweepResult:
+        return max(self.results, key=lambda result: getattr(result, metric))
+
+    def write_csv(self, path: str | Path) -> Path:
+        path = Path(path)
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(RESULT_COLUMNS)
+            writer.writerows(result.row() for result in self.results)
+        return path
+
+
+def expand_grid(
+    grid: Mapping[str, Sequence[float]], base: StrategyParameters | None = None
+) -> list[StrategyParameters]:
+    """Cartesian product of ``grid`` over ``base`` (default: current ``Config``).
+
+    Points are ordered with edge thresholds varying slowest, so contiguous chunks
+    share edge settings.
+    """
+    unknown = set(grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    base = base or StrategyParameters.from_config()
+    names = [name for name in SWEEP_PARAMETERS if name in grid]
+    return [replace(base, **dict(zip(names, values))) for values in itertools.product(*(grid[n] for n in names))]
+
+
+class ParameterSweepRunner:
+    """Run one backtest scenario per grid point across worker processes."""
+
+    def __init__(
+        self,
+        scenario: BacktestScenario | None = None,
+        max_workers: int | None = None,
+        snapshot_store: ColumnarSnapshotStore | None = None,
+    ) -> None:
+        self.scenario = scenario or BacktestScenario(name="sweep")
+        self.max_workers = max_workers
+        self.snapshot_store = snapshot_store
+
+    def run(self, grid: Mapping[str, Sequence[float]] | Sequence[StrategyParameters]) -> SweepReport:
+        points = expand_grid(grid) if isinstance(grid, Mapping) else list(grid)
+        workers = self.max_workers or Config.BACKTEST_WORKERS or os.cpu_count() or 1
+        workers = max(1, min(workers, len(points) or 1))
+        store_root = self.snapshot_store.root if self.snapshot_store is not None else None
+        started = time.perf_counter()
+        if workers == 1:
+            _init_worker(store_root)
+            results = _run_chunk((self.scenario, points))
+        else:
+            size = -(-len(points) // workers)
+            chunks = [(self.scenario, points[i : i + size]) for i in range(0, len(points), size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(store_root,)) as pool:
+                results = [result for chunk in pool.map(_run_chunk, chunks) for result in chunk]
+        elapsed = time.perf_counter() - started
+        return SweepReport(
+            results=tuple(results),
+            workers=workers,
+            elapsed_seconds=round(elapsed, 3),
+            points_per_second=round(len(results) / elapsed, 1) if elapsed > 0 else 0.0,
+        )
+
+
+@dataclass
+class _WorkerState:
+    store: ColumnarSnapshotStore | None
+    upstream_cache: dict
+    stress_tester: MonteCarloStressTester
+
+
+_WORKER: _WorkerState | None = None
+
+
+def _init_worker(store_root: Path | None) -> None:
+    global _WORKER
+    _WORKER = _WorkerState(
+        store=ColumnarSnapshotStore(store_root) if store_root is not None else None,
+        upstream_cache={},
+        stress_tester=MonteCarloStressTester(),
+    )
+
+
+def _run_chunk(task: tuple[BacktestScenario, list[StrategyParameters]]) -> list[SweepResult]:
+    scenario, points = task
+    # Entries are only reused within one scenario's snapshots; keep worker memory bounded.
+    _WORKER.upstream_cache.clear()
+    results = []
+    for params in points:
+        harness = BacktestHarness(
+            _WORKER.store,
+            params,
+            upstream_cache=_WORKER.upstream_cache,
+            stress_tester=_WORKER.stress_tester,
+            edge_gate=True,
+        )
+        summary = harness.run_scenario(scenario)
+        results.append(
+            SweepResult(
+                params=params,
+                trades=summary.total_trades_executed,
+                approved_trades=summary.approved_trades,
+                final_bankroll=summary.final_bankroll,
+                total_pnl=summary.total_pnl,
+                max_drawdown_pct=summary.max_drawdown_pct,
+                ruin_detected=summary.ruin_detected,
+            )
+        )
+    return results
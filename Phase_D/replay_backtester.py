@@ -0,0 +1,297 @@
+"""Historical replay backtester over stored price snapshots.
+
+Snapshots stream in event-time order from the Phase A ``price_snapshots`` table
+(:class:`SqliteSnapshotSource`) or an exported JSON-lines file
+(:class:`JsonLinesSnapshotSource`). Each snapshot goes through the same
+analysis → risk → paper-trader step as :class:`BacktestHarness`. Sources read
+in fixed-size batches, so memory stays flat however long the replay is.
+
+An :class:`EventClock` driven by snapshot timestamps resets daily and weekly
+loss counters at UTC day and ISO-week boundaries. Progress is checkpointed to a
+JSON file every ``checkpoint_every`` snapshots; rerunning with the same
+checkpoint path resumes after the last recorded snapshot.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import itertools
+import json
+import os
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any, Iterator, Protocol
+
+from Phase_A.logger import connect_reader, iter_snapshot_rows
+from Phase_D.backtest_harness import BacktestHarness
+from Shared.bankroll_tracker import BankrollTracker
+from Shared.models import PriceSnapshot
+from Shared.time_utils import epoch_ms_to_iso, iso_to_epoch_ms
+
+Cursor = Any  # JSON-serializable source position of the last snapshot replayed
+
+
+class SnapshotSource(Protocol):
+    """Time-ordered snapshots in ``[start_ms, end_ms)``, each tagged with a resumable cursor."""
+
+    def iter_from(
+        self, cursor: Cursor | None, start_ms: int | None, end_ms: int | None
+    ) -> Iterator[tuple[Cursor, PriceSnapshot]]: ...
+
+
+@dataclass
+class SqliteSnapshotSource:
+    """Stream ``price_snapshots`` ordered by ``(timestamp_ms, id)`` in ``batch_size`` chunks.
+
+    The database is migrated first, so the window, cursor and ordering are all
+    served by each snapshot table's ``(timestamp_ms, id)`` index with integer
+    comparisons; monthly partitions are merged in order.
+    """
+
+    db_path: str | Path
+    batch_size: int = 5_000
+
+    def iter_from(
+        self, cursor: Cursor | None, start_ms: int | None, end_ms: int | None
+    ) -> Iterator[tuple[Cursor, PriceSnapshot]]:
+        clauses = ["timestamp_ms IS NOT NULL"]
+        params: list[Any] = []
+        if cursor is not None:
+            event_ms, row_id = cursor
+            if isinstance(event_ms, str):  # checkpoint written before the epoch-ms schema
+                event_ms = iso_to_epoch_ms(event_ms)
+            clauses.append("(timestamp_ms, id) > (?, ?)")
+            params.extend([event_ms, row_id])
+        if start_ms is not None:
+            clauses.append("timestamp_ms >= ?")
+            params.append(start_ms)
+        if end_ms is not None:
+            clauses.append("timestamp_ms < ?")
+            params.append(end_ms)
+
+        conn = connect_reader(str(self.db_path))
+        try:
+            rows = iter_snapshot_rows(
+                conn,
+                f"""
+                SELECT id, ticker, timestamp, timestamp_ms, yes_bid, yes_ask, no_bid, no_ask, volume, open_interest
+                FROM {{table}}
+                WHERE {' AND '.join(clauses)}
+                ORDER BY timestamp_ms ASC, id ASC
+                """,
+                params,
+                key=lambda row: (row[3], row[0]),
+            )
+            while batch := list(itertools.islice(rows, self.batch_size)):
+                for row in batch:
+                    yield [row[3], row[0]], PriceSnapshot(
+                        ticker=row[1],
+                        timestamp=row[2],
+                        timestamp_ms=row[3],
+                        yes_bid=row[4],
+                        yes_ask=row[5],
+                        no_bid=row[6],
+                        no_ask=row[7],
+                        volume=row[8] or 0,
+                        open_interest=row[9] or 0,
+                    )
+        finally:
+            conn.close()
+
+
+@dataclass
+class JsonLinesSnapshotSource:
+    """Exported snapshots, one ``PriceSnapshot`` JSON object per line, already time-ordered."""
+
+    path: str | Path
+
+    def iter_from(
+        self, cursor: Cursor | None, start_ms: int | None, end_ms: int | None
+    ) -> Iterator[tuple[Cursor, PriceSnapshot]]:
+        skip_through = -1 if cursor is None else int(cursor)
+        with Path(self.path).open(encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle):
+                if line_number <= skip_through or not line.strip():
+                    continue
+                snapshot = PriceSnapshot(**json.loads(line))
+                event_ms = snapshot.require_timestamp_ms()
+                if start_ms is not None and event_ms < start_ms:
+                    continue
+                if end_ms is not None and event_ms >= end_ms:
+                    return
+                yield line_number, snapshot
+
+
+class EventClock:
+    """Replay time; advances only forward and reports UTC day / ISO-week rollovers."""
+
+    def __init__(self, now_ms: int | None = None) -> None:
+        self.now_ms = now_ms
+
+    def advance(self, event_ms: int) -> tuple[bool, bool]:
+        """Move to ``event_ms``; returns ``(new_day, new_week)``."""
+        if self.now_ms is not None and event_ms < self.now_ms:
+            raise ValueError(
+                f"Replay snapshots out of order: {epoch_ms_to_iso(event_ms)} after {epoch_ms_to_iso(self.now_ms)}"
+            )
+        previous, self.now_ms = self.now_ms, event_ms
+        if previous is None:
+            return False, False
+        before, after = _utc(previous), _utc(event_ms)
+        return before.date() != after.date(), before.isocalendar()[:2] != after.isocalendar()[:2]
+
+
+@dataclass
+class ReplayCheckpoint:
+    """Everything needed to continue a replay after the snapshot at ``cursor``."""
+
+    cursor: Cursor | None = None
+    clock_ms: int | None = None
+    snapshots_replayed: int = 0
+    trades_executed: int = 0
+    approved_trades: int = 0
+    tracker: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "ReplayCheckpoint | None":
+        if not path.exists():
+            return None
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, path: Path) -> None:
+        # Write-then-rename so an interrupted run never leaves a torn checkpoint.
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+@dataclass(frozen=True)
+class ReplaySummary:
+    snapshots_replayed: int
+    trades_executed: int
+    approved_trades: int
+    final_bankroll: float
+    total_pnl: float
+    max_drawdown_pct: float
+    ruin_detected: bool
+    first_event: str | None
+    last_event: str | None
+    resumed: bool
+    completed: bool
+    elapsed_seconds: float
+    trades_per_second: float
+
+
+class ReplayBacktester:
+    """Drive stored snapshots through the paper-trading pipeline with an event clock."""
+
+    def __init__(
+        self,
+        source: SnapshotSource,
+        harness: BacktestHarness | None = None,
+        starting_bankroll: float = 50.0,
+        checkpoint_path: str | Path | None = None,
+        checkpoint_every: int = 1_000,
+    ) -> None:
+        self.source = source
+        self.harness = harness or BacktestHarness()
+        self.starting_bankroll = starting_bankroll
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self.checkpoint_every = checkpoint_every
+
+    def run(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        max_snapshots: int | None = None,
+    ) -> ReplaySummary:
+        """Replay ``[start, end)`` (ISO-8601); ``max_snapshots`` stops early with a checkpoint."""
+        start_ms = iso_to_epoch_ms(start) if start else None
+        end_ms = iso_to_epoch_ms(end) if end else None
+        checkpoint = ReplayCheckpoint.load(self.checkpoint_path) if self.checkpoint_path else None
+        resumed = checkpoint is not None
+        checkpoint = checkpoint or ReplayCheckpoint()
+        tracker = self._restore_tracker(checkpoint.tracker)
+        clock = EventClock(checkpoint.clock_ms)
+        first_event: str | None = None
+        replayed_this_run = 0
+        trades_this_run = 0
+        completed = True
+        started = time.perf_counter()
+
+        for cursor, snapshot in self.source.iter_from(checkpoint.cursor, start_ms, end_ms):
+            if max_snapshots is not None and replayed_this_run >= max_snapshots:
+                completed = False
+                break
+            new_day, new_week = clock.advance(snapshot.timestamp_ms)
+            if new_day:
+                tracker.daily_loss = 0.0
+            if new_week:
+                tracker.weekly_loss = 0.0
+            first_event = first_event or snapshot.timestamp
+
+            if tracker.current_bankroll > 0:
+                result = self.harness.simulate_trade(snapshot, tracker)
+                checkpoint.trades_executed += 1
+                trades_this_run += 1
+                checkpoint.approved_trades += int(result.approved and result.simulated_trade is not None)
+
+            checkpoint.cursor = cursor
+            checkpoint.clock_ms = clock.now_ms
+            checkpoint.snapshots_replayed += 1
+            replayed_this_run += 1
+            if self.checkpoint_path and replayed_this_run % self.checkpoint_every == 0:
+                self._save(checkpoint, tracker)
+
+        if self.checkpoint_path:
+            self._save(checkpoint, tracker)
+        elapsed = time.perf_counter() - started
+        return ReplaySummary(
+            snapshots_replayed=checkpoint.snapshots_replayed,
+            trades_executed=checkpoint.trades_executed,
+            approved_trades=checkpoint.approved_trades,
+            final_bankroll=round(tracker.current_bankroll, 4),
+            total_pnl=round(tracker.current_bankroll - tracker.starting_bankroll, 4),
+            max_drawdown_pct=tracker.max_drawdown_pct,
+            ruin_detected=tracker.current_bankroll <= 0,
+            first_event=first_event,
+            last_event=epoch_ms_to_iso(clock.now_ms) if clock.now_ms is not None else None,
+            resumed=resumed,
+            completed=completed,
+            elapsed_seconds=round(elapsed, 3),
+            trades_per_second=round(trades_this_run / elapsed, 1) if elapsed > 0 else 0.0,
+        )
+
+    def _restore_tracker(self, state: dict[str, float]) -> BankrollTracker:
+        tracker = BankrollTracker(starting_bankroll=state.get("starting_bankroll", self.starting_bankroll))
+        for name in ("realized_pnl", "daily_loss", "weekly_loss", "max_drawdown_pct"):
+            setattr(tracker, name, state.get(name, getattr(tracker, name)))
+        tracker._peak_bankroll = state.get("peak_bankroll", tracker.current_bankroll)
+        return tracker
+
+    def _save(self, checkpoint: ReplayCheckpoint, tracker: BankrollTracker) -> None:
+        checkpoint.tracker = {
+            "starting_bankroll": tracker.starting_bankroll,
+            "realized_pnl": tracker.realized_pnl,
+            "daily_loss": tracker.daily_loss,
+            "weekly_loss": tracker.weekly_loss,
+            "max_drawdown_pct": tracker.max_drawdown_pct,
+            "peak_bankroll": tracker._peak_bankroll,
+        }
+        checkpoint.save(self.checkpoint_path)
+
+
+def export_snapshots_jsonl(db_path: str | Path, path: str | Path, batch_size: int = 5_000) -> int:
+    """Export ``price_snapshots`` in replay order to a JSON-lines file."""
+    written = 0
+    with Path(path).open("w", encoding="utf-8") as handle:
+        for _, snapshot in SqliteSnapshotSource(db_path, batch_size).iter_from(None, None, None):
+            handle.write(json.dumps(asdict(snapshot)) + "\n")
+            written += 1
+    return written
+
+
+def _utc(epoch_ms: int) -> datetime:
+    return datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
+
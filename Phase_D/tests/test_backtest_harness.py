@@ -1,5 +1,7 @@
 """Phase D backtest coverage."""
-from Phase_D.backtest_harness import BacktestHarness
+from dataclasses import replace
+
+from Phase_D.backtest_harness import BacktestHarness, BacktestScenario
 
 
 def test_backtest_runs_minimum_100_trades():
@@ -9,3 +11,101 @@ def test_backtest_runs_minimum_100_trades():
     assert summary.approved_trades > 0
     assert summary.final_bankroll > 0
     assert summary.ruin_detected is False
+
+
+def test_parallel_scenarios_match_serial_run_in_order():
+    scenarios = [
+        BacktestScenario(name=f"seed-{seed}", trades=40, seed=seed, window=(0, 2) if seed % 2 else None)
+        for seed in range(4)
+    ]
+    harness = BacktestHarness()
+
+    serial = harness.run_scenarios(scenarios, max_workers=1)
+    parallel = harness.run_scenarios(scenarios, max_workers=2)
+
+    assert parallel.workers == 2
+    assert [s.scenario for s in parallel.summaries] == [s.name for s in scenarios]
+    assert parallel.summaries == serial.summaries
+    assert parallel.total_trades_executed == sum(s.trades for s in scenarios)
+    assert parallel.total_pnl == round(sum(s.total_pnl for s in serial.summaries), 4)
+
+
+def test_default_scenario_matches_run():
+    harness = BacktestHarness()
+    summary = harness.run_scenario(BacktestScenario(trades=30))
+    assert summary == BacktestHarness().run_scenario(BacktestScenario(trades=30))
+    assert summary.final_bankroll == harness.run(trades=30).final_bankroll
+
+
+def test_parameter_sweep_leaves_config_untouched_and_matches_direct_runs(tmp_path):
+    from Phase_D.parameter_sweep import RESULT_COLUMNS, ParameterSweepRunner, expand_grid
+    from Shared.config import Config, StrategyParameters
+
+    before = StrategyParameters.from_config()
+    grid = {
+        "min_ev_threshold": [0.01],
+        "min_confidence": [0.5],
+        "min_confirmations": [0, 4],
+        "kelly_base_multiplier": [0.1, 0.5],
+        "max_trade_risk": [0.25, 1.0],
+    }
+    scenario = BacktestScenario(name="sweep", trades=30)
+
+    serial = ParameterSweepRunner(scenario, max_workers=1).run(grid)
+    parallel = ParameterSweepRunner(scenario, max_workers=2).run(grid)
+
+    assert StrategyParameters.from_config() == before
+    assert [r.params for r in serial.results] == expand_grid(grid)
+    assert parallel.results == serial.results
+    assert len({r.final_bankroll for r in serial.results}) > 1
+
+    point = serial.results[-1]
+    direct = BacktestHarness(params=point.params, edge_gate=True).run_scenario(scenario)
+    assert direct.final_bankroll == point.final_bankroll
+    assert Config.KELLY_BASE_MULTIPLIER == before.kelly_base_multiplier
+
+    table = serial.write_csv(tmp_path / "sweep.csv").read_text().splitlines()
+    assert table[0].split(",") == list(RESULT_COLUMNS)
+    assert len(table) == 1 + len(serial.results)
+
+
+def test_parameter_sweep_edge_thresholds_gate_trades():
+    from Phase_D.parameter_sweep import SWEEP_PARAMETERS, ParameterSweepRunner
+
+    scenario = BacktestScenario(name="edge", trades=60)
+    base = {"min_ev_threshold": [0.01], "min_confidence": [0.5], "min_confirmations": [3]}
+    for axis, values in (("min_ev_threshold", [0.01, 0.10]), ("min_confidence", [0.5, 0.97]), ("min_confirmations", [3, 6])):
+        report = ParameterSweepRunner(scenario, max_workers=1).run({**base, axis: values})
+        assert len({result.row()[len(SWEEP_PARAMETERS) :] for result in report.results}) == 2, axis
+
+
+def test_parallel_scenarios_keep_non_default_params_and_stress_settings():
+    from Phase_C.monte_carlo_stress import MonteCarloStressTester
+    from Shared.config import StrategyParameters
+
+    params = replace(StrategyParameters.from_config(), max_trade_risk=2.0)
+    harness = BacktestHarness(params=params, stress_tester=MonteCarloStressTester(mode="exact", cache_size=0))
+    scenarios = [BacktestScenario(name=f"risk-{seed}", trades=30, seed=seed) for seed in range(2)]
+
+    serial = harness.run_scenarios(scenarios, max_workers=1)
+    parallel = harness.run_scenarios(scenarios, max_workers=2)
+
+    assert parallel.summaries == serial.summaries
+    assert [s.final_bankroll for s in serial.summaries] != [
+        s.final_bankroll for s in BacktestHarness().run_scenarios(scenarios, max_workers=1).summaries
+    ]
+
+
+def test_sweep_worker_upstream_cache_is_cleared_per_chunk():
+    from Phase_D import parameter_sweep
+    from Shared.config import StrategyParameters
+
+    scenario = BacktestScenario(name="cache", trades=5)
+    parameter_sweep._init_worker(None)
+    parameter_sweep._WORKER.upstream_cache["stale"] = ("anchors", "estimate", 0.0)
+
+    parameter_sweep._run_chunk((scenario, [StrategyParameters.from_config()]))
+
+    cache = parameter_sweep._WORKER.upstream_cache
+    assert "stale" not in cache
+    assert 0 < len(cache) <= scenario.trades
@@ -0,0 +1,160 @@
+"""Demo connector tests against a local stand-in HTTP server."""
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from Phase_D.demo_connector import DemoKalshiConnector
+from Shared.http_client import LatencyHistogram, PooledHttpClient
+from Shared.models import PriceSnapshot
+
+UNIVERSE = [
+    {"ticker": f"MKT-{index:03d}", "yes_ask": 40 + index % 10, "no_ask": 62 - index % 10, "volume": index}
+    for index in range(250)
+]
+
+
+class _MarketHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            server.client_ports.add(self.client_address[1])
+        parsed = urlparse(self.path)
+        if parsed.path == "/markets":
+            self._send(200, _list_markets(parse_qs(parsed.query)))
+            return
+        if server.failures_left > 0:
+            server.failures_left -= 1
+            self._send(503, {"error": "busy"})
+            return
+        ticker = self.path.rsplit("/", 1)[-1]
+        if ticker == "MISSING":
+            self._send(404, {"error": "not found"})
+            return
+        self._send(200, {"market": {"yes_ask": 41, "no_ask": 61, "yes_bid": 39, "no_bid": 59, "volume": 7}})
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _list_markets(query: dict[str, list[str]]) -> dict:
+    markets = UNIVERSE
+    if "tickers" in query:
+        wanted = set(query["tickers"][0].split(","))
+        markets = [market for market in markets if market["ticker"] in wanted]
+    offset = int(query.get("cursor", ["0"])[0])
+    limit = int(query["limit"][0])
+    page = markets[offset : offset + limit]
+    cursor = str(offset + limit) if offset + limit < len(markets) else ""
+    return {"markets": page, "cursor": cursor}
+
+
+@pytest.fixture
+def market_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MarketHandler)
+    server.hits = 0
+    server.lock = Lock()
+    server.failures_left = 0
+    server.client_ports = set()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _connector(server) -> DemoKalshiConnector:
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    return DemoKalshiConnector(client=PooledHttpClient(base_url, backoff_s=0.0))
+
+
+def test_demo_connector_reuses_pooled_connection(market_server):
+    connector = _connector(market_server)
+    for _ in range(5):
+        payload = connector.fetch_market_snapshot("FED-RATE-25MAR")
+        assert payload["source"] == "demo_api"
+        assert payload["yes_ask"] == 41.0
+
+    assert market_server.hits == 5
+    assert len(market_server.client_ports) == 1
+    stats = connector.latency_stats()["GET /markets/{ticker}"]
+    assert stats.count == 5
+    assert stats.errors == 0
+    connector.close()
+
+
+def test_demo_connector_retries_transient_get_failures(market_server):
+    market_server.failures_left = 2
+    connector = _connector(market_server)
+
+    payload = connector.fetch_market_snapshot("FED-RATE-25MAR")
+    assert payload["source"] == "demo_api"
+    assert market_server.hits == 3
+    connector.close()
+
+
+def test_demo_connector_falls_back_to_mock_on_client_error(market_server):
+    connector = _connector(market_server)
+    with pytest.raises(ValueError):
+        connector.fetch_market_snapshot("MISSING")
+    assert connector.latency_stats()["GET /markets/{ticker}"].errors == 1
+    connector.close()
+
+
+def test_bulk_fetch_follows_cursors_for_full_universe(market_server):
+    connector = _connector(market_server)
+
+    snapshots = connector.fetch_market_snapshots(page_size=100)
+    assert [s.ticker for s in snapshots] == [m["ticker"] for m in UNIVERSE]
+    assert isinstance(snapshots[0], PriceSnapshot)
+    assert snapshots[3].yes_ask == 43.0
+    assert snapshots[3].yes_bid == 41.0
+    assert market_server.hits == 3
+    connector.close()
+
+
+def test_bulk_fetch_chunks_tickers_concurrently_in_request_order(market_server):
+    connector = _connector(market_server)
+    connector.tickers_per_request = 40
+    tickers = [f"MKT-{index:03d}" for index in range(199, -1, -2)] + ["NOT-LISTED"]
+
+    snapshots = connector.fetch_market_snapshots(tickers, page_size=25, max_workers=3)
+    assert [s.ticker for s in snapshots] == tickers[:-1]
+    # 100 tickers -> chunks of 40/40/21, each paged 25 at a time.
+    assert market_server.hits == 2 + 2 + 1
+    assert connector.latency_stats()["GET /markets"].count == 5
+    connector.close()
+
+
+def test_bulk_fetch_falls_back_to_mocks_when_unreachable():
+    connector = DemoKalshiConnector(client=PooledHttpClient("http://127.0.0.1:9", max_retries=0))
+    snapshots = connector.fetch_market_snapshots(["WEATHER-NYC-SNOW", "MKT-001"])
+    assert [s.ticker for s in snapshots] == ["WEATHER-NYC-SNOW"]
+    connector.close()
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(bounds_ms=(10, 100))
+    for elapsed in (1, 2, 3, 50, 500):
+        histogram.observe(elapsed)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 5
+    assert snapshot.buckets == {"le_10": 3, "le_100": 1, "inf": 1}
+    assert snapshot.p50_ms == 10.0
+    assert snapshot.p95_ms == 500.0
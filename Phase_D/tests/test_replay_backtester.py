@@ -0,0 +1,129 @@
+"""Historical replay backtester coverage."""
+import sqlite3
+
+import pytest
+
+from Phase_A.logger import LogWriter
+from Phase_D.replay_backtester import (
+    EventClock,
+    JsonLinesSnapshotSource,
+    ReplayBacktester,
+    SqliteSnapshotSource,
+    export_snapshots_jsonl,
+)
+from Shared.models import PriceSnapshot
+from Shared.time_utils import epoch_ms_to_iso, iso_to_epoch_ms
+
+HOUR_MS = 3_600_000
+
+
+def _seed_db(path, hours=72):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """CREATE TABLE price_snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT, timestamp TEXT,
+            yes_bid REAL, yes_ask REAL, no_bid REAL, no_ask REAL, volume INTEGER, open_interest INTEGER
+        )"""
+    )
+    start = iso_to_epoch_ms("2026-02-14T00:00:00Z")
+    rows = []
+    for hour in range(hours):
+        timestamp = epoch_ms_to_iso(start + hour * HOUR_MS)
+        yes_ask = 70 + (hour % 7) - 3
+        rows.append(("FED-RATE-25MAR", timestamp, yes_ask - 2, yes_ask, 98 - yes_ask, 100 - yes_ask, 45000, 820000))
+        rows.append(("WEATHER-NYC-SNOW", timestamp, 34, 36 + hour % 3, 62, 64, 8200, 95000))
+    # Insert out of time order; the source must sort.
+    conn.executemany(
+        "INSERT INTO price_snapshots (ticker,timestamp,yes_bid,yes_ask,no_bid,no_ask,volume,open_interest) VALUES (?,?,?,?,?,?,?,?)",
+        list(reversed(rows)),
+    )
+    conn.commit()
+    conn.close()
+    return len(rows)
+
+
+def test_replay_streams_time_ordered_snapshots_and_reports_throughput(tmp_path):
+    db = tmp_path / "replay.db"
+    total = _seed_db(db)
+
+    summary = ReplayBacktester(SqliteSnapshotSource(db, batch_size=16)).run()
+
+    assert summary.snapshots_replayed == total
+    assert summary.trades_executed == total
+    assert summary.first_event == "2026-02-14T00:00:00.000Z"
+    assert summary.last_event == "2026-02-16T23:00:00.000Z"
+    assert summary.completed and not summary.resumed
+    assert summary.trades_per_second > 0
+
+
+def test_replay_time_window_is_half_open(tmp_path):
+    db = tmp_path / "replay.db"
+    _seed_db(db)
+
+    summary = ReplayBacktester(SqliteSnapshotSource(db)).run(
+        start="2026-02-15T00:00:00Z", end="2026-02-15T06:00:00Z"
+    )
+
+    assert summary.snapshots_replayed == 12
+    assert summary.first_event == "2026-02-15T00:00:00.000Z"
+    assert summary.last_event == "2026-02-15T05:00:00.000Z"
+
+
+def test_resumed_replay_matches_uninterrupted_run(tmp_path):
+    db = tmp_path / "replay.db"
+    total = _seed_db(db)
+    baseline = ReplayBacktester(SqliteSnapshotSource(db)).run()
+
+    checkpoint = tmp_path / "replay.ckpt.json"
+    first = ReplayBacktester(SqliteSnapshotSource(db), checkpoint_path=checkpoint, checkpoint_every=10).run(
+        max_snapshots=50
+    )
+    assert first.snapshots_replayed == 50 and not first.completed
+    assert checkpoint.exists()
+
+    resumed = ReplayBacktester(SqliteSnapshotSource(db), checkpoint_path=checkpoint).run()
+
+    assert resumed.resumed and resumed.completed
+    assert resumed.snapshots_replayed == total
+    assert resumed.final_bankroll == baseline.final_bankroll
+    assert resumed.approved_trades == baseline.approved_trades
+    assert resumed.max_drawdown_pct == baseline.max_drawdown_pct
+
+
+def test_jsonl_export_replays_like_sqlite(tmp_path):
+    db = tmp_path / "replay.db"
+    total = _seed_db(db, hours=24)
+    export = tmp_path / "snapshots.jsonl"
+
+    assert export_snapshots_jsonl(db, export) == total
+    from_file = ReplayBacktester(JsonLinesSnapshotSource(export)).run()
+    from_db = ReplayBacktester(SqliteSnapshotSource(db)).run()
+
+    assert from_file.snapshots_replayed == from_db.snapshots_replayed
+    assert from_file.final_bankroll == from_db.final_bankroll
+
+
+def test_event_clock_rolls_days_and_weeks_and_rejects_rewinds():
+    clock = EventClock()
+    assert clock.advance(iso_to_epoch_ms("2026-02-14T23:00:00Z")) == (False, False)
+    assert clock.advance(iso_to_epoch_ms("2026-02-15T01:00:00Z")) == (True, False)  # Sat -> Sun
+    assert clock.advance(iso_to_epoch_ms("2026-02-16T00:00:00Z")) == (True, True)  # Sun -> Mon
+    with pytest.raises(ValueError):
+        clock.advance(iso_to_epoch_ms("2026-02-15T00:00:00Z"))
+
+
+def test_replay_merges_monthly_partitions(tmp_path):
+    db = tmp_path / "replay.db"
+    total = _seed_db(db, hours=24)
+    writer = LogWriter(str(db), batch_size=1000, partitioning="monthly")
+    start = iso_to_epoch_ms("2026-02-28T20:00:00Z")
+    writer.add_snapshots(
+        PriceSnapshot("FED-RATE-25MAR", epoch_ms_to_iso(start + hour * HOUR_MS), 68, 70, 28, 30, 45000, 820000)
+        for hour in range(8)
+    )
+    writer.close()
+
+    events = [snapshot.timestamp_ms for _, snapshot in SqliteSnapshotSource(db, batch_size=7).iter_from(None, None, None)]
+
+    assert len(events) == total + 8
+    assert events == sorted(events)
@@ -1,7 +1,8 @@
 """Kalshi live API connector with request signing.
 
 Uses API key/secret from environment (via Shared.config.Config) and signs
-requests with HMAC-SHA256 over timestamp + method + path + body.
+requests with HMAC-SHA256 over timestamp + method + path + body. Requests go
+through a pooled keep-alive session; order writes are never retried.
 """
 from __future__ import annotations
 
@@ -10,12 +11,16 @@ import hashlib
 import hmac
 import json
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-import requests
-
 from Shared.config import Config
+from Shared.http_client import LatencySnapshot, PooledHttpClient
+
+ORDER_ENDPOINT_TIMEOUTS = {
+    "POST /portfolio/orders": 20.0,
+    "DELETE /portfolio/orders/{order_id}": 10.0,
+}
 
 
 @dataclass
@@ -24,6 +29,16 @@ class KalshiLiveConnector:
 
     base_url: str = "https://trading-api.kalshi.com/trade-api/v2"
     timeout_s: int = 20
+    endpoint_timeouts: dict[str, float] = field(default_factory=lambda: dict(ORDER_ENDPOINT_TIMEOUTS))
+    client: PooledHttpClient | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.client is None:
+            self.client = PooledHttpClient(
+                self.base_url,
+                default_timeout_s=self.timeout_s,
+                endpoint_timeouts=self.endpoint_timeouts,
+            )
 
     def _headers(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, str]:
         if not Config.KALSHI_API_KEY or not Config.KALSHI_API_SECRET:
@@ -45,13 +60,24 @@ class KalshiLiveConnector:
             "Content-Type": "application/json",
         }
 
-    def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        endpoint: str | None = None,
+    ) -> dict[str, Any]:
         headers = self._headers(method, path, body)
-        response = requests.request(method, url, headers=headers, json=body, timeout=self.timeout_s)
+        response = self.client.request(method, path, endpoint=endpoint, headers=headers, json=body)
         response.raise_for_status()
         return response.json() if response.content else {"status": "ok"}
 
+    def latency_stats(self) -> dict[str, LatencySnapshot]:
+        return self.client.latency_stats()
+
+    def close(self) -> None:
+        self.client.close()
+
     def place_order(self, order: dict[str, Any]) -> dict[str, Any]:
         """Place order. Maps internal fields to Kalshi-compatible payload."""
         payload = {
@@ -69,4 +95,4 @@ class KalshiLiveConnector:
 
     def cancel_order(self, order_id: str) -> dict[str, Any]:
         """Cancel existing order."""
-        return self._request("DELETE", f"/portfolio/orders/{order_id}")
+        return self._request("DELETE", f"/portfolio/orders/{order_id}", endpoint="/portfolio/orders/{order_id}")
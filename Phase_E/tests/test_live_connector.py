@@ -0,0 +1,92 @@
+"""Live connector transport tests against a local stand-in HTTP server."""
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import sys
+from threading import Thread
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from Phase_E.live_connector import KalshiLiveConnector
+from Shared.config import Config
+from Shared.http_client import PooledHttpClient
+
+
+class _OrderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.requests.append(("POST", self.path, json.loads(self.rfile.read(length) or b"{}"), dict(self.headers)))
+        self.server.client_ports.add(self.client_address[1])
+        if self.server.fail_writes:
+            self._send(503, {"error": "busy"})
+            return
+        self._send(200, {"status": "resting", "order_id": f"ord-{len(self.server.requests)}"})
+
+    def do_DELETE(self):  # noqa: N802 - http.server naming
+        self.server.requests.append(("DELETE", self.path, None, dict(self.headers)))
+        self.server.client_ports.add(self.client_address[1])
+        self._send(200, {"status": "canceled"})
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def live_connector(monkeypatch):
+    monkeypatch.setattr(Config, "KALSHI_API_KEY", "test-key")
+    monkeypatch.setattr(Config, "KALSHI_API_SECRET", "test-secret")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OrderHandler)
+    server.requests = []
+    server.client_ports = set()
+    server.fail_writes = False
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    connector = KalshiLiveConnector(base_url=base_url, client=PooledHttpClient(base_url, backoff_s=0.0))
+    yield connector, server
+    connector.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_live_connector_signs_orders_over_one_connection(live_connector):
+    connector, server = live_connector
+    for _ in range(3):
+        response = connector.place_order({"ticker": "FED-RATE-25MAR", "side": "yes", "contracts": 1})
+        assert response["status"] == "resting"
+    assert connector.cancel_order("ord-1")["status"] == "canceled"
+
+    assert len(server.client_ports) == 1
+    method, path, body, headers = server.requests[0]
+    assert (method, path) == ("POST", "/portfolio/orders")
+    assert body == {"ticker": "FED-RATE-25MAR", "side": "YES", "count": 1, "type": "MARKET"}
+    assert headers["KALSHI-ACCESS-KEY"] == "test-key"
+
+    stats = connector.latency_stats()
+    assert stats["POST /portfolio/orders"].count == 3
+    assert stats["DELETE /portfolio/orders/{order_id}"].count == 1
+
+
+def test_live_connector_never_retries_order_writes(live_connector):
+    connector, server = live_connector
+    server.fail_writes = True
+
+    with pytest.raises(requests.HTTPError):
+        connector.place_order({"ticker": "FED-RATE-25MAR", "side": "no", "contracts": 1})
+    assert len(server.requests) == 1
+    assert connector.latency_stats()["POST /portfolio/orders"].errors == 1
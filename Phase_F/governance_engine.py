@@ -1,11 +1,23 @@
-"""Phase F governance and self-review engine."""
+"""Phase F governance and self-review engine.
+
+The equity curve over logged signals is folded into running aggregates
+(:class:`GovernanceState`) persisted next to the signals database. Each review
+reads only signals past the stored id watermark, so it costs O(new signals);
+:meth:`GovernanceEngine.rebuild` recomputes everything from a full scan and
+reports whether the stored aggregates agreed.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+import json
+import os
 from pathlib import Path
 import sqlite3
+import tempfile
+from threading import Lock
 
-from Phase_A.logger import DB_PATH
+from Phase_A.logger import DB_PATH, connect_reader
 from Shared.governance import GovernanceAdjustment, GovernancePolicy, PerformanceSnapshot
 
 
@@ -19,12 +31,79 @@ class GovernanceReport:
     adjustment: GovernanceAdjustment
 
 
+@dataclass
+class GovernanceState:
+    """Running equity-curve aggregates up to ``last_signal_id`` (unrounded)."""
+
+    last_signal_id: int = 0
+    equity: float = 0.0
+    peak: float = 0.0
+    max_drawdown: float = 0.0
+    wins: int = 0
+    losses: int = 0
+    updated_at: str | None = None
+
+    def fold(self, side: str, confidence: float, ev_percent: float) -> None:
+        if side == "HOLD":
+            return
+        pnl = max(min((ev_percent / 100.0) * 0.5, 0.5), -0.5)
+        pnl *= max(min(confidence, 1.0), 0.0)
+        if pnl >= 0:
+            self.wins += 1
+        else:
+            self.losses += 1
+        self.equity += pnl
+        self.peak = max(self.peak, self.equity)
+        self.max_drawdown = max(self.max_drawdown, self.peak - self.equity)
+
+    def aggregates(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "updated_at"}
+
+    @classmethod
+    def load(cls, path: Path) -> "GovernanceState | None":
+        if not path.exists():
+            return None
+        try:
+            return cls(**json.loads(path.read_text(encoding="utf-8")))
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        self.updated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # A unique temp name per writer; concurrent processes must not share one.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            json.dump(asdict(self), handle, indent=2)
+        try:
+            os.replace(handle.name, path)
+        except OSError:
+            os.unlink(handle.name)
+            raise
+
+
+@dataclass(frozen=True)
+class GovernanceRebuild:
+    """Outcome of a full-scan rebuild; ``mismatches`` lists aggregates that disagreed."""
+
+    state: GovernanceState
+    previous: GovernanceState | None
+    mismatches: tuple[str, ...]
+
+    @property
+    def verified(self) -> bool:
+        return self.previous is not None and not self.mismatches
+
+
 class GovernanceEngine:
     """Runs weekly-style governance analysis on logged trade signals."""
 
-    def __init__(self, db_path: str = DB_PATH) -> None:
+    def __init__(self, db_path: str = DB_PATH, state_path: str | Path | None = None) -> None:
         self.db_path = db_path
+        self.state_path = Path(state_path) if state_path else Path(f"{db_path}.governance.json")
         self.policy = GovernancePolicy()
+        self.signals_read = 0
+        self._lock = Lock()
 
     def run_self_review(self, *, daily_loss: float = 0.0, weekly_loss: float = 0.0) -> GovernanceReport:
         perf = self._build_performance_snapshot(daily_loss=daily_loss, weekly_loss=weekly_loss)
@@ -38,51 +117,72 @@ class GovernanceEngine:
             adjustment=adjustment,
         )
 
-    def _build_performance_snapshot(self, *, daily_loss: float, weekly_loss: float) -> PerformanceSnapshot:
-        if not Path(self.db_path).exists():
-            return PerformanceSnapshot(0, 0, 0, 0.0, 0.0, daily_loss, weekly_loss)
+    def refresh(self) -> GovernanceState:
+        """Fold signals newer than the persisted watermark into the stored aggregates."""
+        with self._lock:
+            if not Path(self.db_path).exists():
+                return GovernanceState()
+            conn = connect_reader(self.db_path)
+            try:
+                state = GovernanceState.load(self.state_path)
+                if state is None or state.last_signal_id > self._max_signal_id(conn):
+                    # Missing, unreadable, or the table was truncated/replaced: start over.
+                    state = GovernanceState()
+                if self._fold_new(conn, state):
+                    state.save(self.state_path)
+            finally:
+                conn.close()
+            return state
+
+    def rebuild(self) -> GovernanceRebuild:
+        """Recompute the aggregates from a full scan, compare, and persist the rebuilt state."""
+        previous = self.refresh() if self.state_path.exists() else None
+        with self._lock:
+            state = GovernanceState()
+            if Path(self.db_path).exists():
+                conn = connect_reader(self.db_path)
+                try:
+                    self._fold_new(conn, state)
+                finally:
+                    conn.close()
+            state.save(self.state_path)
+        mismatches = ()
+        if previous is not None:
+            stored, rebuilt = previous.aggregates(), state.aggregates()
+            mismatches = tuple(name for name in rebuilt if stored[name] != rebuilt[name])
+        return GovernanceRebuild(state=state, previous=previous, mismatches=mismatches)
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
+    def _fold_new(self, conn: sqlite3.Connection, state: GovernanceState) -> int:
+        # Served entirely from the partial covering index idx_trade_signals_review.
+        cursor = conn.execute(
             """
-            SELECT ticker, side, confidence, ev_percent
+            SELECT id, side, confidence, ev_percent
             FROM trade_signals
+            WHERE side IS NOT 'HOLD' AND id > ?
             ORDER BY id ASC
-            """
-        ).fetchall()
-        conn.close()
-
-        equity = 0.0
-        peak = 0.0
-        max_drawdown = 0.0
-        wins = 0
-        losses = 0
-
-        for row in rows:
-            confidence = float(row["confidence"])
-            ev_percent = float(row["ev_percent"])
-            side = row["side"]
-            if side == "HOLD":
-                continue
-
-            pnl = max(min((ev_percent / 100.0) * 0.5, 0.5), -0.5)
-            pnl *= max(min(confidence, 1.0), 0.0)
-            if pnl >= 0:
-                wins += 1
-            else:
-                losses += 1
-
-            equity += pnl
-            peak = max(peak, equity)
-            max_drawdown = max(max_drawdown, peak - equity)
+            """,
+            (state.last_signal_id,),
+        )
+        folded = 0
+        for row_id, side, confidence, ev_percent in cursor:
+            state.fold(side, float(confidence), float(ev_percent))
+            state.last_signal_id = row_id
+            folded += 1
+        self.signals_read += folded
+        return folded
 
+    @staticmethod
+    def _max_signal_id(conn: sqlite3.Connection) -> int:
+        return int(conn.execute("SELECT MAX(id) FROM trade_signals").fetchone()[0] or 0)
+
+    def _build_performance_snapshot(self, *, daily_loss: float, weekly_loss: float) -> PerformanceSnapshot:
+        state = self.refresh()
         return PerformanceSnapshot(
-            trade_count=wins + losses,
-            wins=wins,
-            losses=losses,
-            total_pnl=round(equity, 4),
-            max_drawdown=round(max_drawdown, 4),
+            trade_count=state.wins + state.losses,
+            wins=state.wins,
+            losses=state.losses,
+            total_pnl=round(state.equity, 4),
+            max_drawdown=round(state.max_drawdown, 4),
             daily_loss=daily_loss,
             weekly_loss=weekly_loss,
         )
@@ -1,16 +1,30 @@
 """Phase F offline model retraining pipeline."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import itertools
 import json
+import os
 from pathlib import Path
 import sqlite3
+import tempfile
+from typing import Iterator
 
-from Phase_A.logger import DB_PATH
+import numpy as np
+
+from Phase_A.logger import DB_PATH, connect_reader, iter_snapshot_rows, snapshot_tables
 from Phase_B.probability_engine import ProbabilityEngine
 from Shared.codex_client import get_codex_client
-from Shared.model_trainer import LightweightModelTrainer, TrainingSample, TrainingResult, write_training_artifact
+from Shared.config import Config
+from Shared.model_trainer import (
+    LightweightModelTrainer,
+    SufficientStatistics,
+    TrainingResult,
+    TrainingSample,
+    write_training_artifact,
+)
+from Shared.snapshot_store import ColumnarSnapshotStore
 
 
 @dataclass(frozen=True)
@@ -22,6 +36,46 @@ class RetrainReport:
     artifact_path: str
     weights_path: str
     codex_summary: str
+    mode: str = "full"
+    new_sample_count: int = 0
+
+
+@dataclass
+class RetrainState:
+    """Persisted online-training state: sufficient statistics plus read watermarks.
+
+    ``tails`` keeps the last seen ``(yes_bid, yes_ask, volume, timestamp_ms)`` per
+    ticker so the first new snapshot can label the previous one across retrain
+    calls. ``source`` identifies the snapshot source the watermarks refer to.
+    """
+
+    statistics: SufficientStatistics
+    source: str | None = None
+    last_snapshot_id: int = 0
+    store_offsets: dict[str, int] = field(default_factory=dict)
+    tails: dict[str, list[float]] = field(default_factory=dict)
+    updated_at: str | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "statistics": self.statistics.to_dict(),
+            "source": self.source,
+            "last_snapshot_id": self.last_snapshot_id,
+            "store_offsets": self.store_offsets,
+            "tails": self.tails,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "RetrainState":
+        return cls(
+            statistics=SufficientStatistics.from_dict(payload["statistics"]),
+            source=payload.get("source"),
+            last_snapshot_id=int(payload.get("last_snapshot_id", 0)),
+            store_offsets={k: int(v) for k, v in payload.get("store_offsets", {}).items()},
+            tails={k: list(v) for k, v in payload.get("tails", {}).items()},
+            updated_at=payload.get("updated_at"),
+        )
 
 
 class PhaseFModelRetrainer:
@@ -32,18 +86,43 @@ class PhaseFModelRetrainer:
         db_path: str = DB_PATH,
         weights_path: str | Path | None = None,
         artifacts_dir: str | Path | None = None,
+        snapshot_store: ColumnarSnapshotStore | None = None,
+        chunk_size: int = 50_000,
+        incremental: bool | None = None,
+        forgetting_factor: float | None = None,
     ) -> None:
         self.db_path = db_path
+        self.snapshot_store = snapshot_store
+        self.chunk_size = max(int(chunk_size), 1)
+        self.incremental = Config.RETRAIN_INCREMENTAL if incremental is None else incremental
+        self.forgetting_factor = Config.RETRAIN_FORGETTING_FACTOR if forgetting_factor is None else forgetting_factor
         self.trainer = LightweightModelTrainer()
         self.engine = ProbabilityEngine(weights_path=weights_path)
+        self.state_path = self.engine.weights_path.with_name("retrain_statistics.json")
         self.codex_client = get_codex_client()
         default_artifacts_dir = Path(__file__).resolve().parent / "artifacts"
         self.artifacts_dir = Path(artifacts_dir) if artifacts_dir else default_artifacts_dir
+        self.skipped_backfill_rows = 0
+
+    def retrain(self, full_rebuild: bool = False) -> RetrainReport:
+        """Retrain ensemble weights.
 
-    def retrain(self) -> RetrainReport:
-        samples = self._load_samples()
+        In incremental mode only snapshots past the persisted watermark are read; their
+        statistics are folded into the stored sums after applying the forgetting factor.
+        """
+        state = None if full_rebuild or not self.incremental else self._load_state()
+        mode = "incremental" if state is not None else "full"
+        state = state or RetrainState(
+            statistics=SufficientStatistics(n_features=len(self.trainer.feature_names)), source=self._source()
+        )
+
+        new_stats = self._accumulate_statistics(state)
+        if new_stats.sample_count:
+            state.statistics.decay(self.forgetting_factor)
+            state.statistics.merge(new_stats)
+        stats = state.statistics
         baseline = self.engine.get_retrain_status()["weights"]
-        result = self.trainer.train(samples, baseline)
+        result = self.trainer.train_from_statistics(stats, baseline)
 
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         artifact_path = self.artifacts_dir / f"retrain_{timestamp}.json"
@@ -61,6 +140,10 @@ class PhaseFModelRetrainer:
             },
         )
 
+        state.updated_at = timestamp
+        if self.incremental:
+            self._save_state(state)
+
         codex_summary = self._codex_review(result)
 
         return RetrainReport(
@@ -71,60 +154,177 @@ class PhaseFModelRetrainer:
             artifact_path=str(artifact_path),
             weights_path=str(self.engine.weights_path),
             codex_summary=codex_summary,
+            mode=mode,
+            new_sample_count=new_stats.sample_count,
         )
 
     def _load_samples(self) -> list[TrainingSample]:
-        """Build weakly-supervised training samples from historical snapshot evolution."""
-        if not Path(self.db_path).exists():
-            return []
+        """Materialize every training sample (small histories and diagnostics only)."""
+        samples: list[TrainingSample] = []
+        state = RetrainState(statistics=SufficientStatistics(n_features=len(self.trainer.feature_names)))
+        for x, y in self._iter_feature_chunks(state):
+            samples.extend(
+                TrainingSample(
+                    market_implied_yes=float(row[0]),
+                    external_yes=float(row[1]),
+                    bayesian_yes=float(row[2]),
+                    internal_yes=float(row[3]),
+                    outcome_yes=int(outcome),
+                )
+                for row, outcome in zip(x, y)
+            )
+        return samples
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            """
-            SELECT ticker, yes_bid, yes_ask, no_bid, no_ask, volume
-            FROM price_snapshots
-            ORDER BY ticker, timestamp ASC
-            """
-        ).fetchall()
-        conn.close()
-
-        by_ticker: dict[str, list[sqlite3.Row]] = {}
-        for row in rows:
-            by_ticker.setdefault(row["ticker"], []).append(row)
+    def _accumulate_statistics(self, state: RetrainState | None = None) -> SufficientStatistics:
+        """Stream feature chunks past the state's watermarks into fresh sufficient statistics."""
+        state = state or RetrainState(statistics=SufficientStatistics(n_features=len(self.trainer.feature_names)))
+        stats = SufficientStatistics(n_features=len(self.trainer.feature_names))
+        for x, y in self._iter_feature_chunks(state):
+            stats.update(x, y)
+        return stats
 
-        samples: list[TrainingSample] = []
-        for ticker_rows in by_ticker.values():
-            for idx in range(len(ticker_rows) - 1):
-                cur = ticker_rows[idx]
-                nxt = ticker_rows[idx + 1]
-                market_yes = self._clamp(((cur["yes_bid"] + cur["yes_ask"]) / 2) / 100.0)
-                external_yes = self._clamp(market_yes + self._volume_tilt(cur["volume"]))
-                bayesian_yes = self._clamp((market_yes * 0.65) + (external_yes * 0.35))
-                internal_yes = self._clamp(market_yes - ((cur["yes_ask"] - cur["yes_bid"]) / 1000.0))
-
-                next_mid = self._clamp(((nxt["yes_bid"] + nxt["yes_ask"]) / 2) / 100.0)
-                outcome_yes = 1 if next_mid >= market_yes else 0
-
-                samples.append(
-                    TrainingSample(
-                        market_implied_yes=market_yes,
-                        external_yes=external_yes,
-                        bayesian_yes=bayesian_yes,
-                        internal_yes=internal_yes,
-                        outcome_yes=outcome_yes,
-                    )
+    def _iter_feature_chunks(self, state: RetrainState) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Yield ``(features, outcomes)`` chunks and advance ``state`` watermarks as rows are read."""
+        if self.snapshot_store is not None:
+            yield from self._iter_store_chunks(self.snapshot_store, state)
+        elif Path(self.db_path).exists():
+            yield from self._iter_sqlite_chunks(state)
+
+    def _iter_sqlite_chunks(self, state: RetrainState) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Stream rows past ``state.last_snapshot_id`` ordered by (ticker, timestamp_ms).
+
+        Whenever a chunk starts or the ticker changes, that ticker's tail row (the last
+        row of the previous chunk or retrain) is prepended so its label is not lost.
+        The watermark is an id, so a backfilled row (newer id, event time before the
+        ticker's tail) cannot be placed in the sequence; it is skipped and counted in
+        ``skipped_backfill_rows`` until a full rebuild picks it up.
+        """
+        conn = connect_reader(self.db_path)
+        try:
+            # Index-only scan of each snapshot table's covering (ticker, timestamp_ms, ...) index.
+            cursor = iter_snapshot_rows(
+                conn,
+                """
+                SELECT id, ticker, yes_bid, yes_ask, volume, timestamp_ms
+                FROM {table}
+                WHERE id > ?
+                ORDER BY ticker, timestamp_ms ASC
+                """,
+                (state.last_snapshot_id,),
+                key=lambda row: (row[1], row[5]),
+            )
+            while True:
+                rows = list(itertools.islice(cursor, self.chunk_size))
+                if not rows:
+                    return
+
+                tickers: list[str] = []
+                values: list[list[float]] = []
+                previous_ticker = None
+                for row_id, ticker, yes_bid, yes_ask, volume, timestamp_ms in rows:
+                    state.last_snapshot_id = max(state.last_snapshot_id, int(row_id))
+                    tail = state.tails.get(ticker)
+                    if tail is not None and ticker != previous_ticker:
+                        if _precedes(timestamp_ms, tail):
+                            self.skipped_backfill_rows += 1
+                            continue
+                        tickers.append(ticker)
+                        values.append(tail[:3])
+                    current = [float(yes_bid), float(yes_ask), float(volume or 0)]
+                    tickers.append(ticker)
+                    values.append(current)
+                    state.tails[ticker] = current if timestamp_ms is None else [*current, int(timestamp_ms)]
+                    previous_ticker = ticker
+
+                if not values:
+                    continue
+                columns = np.array(values, dtype=float)
+                x, y = self._feature_arrays(columns[:, 0], columns[:, 1], columns[:, 2])
+                ticker_array = np.array(tickers, dtype=object)
+                if x.shape[0]:
+                    same_ticker = ticker_array[:-1] == ticker_array[1:]
+                    yield x[same_ticker], y[same_ticker]
+        finally:
+            conn.close()
+
+    def _iter_store_chunks(
+        self, store: ColumnarSnapshotStore, state: RetrainState
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Walk memory-mapped ticker columns past each ticker's offset in overlapping windows."""
+        for ticker in store.tickers():
+            columns = store.read(ticker)
+            first = max(state.store_offsets.get(ticker, 0) - 1, 0)
+            for start in range(first, max(len(columns) - 1, 0), self.chunk_size):
+                stop = start + self.chunk_size + 1
+                yield self._feature_arrays(
+                    columns.yes_bid[start:stop], columns.yes_ask[start:stop], columns.volume[start:stop]
                 )
+            state.store_offsets[ticker] = len(columns)
 
-        return samples
+    def _load_state(self) -> RetrainState | None:
+        """Load persisted statistics; ``None`` forces a full rebuild."""
+        if not self.state_path.exists():
+            return None
+        try:
+            state = RetrainState.from_dict(json.loads(self.state_path.read_text(encoding="utf-8")))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+        if state.source != self._source():
+            # Watermarks and statistics belong to a different source; reusing them would double-count.
+            return None
+        if self.snapshot_store is None and state.last_snapshot_id > self._max_snapshot_id():
+            # The table was truncated or replaced; the watermark no longer applies.
+            return None
+        return state
 
-    @staticmethod
-    def _volume_tilt(volume: int) -> float:
-        return max(min((volume - 10_000) / 250_000, 0.04), -0.04)
+    def _save_state(self, state: RetrainState) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.state_path.parent, prefix=f"{self.state_path.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            json.dump(state.to_dict(), handle, indent=2)
+        try:
+            os.replace(handle.name, self.state_path)
+        except OSError:
+            os.unlink(handle.name)
+            raise
+
+    def _source(self) -> str:
+        if self.snapshot_store is not None:
+            return f"store:{self.snapshot_store.root.resolve()}"
+        return f"sqlite:{Path(self.db_path).resolve()}"
+
+    def _max_snapshot_id(self) -> int:
+        if not Path(self.db_path).exists():
+            return 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return max(
+                int(conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0] or 0) for table in snapshot_tables(conn)
+            )
+        except sqlite3.OperationalError:
+            return 0
+        finally:
+            conn.close()
 
     @staticmethod
-    def _clamp(probability: float) -> float:
-        return min(max(float(probability), 0.01), 0.99)
+    def _feature_arrays(
+        yes_bid: np.ndarray, yes_ask: np.ndarray, volume: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized feature/label construction for consecutive snapshot pairs."""
+        if yes_bid.shape[0] < 2:
+            return np.empty((0, 4)), np.empty(0, dtype=int)
+
+        yes_bid = np.asarray(yes_bid, dtype=float)
+        yes_ask = np.asarray(yes_ask, dtype=float)
+        mid = np.clip(((yes_bid + yes_ask) / 2) / 100.0, 0.01, 0.99)
+        tilt = np.clip((np.asarray(volume[:-1], dtype=float) - 10_000) / 250_000, -0.04, 0.04)
+        market_yes = mid[:-1]
+        external_yes = np.clip(market_yes + tilt, 0.01, 0.99)
+        bayesian_yes = np.clip((market_yes * 0.65) + (external_yes * 0.35), 0.01, 0.99)
+        internal_yes = np.clip(market_yes - ((yes_ask[:-1] - yes_bid[:-1]) / 1000.0), 0.01, 0.99)
+        outcome_yes = (mid[1:] >= market_yes).astype(int)
+        return np.column_stack([market_yes, external_yes, bayesian_yes, internal_yes]), outcome_yes
 
     def _codex_review(self, result: TrainingResult) -> str:
         prompt = (
@@ -143,3 +343,8 @@ class PhaseFModelRetrainer:
         )
         response = self.codex_client.generate_text(prompt, temperature=0.1, max_tokens=120)
         return response.strip() if response else "Codex unavailable; manual governance review required."
+
+
+def _precedes(timestamp_ms: int | None, tail: list[float]) -> bool:
+    """Whether a row's event time is before the stored tail's (unknown times never are)."""
+    return timestamp_ms is not None and len(tail) > 3 and timestamp_ms < tail[3]
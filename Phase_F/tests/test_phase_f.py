@@ -1,12 +1,18 @@
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from Phase_B.probability_engine import ProbabilityEngine
 from Phase_C.risk_gateway import RiskGateway
-from Phase_F.governance_engine import GovernanceEngine
+from Phase_F.governance_engine import GovernanceEngine, GovernanceState
 from Phase_F.model_retrainer import PhaseFModelRetrainer
 from Phase_F.version_rollback import VersionRollbackManager
 from Shared.bankroll_tracker import BankrollTracker
 from Shared.governance import PerformanceSnapshot, GovernancePolicy
+from Shared.model_trainer import SufficientStatistics
+from Shared.snapshot_store import ColumnarSnapshotStore
+from Shared.time_utils import iso_to_epoch_ms
 
 
 def test_probability_engine_retrain_hooks(tmp_path: Path):
@@ -103,3 +109,252 @@ def test_model_retrainer_runs_with_empty_db(tmp_path: Path):
 
     assert report.sample_count == 0
     assert Path(report.artifact_path).exists()
+
+
+def _seed_snapshot_db(db_path: Path) -> None:
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE price_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT, timestamp TEXT, yes_bid REAL, yes_ask REAL, no_bid REAL, no_ask REAL, volume INTEGER, open_interest INTEGER)"
+    )
+    rows = []
+    for ticker, base in (("FED-RATE-25MAR", 60), ("WEATHER-NYC-SNOW", 30)):
+        for minute in range(12):
+            bid = base + (minute * 7) % 5
+            rows.append((ticker, f"2026-02-15T12:{minute:02d}:00Z", bid, bid + 2, 98 - bid, 100 - bid, 5000 + minute * 900, 1000))
+    conn.executemany(
+        "INSERT INTO price_snapshots (ticker, timestamp, yes_bid, yes_ask, no_bid, no_ask, volume, open_interest) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_snapshot_store_time_range_views(tmp_path: Path):
+    db_path = tmp_path / "snapshots.db"
+    _seed_snapshot_db(db_path)
+    store = ColumnarSnapshotStore(tmp_path / "store")
+
+    assert store.import_sqlite(db_path) == 24
+    assert store.tickers() == ["FED-RATE-25MAR", "WEATHER-NYC-SNOW"]
+
+    start = iso_to_epoch_ms("2026-02-15T12:03:00Z")
+    end = iso_to_epoch_ms("2026-02-15T12:07:00Z")
+    window = store.read("FED-RATE-25MAR", start_ms=start, end_ms=end)
+    assert len(window) == 4
+    assert isinstance(window.yes_bid, np.memmap)
+    assert window.snapshot_at(0).timestamp == "2026-02-15T12:03:00.000Z"
+    assert store.latest("WEATHER-NYC-SNOW").volume == 5000 + 11 * 900
+
+
+def test_model_retrainer_store_matches_sqlite_samples(tmp_path: Path):
+    db_path = tmp_path / "snapshots.db"
+    _seed_snapshot_db(db_path)
+    store = ColumnarSnapshotStore(tmp_path / "store")
+    store.import_sqlite(db_path)
+
+    from_sqlite = PhaseFModelRetrainer(db_path=str(db_path), weights_path=tmp_path / "w1.json")._load_samples()
+    from_store = PhaseFModelRetrainer(
+        db_path=str(tmp_path / "missing.db"),
+        weights_path=tmp_path / "w2.json",
+        snapshot_store=store,
+    )._load_samples()
+
+    assert len(from_store) == len(from_sqlite) == 22
+    for left, right in zip(from_sqlite, from_store):
+        assert left.outcome_yes == right.outcome_yes
+        assert left.external_yes == pytest.approx(right.external_yes)
+        assert left.internal_yes == pytest.approx(right.internal_yes)
+
+
+def test_streaming_statistics_match_in_memory_training(tmp_path: Path):
+    db_path = tmp_path / "snapshots.db"
+    _seed_snapshot_db(db_path)
+    retrainer = PhaseFModelRetrainer(db_path=str(db_path), weights_path=tmp_path / "w.json", chunk_size=5)
+    baseline = retrainer.engine.get_retrain_status()["weights"]
+
+    samples = retrainer._load_samples()
+    stats = retrainer._accumulate_statistics()
+    in_memory = retrainer.trainer.train(samples, baseline)
+    streamed = retrainer.trainer.train_from_statistics(stats, baseline)
+
+    assert stats.sample_count == len(samples) == 22
+    assert streamed.weights == pytest.approx(in_memory.weights, abs=1e-6)
+    assert streamed.calibration_bias == pytest.approx(in_memory.calibration_bias, abs=1e-6)
+    assert streamed.calibration_temperature == pytest.approx(in_memory.calibration_temperature, abs=1e-6)
+    assert streamed.new_brier == pytest.approx(in_memory.new_brier, abs=1e-4)
+    assert streamed.old_brier == pytest.approx(in_memory.old_brier, abs=1e-6)
+
+
+def test_incremental_retrain_folds_only_new_snapshots(tmp_path: Path):
+    import sqlite3
+
+    db_path = tmp_path / "snapshots.db"
+    _seed_snapshot_db(db_path)
+    incremental = PhaseFModelRetrainer(
+        db_path=str(db_path),
+        weights_path=tmp_path / "inc" / "weights.json",
+        artifacts_dir=tmp_path / "inc",
+        chunk_size=4,
+        incremental=True,
+    )
+    first = incremental.retrain()
+    assert (first.mode, first.sample_count, first.new_sample_count) == ("full", 22, 22)
+    assert incremental.state_path.exists()
+
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO price_snapshots (ticker, timestamp, yes_bid, yes_ask, no_bid, no_ask, volume, open_interest) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [("FED-RATE-25MAR", f"2026-02-15T13:{m:02d}:00Z", 61 + m, 63 + m, 37 - m, 39 - m, 20000, 1000) for m in range(3)],
+    )
+    conn.commit()
+    conn.close()
+
+    second = incremental.retrain()
+    assert (second.mode, second.sample_count, second.new_sample_count) == ("incremental", 25, 3)
+
+    full = PhaseFModelRetrainer(
+        db_path=str(db_path),
+        weights_path=tmp_path / "full" / "weights.json",
+        artifacts_dir=tmp_path / "full",
+        incremental=False,
+    ).retrain()
+    assert full.sample_count == 25
+    assert second.new_brier == pytest.approx(full.new_brier, abs=1e-9)
+    assert incremental.engine.weights == ProbabilityEngine(weights_path=tmp_path / "full" / "weights.json").weights
+
+
+def test_incremental_retrain_skips_backfilled_rows_and_resets_on_source_change(tmp_path: Path):
+    import sqlite3
+
+    db_path = tmp_path / "snapshots.db"
+    _seed_snapshot_db(db_path)
+    retrainer = PhaseFModelRetrainer(
+        db_path=str(db_path), weights_path=tmp_path / "weights.json", artifacts_dir=tmp_path / "a", incremental=True
+    )
+    retrainer.retrain()
+
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO price_snapshots (ticker, timestamp, yes_bid, yes_ask, no_bid, no_ask, volume, open_interest) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("FED-RATE-25MAR", "2026-02-15T11:59:00Z", 50, 52, 48, 50, 5000, 1000),  # backfill: older than the tail
+            ("FED-RATE-25MAR", "2026-02-15T12:30:00Z", 64, 66, 34, 36, 9000, 1000),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    second = retrainer.retrain()
+    assert (second.mode, second.sample_count, second.new_sample_count) == ("incremental", 23, 1)
+    assert retrainer.skipped_backfill_rows == 1
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+
+    store = ColumnarSnapshotStore(tmp_path / "store")
+    store.import_sqlite(db_path)
+    switched = PhaseFModelRetrainer(
+        db_path=str(db_path),
+        weights_path=tmp_path / "weights.json",
+        artifacts_dir=tmp_path / "a",
+        snapshot_store=store,
+        incremental=True,
+    ).retrain()
+    # The SQLite watermarks and statistics are not reused for the store.
+    assert (switched.mode, switched.sample_count, switched.new_sample_count) == ("full", 24, 24)
+
+
+def test_forgetting_factor_down_weights_history():
+    stats = SufficientStatistics()
+    stats.update(np.full((10, 4), 0.5), np.ones(10))
+    stats.decay(0.5)
+    assert stats.sample_count == 10
+    assert stats.weight == pytest.approx(5.0)
+    restored = SufficientStatistics.from_dict(stats.to_dict())
+    assert restored.xty == pytest.approx(stats.xty)
+
+
+def test_governance_folds_only_new_signals_and_rebuild_verifies(tmp_path: Path):
+    import json
+    import random
+    import sqlite3
+
+    db_path = tmp_path / "signals.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE trade_signals (id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT, side TEXT, confidence REAL, ev_percent REAL)"
+    )
+    rng = random.Random(7)
+
+    def add_signals(count: int) -> None:
+        conn.executemany(
+            "INSERT INTO trade_signals (ticker, side, confidence, ev_percent) VALUES (?, ?, ?, ?)",
+            [("A", rng.choice(["YES", "NO", "HOLD"]), rng.uniform(0.9, 1.0), rng.uniform(-40, 40)) for _ in range(count)],
+        )
+        conn.commit()
+
+    add_signals(300)
+    engine = GovernanceEngine(db_path=str(db_path))
+    engine.run_self_review()
+    first_read = engine.signals_read
+
+    add_signals(20)
+    incremental = GovernanceEngine(db_path=str(db_path))  # fresh instance: state comes from disk
+    report = incremental.run_self_review()
+    assert 0 < incremental.signals_read <= 20 < first_read
+
+    rebuilt = incremental.rebuild()
+    assert rebuilt.verified
+    assert report.trade_count == rebuilt.state.wins + rebuilt.state.losses
+    assert report.total_pnl == round(rebuilt.state.equity, 4)
+    assert report.max_drawdown == round(rebuilt.state.max_drawdown, 4)
+
+    state_path = Path(f"{db_path}.governance.json")
+    payload = json.loads(state_path.read_text(encoding="utf-8"))
+    state_path.write_text(json.dumps({**payload, "wins": payload["wins"] + 1}), encoding="utf-8")
+    tampered = GovernanceEngine(db_path=str(db_path)).rebuild()
+    assert tampered.mismatches == ("wins",)
+    assert GovernanceEngine(db_path=str(db_path)).rebuild().verified
+
+    conn.execute("DELETE FROM trade_signals")
+    conn.commit()
+    conn.close()
+    assert GovernanceEngine(db_path=str(db_path)).run_self_review().trade_count == 0
+
+
+def test_governance_state_concurrent_saves_use_distinct_temp_files(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = tmp_path / "signals.db.governance.json"
+
+    def save(writer: int) -> None:
+        for signal_id in range(50):
+            GovernanceState(last_signal_id=writer * 1000 + signal_id).save(path)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(save, range(4)))
+
+    assert GovernanceState.load(path).last_signal_id % 1000 == 49
+    assert [entry.name for entry in tmp_path.iterdir()] == [path.name]
+
+
+
+def test_full_retrain_reads_untimed_rows_across_monthly_partitions(tmp_path: Path):
+    from Phase_A.logger import LogWriter
+    from Shared.models import PriceSnapshot
+
+    db_path = str(tmp_path / "kalshi.db")
+    writer = LogWriter(db_path, batch_size=1000, partitioning="monthly")
+    writer.add_snapshots(
+        [
+            PriceSnapshot("A", "", 40, 42, 56, 58, volume=10),
+            PriceSnapshot("A", "2026-02-15T12:00:00Z", 41, 43, 55, 57, volume=10),
+            PriceSnapshot("A", "2026-03-01T00:00:00Z", 42, 44, 54, 56, volume=10),
+        ]
+    )
+    writer.close()
+
+    report = PhaseFModelRetrainer(
+        db_path=db_path, weights_path=tmp_path / "weights.json", artifacts_dir=tmp_path / "a", incremental=False
+    ).retrain()
+    assert report.sample_count == 2
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+
 from Shared.audit_logger import AuditLogger
+from Shared.time_utils import iso_to_epoch_ms
 
 
 def test_audit_logger_round_trip(tmp_path):
@@ -32,3 +36,113 @@ def test_audit_logger_filters(tmp_path):
     critical = logger.query_events(limit=10, severity="critical")
     assert len(critical) == 1
     assert critical[0].event_type == "error"
+
+
+def test_audit_logger_uses_wal_and_concurrent_threads(tmp_path):
+    logger = AuditLogger(tmp_path / "audit.db")
+    assert logger._writer.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def worker(index: int) -> int:
+        for event in range(20):
+            logger.log_event(component="api", event_type="bench", severity="info", message=f"{index}-{event}")
+        return len(logger.query_events(limit=1000, component="api"))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        seen = list(pool.map(worker, range(4)))
+
+    assert all(count >= 20 for count in seen)
+    assert len(logger.query_events(limit=1000)) == 80
+    logger.close()
+
+
+def test_audit_reader_pool_is_bounded_across_short_lived_threads(tmp_path):
+    import os
+    from threading import Thread
+
+    logger = AuditLogger(tmp_path / "audit.db", reader_pool_size=2)
+    logger.log_event(component="api", event_type="request", severity="info", message="hit")
+    fds_before = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+
+    # One thread per request, like Flask's threaded dev server.
+    for _ in range(50):
+        threads = [Thread(target=logger.query_events) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert logger.reader_count <= 2
+    if fds_before is not None:
+        assert len(os.listdir("/proc/self/fd")) <= fds_before + 2 * 3  # db, -wal, -shm per reader
+    logger.close()
+    assert logger.reader_count == 0
+
+
+def test_async_audit_logger_flushes_batches(tmp_path):
+    logger = AuditLogger(tmp_path / "audit.db", async_mode=True, batch_size=4, flush_interval_seconds=0.05)
+    for index in range(10):
+        assert logger.log_event(component="api", event_type="bench", severity="info", message=str(index)) == 0
+
+    assert len(logger.query_events(limit=100)) == 10
+    assert logger.writer_stats().written == 10
+    logger.close()
+    logger.close()
+
+
+def _stall_writer_and_log(logger: AuditLogger, count: int) -> None:
+    # Holding the write lock stalls the background writer so the bounded queue fills.
+    with logger._lock:
+        for index in range(count):
+            logger.log_event(component="api", event_type="bench", severity="info", message=str(index))
+
+
+def test_async_audit_logger_drops_info_when_full(tmp_path):
+    logger = AuditLogger(
+        tmp_path / "audit.db", async_mode=True, queue_size=2, batch_size=1, full_queue_policy="drop_info"
+    )
+    _stall_writer_and_log(logger, 50)
+    logger.log_event(component="api", event_type="error", severity="critical", message="kept")
+    logger.flush()
+
+    stats = logger.writer_stats()
+    assert stats.dropped >= 47
+    assert stats.written + stats.dropped == 51
+    assert len(logger.query_events(limit=100, severity="critical")) == 1
+    logger.close()
+
+
+def test_async_audit_logger_spills_and_replays(tmp_path):
+    logger = AuditLogger(tmp_path / "audit.db", async_mode=True, queue_size=2, batch_size=1, full_queue_policy="spill")
+    _stall_writer_and_log(logger, 50)
+    logger.flush()
+
+    stats = logger.writer_stats()
+    assert stats.spilled >= 47
+    assert stats.dropped == 0
+    assert len(logger.query_events(limit=100)) == 50
+    assert not logger.spill_path.exists()
+    logger.close()
+
+
+def test_audit_logger_migrates_text_timestamps_and_filters_on_epoch_ms(tmp_path):
+    db_path = tmp_path / "audit.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE audit_events (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, component TEXT NOT NULL, "
+        "event_type TEXT NOT NULL, severity TEXT NOT NULL, message TEXT NOT NULL, payload_json TEXT NOT NULL, trace_id TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO audit_events (timestamp, component, event_type, severity, message, payload_json) "
+        "VALUES ('2020-01-01T00:00:00+00:00', 'api', 'old', 'info', 'old', '{}')"
+    )
+    conn.commit()
+    conn.close()
+
+    logger = AuditLogger(db_path, async_mode=False)
+    logger.log_event(component="api", event_type="new", severity="info", message="new")
+
+    assert [event.event_type for event in logger.query_events(since="2025-01-01T00:00:00Z")] == ["new"]
+    assert len(logger.query_events(since=iso_to_epoch_ms("2019-12-31T00:00:00Z"))) == 2
+    assert logger.purge_older_than(days=30) == 1
+    assert [event.event_type for event in logger.query_events()] == ["new"]
+    logger.close()
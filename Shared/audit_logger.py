@@ -1,16 +1,90 @@
 """Phase H audit logging utilities.
 
 Stores structured events in SQLite for durable system decision trails.
+
+The database runs in WAL mode: one long-lived writer connection serializes
+inserts behind a lock, while queries check out one of at most
+``AUDIT_READER_POOL_SIZE`` read connections, so they never wait on writers and
+short-lived request threads do not each leave a connection behind.
+
+In async mode ``log_event`` only enqueues; a background writer flushes the
+bounded queue in ``executemany`` batches on size or time thresholds. A full
+queue either blocks the caller, drops info-level events, or spills events to
+a JSON-lines file that is replayed once the writer catches up. ``close()``
+(also registered with ``atexit``) drains everything before returning.
+
+Event time is stored as indexed integer epoch milliseconds (``timestamp_ms``);
+the ISO ``timestamp`` text is a display mirror. ``since`` filters and retention
+purges compare integers only.
 """
 from __future__ import annotations
 
+import atexit
+from contextlib import contextmanager
 import json
+import logging
+import queue
 import sqlite3
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from threading import Lock
-from typing import Any
+from threading import Lock, Thread
+from typing import Any, Iterator
+
+from Shared.config import Config
+from Shared.sqlite_migrations import Migration, add_epoch_ms_column, migrate
+from Shared.time_utils import epoch_ms_to_iso, iso_to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+QUEUE_FULL_POLICIES = ("block", "drop_info", "spill")
+_DROPPABLE_SEVERITIES = {"debug", "info"}
+_STOP = object()
+_FLUSH = object()
+
+# Statement text is kept constant so sqlite3's per-connection cache reuses the
+# prepared statement on every call.
+_INSERT_EVENT_SQL = """
+    INSERT INTO audit_events(
+        timestamp, component, event_type, severity, message, payload_json, trace_id, timestamp_ms
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_DAY_MS = 86_400_000
+
+
+def _add_timestamp_ms(conn: sqlite3.Connection) -> None:
+    add_epoch_ms_column(conn, "audit_events")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_events_timestamp_ms ON audit_events(timestamp_ms)")
+    # Nothing filters on the text column any more; stop paying for its index on every insert.
+    conn.execute("DROP INDEX IF EXISTS idx_audit_events_timestamp")
+
+
+AUDIT_MIGRATIONS = (
+    Migration(
+        1,
+        "audit_events table",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS audit_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                component TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                message TEXT NOT NULL,
+                payload_json TEXT NOT NULL,
+                trace_id TEXT
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_audit_events_component_severity
+            ON audit_events(component, severity)
+            """,
+        ),
+    ),
+    Migration(2, "integer epoch-ms timestamps", apply=_add_timestamp_ms),
+)
 
 
 @dataclass(frozen=True)
@@ -25,51 +99,122 @@ class AuditEvent:
     message: str
     payload: dict[str, Any]
     trace_id: str | None
+    timestamp_ms: int | None = None
+
+
+@dataclass(frozen=True)
+class AuditWriterStats:
+    """Counters for the audit write path."""
+
+    mode: str
+    policy: str
+    queued: int
+    written: int
+    dropped: int
+    spilled: int
 
 
 class AuditLogger:
     """SQLite-backed audit logger for monitoring and incident analysis."""
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(
+        self,
+        db_path: str | Path,
+        synchronous: str | None = None,
+        *,
+        async_mode: bool | None = None,
+        queue_size: int | None = None,
+        batch_size: int | None = None,
+        flush_interval_seconds: float | None = None,
+        full_queue_policy: str | None = None,
+        spill_path: str | Path | None = None,
+        reader_pool_size: int | None = None,
+    ) -> None:
         self.db_path = str(db_path)
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.synchronous = (synchronous or Config.AUDIT_SQLITE_SYNCHRONOUS).upper()
+        if self.synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported SQLite synchronous mode: {self.synchronous}")
         self._lock = Lock()
+        self.reader_pool_size = max(int(reader_pool_size or Config.AUDIT_READER_POOL_SIZE), 1)
+        self._readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_count = 0
+        self._pool_lock = Lock()
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
         self._init_db()
 
+        self.async_mode = Config.AUDIT_ASYNC if async_mode is None else async_mode
+        self.full_queue_policy = full_queue_policy or Config.AUDIT_QUEUE_POLICY
+        if self.full_queue_policy not in QUEUE_FULL_POLICIES:
+            raise ValueError(f"Unsupported audit queue policy: {self.full_queue_policy}")
+        self.batch_size = max(int(batch_size or Config.AUDIT_BATCH_SIZE), 1)
+        self.flush_interval_seconds = float(flush_interval_seconds or Config.AUDIT_FLUSH_INTERVAL_SECONDS)
+        self.spill_path = Path(spill_path) if spill_path else Path(f"{self.db_path}.spill.jsonl")
+        self._spill_lock = Lock()
+        self._drain_lock = Lock()
+        self._stats_lock = Lock()
+        self._counters = {"queued": 0, "written": 0, "dropped": 0, "spilled": 0}
+        self._closed = False
+        self._queue: queue.Queue = queue.Queue(maxsize=max(int(queue_size or Config.AUDIT_QUEUE_SIZE), 1))
+        self._flusher: Thread | None = None
+        if self.async_mode:
+            self._flusher = Thread(target=self._flush_loop, name="audit-writer", daemon=True)
+            self._flusher.start()
+            atexit.register(self.close)
+
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA busy_timeout=30000")
         return conn
 
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a pooled read connection; waits when all of them are in use."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                grow = self._reader_count < self.reader_pool_size
+                if grow:
+                    self._reader_count += 1
+            conn = self._connect() if grow else self._readers.get()
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._readers.put(conn)
+
+    @property
+    def reader_count(self) -> int:
+        return self._reader_count
+
+    def close(self) -> None:
+        """Flush pending async events, then close the writer and every pooled reader."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._flusher is not None:
+            self._queue.put(_STOP)
+            self._flusher.join()
+            self._drain_spill()
+        with self._pool_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._reader_count -= 1
+        with self._lock:
+            self._writer.close()
+
     def _init_db(self) -> None:
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS audit_events (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp TEXT NOT NULL,
-                        component TEXT NOT NULL,
-                        event_type TEXT NOT NULL,
-                        severity TEXT NOT NULL,
-                        message TEXT NOT NULL,
-                        payload_json TEXT NOT NULL,
-                        trace_id TEXT
-                    )
-                    """
-                )
-                conn.execute(
-                    """
-                    CREATE INDEX IF NOT EXISTS idx_audit_events_timestamp
-                    ON audit_events(timestamp)
-                    """
-                )
-                conn.execute(
-                    """
-                    CREATE INDEX IF NOT EXISTS idx_audit_events_component_severity
-                    ON audit_events(component, severity)
-                    """
-                )
+            migrate(self._writer, AUDIT_MIGRATIONS)
 
     def log_event(
         self,
@@ -81,29 +226,149 @@ class AuditLogger:
         payload: dict[str, Any] | None = None,
         trace_id: str | None = None,
     ) -> int:
-        """Persist one audit event and return inserted row id."""
+        """Persist one audit event and return inserted row id.
+
+        In async mode the event is enqueued and ``0`` is returned; the row id is not
+        known until the background writer flushes it.
+        """
 
         payload = payload or {}
-        timestamp = datetime.now(timezone.utc).isoformat()
+        now_ms = time.time_ns() // 1_000_000
+        row = (
+            epoch_ms_to_iso(now_ms),
+            component,
+            event_type,
+            severity,
+            message,
+            json.dumps(payload, separators=(",", ":"), sort_keys=True),
+            trace_id,
+            now_ms,
+        )
+        if self.async_mode and not self._closed:
+            self._enqueue(row)
+            return 0
+
         with self._lock:
-            with self._connect() as conn:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO audit_events(
-                        timestamp, component, event_type, severity, message, payload_json, trace_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        timestamp,
-                        component,
-                        event_type,
-                        severity,
-                        message,
-                        json.dumps(payload, separators=(",", ":"), sort_keys=True),
-                        trace_id,
-                    ),
-                )
-                return int(cursor.lastrowid)
+            with self._writer as conn:
+                cursor = conn.execute(_INSERT_EVENT_SQL, row)
+        self._count("written")
+        return int(cursor.lastrowid)
+
+    def flush(self) -> None:
+        """Block until every queued and spilled event has been written."""
+        if self._flusher is None or self._closed:
+            return
+        # The marker cuts the writer's batch wait short instead of idling to the interval.
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._drain_spill()
+
+    def writer_stats(self) -> AuditWriterStats:
+        with self._stats_lock:
+            return AuditWriterStats(
+                mode="async" if self.async_mode else "sync",
+                policy=self.full_queue_policy,
+                **self._counters,
+            )
+
+    def _enqueue(self, row: tuple) -> None:
+        try:
+            self._queue.put_nowait(row)
+            self._count("queued")
+            return
+        except queue.Full:
+            pass
+
+        severity = row[3]
+        if self.full_queue_policy == "drop_info" and severity in _DROPPABLE_SEVERITIES:
+            self._count("dropped")
+        elif self.full_queue_policy == "spill":
+            self._spill([row])
+        else:
+            # Backpressure: the caller waits for the writer to free a slot.
+            self._queue.put(row)
+            self._count("queued")
+
+    def _flush_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: list[tuple] = []
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP or item is _FLUSH:
+                    self._queue.task_done()
+                    stopping = item is _STOP
+                    break
+                batch.append(item)
+
+            if stopping:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _FLUSH:
+                        self._queue.task_done()
+                    else:
+                        batch.append(item)
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            if not self._queue.full():
+                self._drain_spill()
+
+    def _write_batch(self, rows: list[tuple]) -> None:
+        try:
+            with self._lock:
+                with self._writer as conn:
+                    conn.executemany(_INSERT_EVENT_SQL, rows)
+            self._count("written", len(rows))
+        except sqlite3.Error:
+            logger.exception("Audit batch write failed; spilling %d events", len(rows))
+            self._spill(rows)
+
+    def _spill(self, rows: list[tuple]) -> None:
+        with self._spill_lock:
+            with self.spill_path.open("a", encoding="utf-8") as handle:
+                for row in rows:
+                    handle.write(json.dumps(row) + "\n")
+        self._count("spilled", len(rows))
+
+    def _drain_spill(self) -> None:
+        """Replay spilled events; the file is renamed first so new spills keep appending."""
+        with self._drain_lock:
+            with self._spill_lock:
+                if not self.spill_path.exists():
+                    return
+                draining = self.spill_path.with_name(self.spill_path.name + ".draining")
+                self.spill_path.replace(draining)
+            rows = [_spilled_row(json.loads(line)) for line in draining.read_text(encoding="utf-8").splitlines() if line]
+            draining.unlink()
+            if not rows:
+                return
+            try:
+                with self._lock:
+                    with self._writer as conn:
+                        conn.executemany(_INSERT_EVENT_SQL, rows)
+            except sqlite3.Error:
+                logger.exception("Audit spill replay failed; keeping %d events spilled", len(rows))
+                with self._spill_lock:
+                    with self.spill_path.open("a", encoding="utf-8") as handle:
+                        handle.writelines(json.dumps(row) + "\n" for row in rows)
+                return
+            self._count("written", len(rows))
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[name] += amount
 
     def query_events(
         self,
@@ -111,10 +376,15 @@ class AuditLogger:
         limit: int = 100,
         component: str | None = None,
         severity: str | None = None,
-        since: str | None = None,
+        since: int | str | None = None,
     ) -> list[AuditEvent]:
-        """Query recent events with optional filters."""
+        """Query recent events with optional filters.
+
+        ``since`` is epoch milliseconds; ISO-8601 text is accepted and parsed once here.
+        """
 
+        # Read-your-writes: pending async events are flushed before querying.
+        self.flush()
         capped_limit = max(1, min(limit, 1000))
         clauses: list[str] = []
         params: list[Any] = []
@@ -125,20 +395,19 @@ class AuditLogger:
         if severity:
             clauses.append("severity = ?")
             params.append(severity)
-        if since:
-            clauses.append("timestamp >= ?")
-            params.append(since)
+        if since is not None and since != "":
+            clauses.append("timestamp_ms >= ?")
+            params.append(iso_to_epoch_ms(since) if isinstance(since, str) else int(since))
 
         where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         sql = (
-            "SELECT id, timestamp, component, event_type, severity, message, payload_json, trace_id "
+            "SELECT id, timestamp, timestamp_ms, component, event_type, severity, message, payload_json, trace_id "
             f"FROM audit_events {where_sql} ORDER BY id DESC LIMIT ?"
         )
         params.append(capped_limit)
 
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute(sql, params).fetchall()
+        with self._reader() as reader:
+            rows = reader.execute(sql, params).fetchall()
 
         events: list[AuditEvent] = []
         for row in rows:
@@ -152,6 +421,7 @@ class AuditLogger:
                     message=str(row["message"]),
                     payload=json.loads(row["payload_json"]),
                     trace_id=row["trace_id"],
+                    timestamp_ms=row["timestamp_ms"],
                 )
             )
         return events
@@ -159,8 +429,16 @@ class AuditLogger:
     def purge_older_than(self, days: int) -> int:
         """Delete events older than retention window and return count."""
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=max(days, 1))
+        cutoff_ms = time.time_ns() // 1_000_000 - max(days, 1) * _DAY_MS
+        self.flush()
         with self._lock:
-            with self._connect() as conn:
-                cursor = conn.execute("DELETE FROM audit_events WHERE timestamp < ?", (cutoff.isoformat(),))
+            with self._writer as conn:
+                cursor = conn.execute("DELETE FROM audit_events WHERE timestamp_ms < ?", (cutoff_ms,))
                 return int(cursor.rowcount)
+
+
+def _spilled_row(values: list) -> tuple:
+    """Spill files written before ``timestamp_ms`` existed hold 7-value rows."""
+    if len(values) == 7:
+        values.append(iso_to_epoch_ms(values[0]))
+    return tuple(values)
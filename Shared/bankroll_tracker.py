@@ -20,6 +20,7 @@ class BankrollTracker:
     weekly_loss: float = 0.0
     max_drawdown_pct: float = 0.0
     _peak_bankroll: float = 0.0
+    kelly_base_multiplier: float | None = None  # overrides Config.KELLY_BASE_MULTIPLIER (parameter sweeps)
 
     def __post_init__(self) -> None:
         self._peak_bankroll = self.current_bankroll
@@ -46,7 +47,9 @@ class BankrollTracker:
         At/above +20% growth: 0.25x.
         """
 
-        return Config.KELLY_GROWTH_MULTIPLIER if self.growth_ratio >= Config.GROWTH_UNLOCK_RATIO else Config.KELLY_BASE_MULTIPLIER
+        if self.growth_ratio >= Config.GROWTH_UNLOCK_RATIO:
+            return Config.KELLY_GROWTH_MULTIPLIER
+        return Config.KELLY_BASE_MULTIPLIER if self.kelly_base_multiplier is None else self.kelly_base_multiplier
 
     @property
     def exposure_capacity(self) -> float:
@@ -5,6 +5,7 @@ No secrets are hardcoded.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
 import os
 from pathlib import Path
 
@@ -32,12 +33,48 @@ class Config:
         "AUDIT_DB_PATH",
         str(Path(__file__).resolve().parent.parent / "phase_h_audit.db"),
     )
+    AUDIT_SQLITE_SYNCHRONOUS = os.getenv("AUDIT_SQLITE_SYNCHRONOUS", "NORMAL")
+    AUDIT_ASYNC = os.getenv("AUDIT_ASYNC", "false").lower() in {"1", "true", "yes"}
+    AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "200"))
+    AUDIT_FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "0.25"))
+    AUDIT_QUEUE_POLICY = os.getenv("AUDIT_QUEUE_POLICY", "block")
+    AUDIT_READER_POOL_SIZE = int(os.getenv("AUDIT_READER_POOL_SIZE", "4"))
     ALERT_CHANNELS = [c.strip() for c in os.getenv("ALERT_CHANNELS", "imessage,telegram").split(",") if c.strip()]
     TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
     TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
     HEALTH_ERROR_STREAK_RESTART = int(os.getenv("HEALTH_ERROR_STREAK_RESTART", "3"))
     HEALTH_LOG_RETENTION_DAYS = int(os.getenv("HEALTH_LOG_RETENTION_DAYS", "30"))
 
+    # Phase A market-data ingestion (source: mock | demo | live)
+    INGESTION_SOURCE = os.getenv("INGESTION_SOURCE", "mock")
+    INGESTION_REFRESH_SECONDS = float(os.getenv("INGESTION_REFRESH_SECONDS", "60"))
+    INGESTION_STALE_AFTER_SECONDS = float(os.getenv("INGESTION_STALE_AFTER_SECONDS", "180"))
+    INGESTION_BACKGROUND = os.getenv("INGESTION_BACKGROUND", "true").lower() in {"1", "true", "yes"}
+    KALSHI_WS_URL = os.getenv("KALSHI_WS_URL", "wss://trading-api.kalshi.com/trade-api/ws/v2")
+    ORDERBOOK_PUBLISH_INTERVAL_MS = float(os.getenv("ORDERBOOK_PUBLISH_INTERVAL_MS", "100"))
+
+    # Phase B external anchor sources
+    ANCHOR_FETCH_WORKERS = int(os.getenv("ANCHOR_FETCH_WORKERS", "4"))
+
+    # Columnar price snapshot store (memory-mapped per-ticker column files)
+    SNAPSHOT_STORE_DIR = os.getenv(
+        "SNAPSHOT_STORE_DIR",
+        str(Path(__file__).resolve().parent.parent / "snapshot_store"),
+    )
+
+    # Phase F online retraining
+    RETRAIN_INCREMENTAL = os.getenv("RETRAIN_INCREMENTAL", "true").lower() in {"1", "true", "yes"}
+    RETRAIN_FORGETTING_FACTOR = float(os.getenv("RETRAIN_FORGETTING_FACTOR", "1.0"))
+
+    # Outbound Kalshi HTTP (pooled sessions, GET retries)
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+    HTTP_BACKOFF_SECONDS = float(os.getenv("HTTP_BACKOFF_SECONDS", "0.2"))
+    HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "3.05"))
+    KALSHI_MARKETS_PAGE_SIZE = int(os.getenv("KALSHI_MARKETS_PAGE_SIZE", "1000"))
+    KALSHI_FETCH_CONCURRENCY = int(os.getenv("KALSHI_FETCH_CONCURRENCY", "4"))
+
     # Approval wait loop
     APPROVAL_WAIT_TIMEOUT_SECONDS = int(os.getenv("APPROVAL_WAIT_TIMEOUT_SECONDS", "60"))
 
@@ -57,10 +94,23 @@ class Config:
     GROWTH_UNLOCK_RATIO = 1.20
     MIN_BUYING_POWER = 40.00
 
+    # Phase A signal/snapshot log: signals write through, snapshots batch; optional monthly partitions
+    KALSHI_DB_PATH = os.getenv(
+        "KALSHI_DB_PATH",
+        str(Path(__file__).resolve().parent.parent / "kalshi_data.db"),
+    )
+    LOG_WRITE_BATCH_SIZE = int(os.getenv("LOG_WRITE_BATCH_SIZE", "100"))
+    LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv("LOG_FLUSH_INTERVAL_SECONDS", "1.0"))
+    SNAPSHOT_PARTITIONING = os.getenv("SNAPSHOT_PARTITIONING", "none")
+
     # Analysis thresholds
     MIN_EV_THRESHOLD = 0.40
     MIN_CONFIDENCE = 0.97
     MIN_CONFIRMATIONS = 4
+    ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "full")
+
+    # Backtesting (0 = one worker process per CPU)
+    BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", "0"))
 
     # Drawdown controls
     DRAWDOWN_DAILY_LIMIT = 0.25
@@ -70,6 +120,10 @@ class Config:
     MONTE_CARLO_SIMS = 1000
     MONTE_CARLO_STEPS = 25
     MAX_RUIN_PROBABILITY = 0.05
+    MONTE_CARLO_ENGINE = os.getenv("MONTE_CARLO_ENGINE", "vectorized")
+    MONTE_CARLO_MODE = os.getenv("MONTE_CARLO_MODE", "sampled")
+    STRESS_CACHE_SIZE = int(os.getenv("STRESS_CACHE_SIZE", "2048"))
+    STRESS_CACHE_TTL_SECONDS = float(os.getenv("STRESS_CACHE_TTL_SECONDS", "300"))
 
     # iMessage whitelist (sole authorized number)
     IMESSAGE_WHITELIST = ["+17657921945"]
@@ -77,3 +131,28 @@ class Config:
     @classmethod
     def is_codex_enabled(cls) -> bool:
         return bool(cls.CODEX_API_KEY)
+
+
+@dataclass(frozen=True)
+class StrategyParameters:
+    """Edge and sizing thresholds that can be varied without touching :class:`Config`.
+
+    Components accept an instance and fall back to the live ``Config`` values when
+    none is given, so parameter sweeps run side by side with default settings.
+    """
+
+    min_ev_threshold: float
+    min_confidence: float
+    min_confirmations: int
+    kelly_base_multiplier: float
+    max_trade_risk: float
+
+    @classmethod
+    def from_config(cls) -> "StrategyParameters":
+        return cls(
+            min_ev_threshold=Config.MIN_EV_THRESHOLD,
+            min_confidence=Config.MIN_CONFIDENCE,
+            min_confirmations=Config.MIN_CONFIRMATIONS,
+            kelly_base_multiplier=Config.KELLY_BASE_MULTIPLIER,
+            max_trade_risk=Config.MAX_TRADE_RISK,
+        )
@@ -0,0 +1,166 @@
+"""Pooled HTTP client shared by the Kalshi connectors.
+
+One ``requests.Session`` per connector keeps TCP/TLS connections alive across
+calls through a sized ``HTTPAdapter`` pool. Idempotent requests (GET/HEAD) are
+retried with exponential backoff on connection errors and 429/5xx responses;
+writes are never retried. Every call is timed into a per-endpoint latency
+histogram so slow endpoints show up without external tracing.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from Shared.config import Config
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class LatencySnapshot:
+    """Point-in-time latency histogram for one endpoint."""
+
+    count: int
+    errors: int
+    mean_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    buckets: dict[str, int]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; percentiles resolve to bucket upper bounds."""
+
+    def __init__(self, bounds_ms: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds_ms = bounds_ms
+        self._counts = [0] * (len(bounds_ms) + 1)
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._errors = 0
+        self._lock = Lock()
+
+    def observe(self, elapsed_ms: float, *, error: bool = False) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.bounds_ms, elapsed_ms)] += 1
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            self._errors += int(error)
+
+    def snapshot(self) -> LatencySnapshot:
+        with self._lock:
+            counts = list(self._counts)
+            total_ms, max_ms, errors = self._total_ms, self._max_ms, self._errors
+        count = sum(counts)
+        labels = [f"le_{bound:g}" for bound in self.bounds_ms] + ["inf"]
+        return LatencySnapshot(
+            count=count,
+            errors=errors,
+            mean_ms=round(total_ms / count, 3) if count else 0.0,
+            max_ms=round(max_ms, 3),
+            p50_ms=self._percentile(counts, 0.50, max_ms),
+            p95_ms=self._percentile(counts, 0.95, max_ms),
+            buckets=dict(zip(labels, counts)),
+        )
+
+    def _percentile(self, counts: list[int], pct: float, max_ms: float) -> float:
+        total = sum(counts)
+        if not total:
+            return 0.0
+        running = 0
+        for index, bucket_count in enumerate(counts):
+            running += bucket_count
+            if running >= pct * total:
+                return float(self.bounds_ms[index]) if index < len(self.bounds_ms) else round(max_ms, 3)
+        return round(max_ms, 3)
+
+
+class PooledHttpClient:
+    """Session wrapper with connection pooling, GET retries and latency tracking."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        default_timeout_s: float = 10.0,
+        endpoint_timeouts: dict[str, float] | None = None,
+        pool_size: int | None = None,
+        max_retries: int | None = None,
+        backoff_s: float | None = None,
+        connect_timeout_s: float | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.default_timeout_s = default_timeout_s
+        self.endpoint_timeouts = dict(endpoint_timeouts or {})
+        self.connect_timeout_s = Config.HTTP_CONNECT_TIMEOUT_SECONDS if connect_timeout_s is None else connect_timeout_s
+        pool_size = Config.HTTP_POOL_SIZE if pool_size is None else pool_size
+        retries = Retry(
+            total=Config.HTTP_MAX_RETRIES if max_retries is None else max_retries,
+            backoff_factor=Config.HTTP_BACKOFF_SECONDS if backoff_s is None else backoff_s,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._histograms_lock = Lock()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        endpoint: str | None = None,
+        timeout_s: float | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send ``method`` to ``base_url + path``; ``endpoint`` labels the histogram (e.g. a path template)."""
+        label = f"{method.upper()} {endpoint or path}"
+        read_timeout = timeout_s or self.endpoint_timeouts.get(label, self.default_timeout_s)
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method,
+                f"{self.base_url}{path}",
+                timeout=(self.connect_timeout_s, read_timeout),
+                **kwargs,
+            )
+        except requests.RequestException:
+            self._histogram(label).observe((time.perf_counter() - started) * 1000, error=True)
+            raise
+        self._histogram(label).observe(
+            (time.perf_counter() - started) * 1000, error=response.status_code >= 400
+        )
+        return response
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def latency_stats(self) -> dict[str, LatencySnapshot]:
+        with self._histograms_lock:
+            histograms = dict(self._histograms)
+        return {label: histogram.snapshot() for label, histogram in sorted(histograms.items())}
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _histogram(self, label: str) -> LatencyHistogram:
+        with self._histograms_lock:
+            histogram = self._histograms.get(label)
+            if histogram is None:
+                histogram = self._histograms[label] = LatencyHistogram()
+            return histogram
@@ -37,6 +37,74 @@ class TrainingResult:
     notes: str
 
 
+class SufficientStatistics:
+    """Streaming moment sums that fully determine the ridge fit and calibration.
+
+    Holds ``XᵀX``, ``Xᵀy``, ``Σx``, ``Σy`` and the sample count, so chunks can be
+    folded in one at a time and training runs in constant memory.
+    """
+
+    def __init__(self, n_features: int = 4) -> None:
+        self.sample_count = 0
+        self.weight = 0.0
+        self.x_sum = np.zeros(n_features)
+        self.xtx = np.zeros((n_features, n_features))
+        self.xty = np.zeros(n_features)
+        self.y_sum = 0.0
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Fold one chunk of feature rows and binary outcomes into the sums."""
+        if x.shape[0] == 0:
+            return
+        y = np.asarray(y, dtype=float)
+        self.sample_count += int(x.shape[0])
+        self.weight += float(x.shape[0])
+        self.x_sum += x.sum(axis=0)
+        self.xtx += x.T @ x
+        self.xty += x.T @ y
+        self.y_sum += float(y.sum())
+
+    def merge(self, other: "SufficientStatistics") -> None:
+        """Add another accumulator's sums into this one."""
+        self.sample_count += other.sample_count
+        self.weight += other.weight
+        self.x_sum += other.x_sum
+        self.xtx += other.xtx
+        self.xty += other.xty
+        self.y_sum += other.y_sum
+
+    def decay(self, factor: float) -> None:
+        """Exponentially down-weight history; ``factor=1.0`` keeps every sample equal."""
+        factor = min(max(float(factor), 0.0), 1.0)
+        self.weight *= factor
+        self.x_sum *= factor
+        self.xtx *= factor
+        self.xty *= factor
+        self.y_sum *= factor
+
+    def to_dict(self) -> dict:
+        return {
+            "sample_count": self.sample_count,
+            "weight": self.weight,
+            "x_sum": self.x_sum.tolist(),
+            "xtx": self.xtx.tolist(),
+            "xty": self.xty.tolist(),
+            "y_sum": self.y_sum,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "SufficientStatistics":
+        x_sum = np.asarray(payload["x_sum"], dtype=float)
+        stats = cls(n_features=x_sum.shape[0])
+        stats.sample_count = int(payload["sample_count"])
+        stats.weight = float(payload["weight"])
+        stats.x_sum = x_sum
+        stats.xtx = np.asarray(payload["xtx"], dtype=float)
+        stats.xty = np.asarray(payload["xty"], dtype=float)
+        stats.y_sum = float(payload["y_sum"])
+        return stats
+
+
 class LightweightModelTrainer:
     """Retrains conservative ensemble parameters using least-squares + calibration."""
 
@@ -91,6 +159,68 @@ class LightweightModelTrainer:
             notes="Brier score improved" if new_brier <= old_brier else "No improvement; review needed",
         )
 
+    def train_from_statistics(
+        self, stats: SufficientStatistics, baseline_weights: dict[str, float]
+    ) -> TrainingResult:
+        """Equivalent of :meth:`train` computed from moment sums alone.
+
+        Ensemble predictions are convex combinations of clipped features, so the
+        raw-prediction clips are exact no-ops. The post-calibration clips are
+        ignored, which only matters for the extreme tails.
+        """
+        if stats.weight <= 0:
+            return self.train([], baseline_weights)
+
+        n = stats.weight
+        mean_x = stats.x_sum / n
+        second_moment = stats.xtx / n
+        mean_y = stats.y_sum / n
+        # Outcomes are binary, so E[y²] == E[y].
+        mean_y_sq = mean_y
+
+        def brier(weights: np.ndarray, scale: float, offset: float) -> float:
+            mean_pred = float(mean_x @ weights)
+            mean_pred_sq = float(weights @ second_moment @ weights)
+            mean_pred_y = float(weights @ stats.xty) / n
+            return (
+                scale**2 * mean_pred_sq
+                + 2 * scale * offset * mean_pred
+                + offset**2
+                - 2 * (scale * mean_pred_y + offset * mean_y)
+                + mean_y_sq
+            )
+
+        baseline_vector = np.array([baseline_weights.get(name, 0.25) for name in self.feature_names], dtype=float)
+        baseline_vector = self._normalize_nonnegative(baseline_vector)
+
+        reg = 0.15
+        ridge_matrix = reg * np.eye(len(self.feature_names))
+        coeffs = np.linalg.pinv(stats.xtx + ridge_matrix) @ stats.xty
+        coeffs = self._normalize_nonnegative(coeffs)
+
+        mean_raw = float(mean_x @ coeffs)
+        calibration_bias = float(np.clip(mean_y - mean_raw, -0.10, 0.10))
+        variance = max(float(coeffs @ second_moment @ coeffs) - mean_raw**2, 0.0)
+        temperature = float(np.clip(1.0 + (0.05 - variance), 0.90, 1.20))
+
+        # adjusted = (raw + bias - 0.5) / T + 0.5 = scale * raw + offset
+        scale = 1.0 / temperature
+        offset = (calibration_bias - 0.5) / temperature + 0.5
+
+        old_brier = brier(baseline_vector, 1.0, 0.0)
+        new_brier = brier(coeffs, scale, offset)
+        learned_weights = {name: round(float(value), 6) for name, value in zip(self.feature_names, coeffs)}
+
+        return TrainingResult(
+            sample_count=stats.sample_count,
+            old_brier=round(old_brier, 6),
+            new_brier=round(new_brier, 6),
+            weights=learned_weights,
+            calibration_bias=round(calibration_bias, 6),
+            calibration_temperature=round(temperature, 6),
+            notes="Brier score improved" if new_brier <= old_brier else "No improvement; review needed",
+        )
+
     @staticmethod
     def _normalize_nonnegative(vector: np.ndarray) -> np.ndarray:
         vector = np.clip(vector, 0.0, None)
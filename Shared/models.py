@@ -2,6 +2,8 @@
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+from Shared.time_utils import iso_to_epoch_ms
+
 @dataclass
 class Market:
     ticker: str
@@ -16,8 +18,20 @@ class Event:
     market_ticker: str
     description: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PriceSnapshot:
+    """One top-of-book quote; frozen and slotted (no per-instance ``__dict__``).
+
+    Build variants with ``dataclasses.replace``; for large universes use
+    :class:`Shared.snapshot_batch.SnapshotBatch`. ``timestamp_ms`` is the
+    integer event time used internally; producers that already have it pass it
+    in, otherwise it is parsed once from the ISO ``timestamp``. An empty or
+    non-ISO ``timestamp`` leaves it ``None`` (event time unknown): such
+    snapshots are fine for scoring (including ``SnapshotBatch``), but
+    time-indexed paths (the columnar store, replay) reject them via
+    :meth:`require_timestamp_ms`.
+    """
+
     ticker: str
     timestamp: str
     yes_bid: float
@@ -26,6 +40,19 @@ class PriceSnapshot:
     no_ask: float
     volume: int = 0
     open_interest: int = 0
+    timestamp_ms: Optional[int] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.timestamp_ms is None and self.timestamp:
+            try:
+                object.__setattr__(self, "timestamp_ms", iso_to_epoch_ms(self.timestamp))
+            except ValueError:
+                pass
+
+    def require_timestamp_ms(self) -> int:
+        if self.timestamp_ms is None:
+            raise ValueError(f"Snapshot for {self.ticker} has no ISO-8601 timestamp: {self.timestamp!r}")
+        return self.timestamp_ms
 
 @dataclass
 class EVSignal:
@@ -1,9 +1,28 @@
-"""Shared Monte Carlo helpers for bankroll stress testing."""
+"""Shared Monte Carlo helpers for bankroll stress testing.
+
+Two engines produce the same :class:`MonteCarloSummary`:
+
+- ``vectorized`` (default) draws every win/loss outcome as one NumPy matrix and
+  builds multiplicative bankroll paths with absorbing ruin.
+- ``reference`` is the original pure-Python loop, kept for parity checks.
+
+Each engine is reproducible per seed; they use different generators, so their
+statistics agree within sampling tolerance rather than bit-for-bit.
+
+Because the risk fraction and binary payout are fixed, a path's bankroll depends
+only on its win count. :func:`exact_bankroll_summary` exploits that with a
+win-count lattice to return the same statistics exactly, with no sampling.
+"""
 from __future__ import annotations
 
 import random
 from dataclasses import dataclass
 
+import numpy as np
+
+MONTE_CARLO_ENGINES = ("vectorized", "reference")
+MAX_EXACT_STEPS = 5_000
+
 
 @dataclass(frozen=True)
 class MonteCarloSummary:
@@ -23,9 +42,77 @@ def simulate_bankroll_paths(
     steps: int = 25,
     ruin_threshold: float = 40.0,
     seed: int = 7,
+    engine: str = "vectorized",
 ) -> MonteCarloSummary:
     """Simulate repeated micro-trades and report tail risk statistics."""
 
+    if engine not in MONTE_CARLO_ENGINES:
+        raise ValueError(f"Unknown Monte Carlo engine: {engine}")
+
+    simulate = _simulate_vectorized if engine == "vectorized" else _simulate_reference
+    return simulate(
+        initial_bankroll=initial_bankroll,
+        risk_fraction=risk_fraction,
+        win_probability=win_probability,
+        payout_multiple=payout_multiple,
+        simulations=simulations,
+        steps=steps,
+        ruin_threshold=ruin_threshold,
+        seed=seed,
+    )
+
+
+def _simulate_vectorized(
+    *,
+    initial_bankroll: float,
+    risk_fraction: float,
+    win_probability: float,
+    payout_multiple: float,
+    simulations: int,
+    steps: int,
+    ruin_threshold: float,
+    seed: int,
+) -> MonteCarloSummary:
+    """NumPy engine: one outcome matrix, cumulative products, first-hit ruin."""
+
+    bounded_win_prob = min(max(win_probability, 0.0), 1.0)
+    bounded_risk_fraction = max(risk_fraction, 0.0)
+
+    # With no stake the reference loop never moves the bankroll nor checks ruin.
+    if bounded_risk_fraction <= 0 or initial_bankroll <= 0 or steps <= 0:
+        terminals = np.full(simulations, float(initial_bankroll))
+        return _summarize(terminals, ruins=0, simulations=simulations)
+
+    rng = np.random.default_rng(seed)
+    wins = rng.random((simulations, steps)) <= bounded_win_prob
+    factors = np.where(
+        wins,
+        1.0 + bounded_risk_fraction * payout_multiple,
+        1.0 - bounded_risk_fraction,
+    )
+    paths = initial_bankroll * np.cumprod(factors, axis=1)
+
+    # Ruin is absorbing: the bankroll freezes at the first breach of the threshold.
+    breached = paths <= ruin_threshold
+    ruined = breached.any(axis=1)
+    first_breach = np.where(ruined, breached.argmax(axis=1), steps - 1)
+    terminals = paths[np.arange(simulations), first_breach]
+    return _summarize(terminals, ruins=int(ruined.sum()), simulations=simulations)
+
+
+def _simulate_reference(
+    *,
+    initial_bankroll: float,
+    risk_fraction: float,
+    win_probability: float,
+    payout_multiple: float,
+    simulations: int,
+    steps: int,
+    ruin_threshold: float,
+    seed: int,
+) -> MonteCarloSummary:
+    """Original pure-Python loop, retained as the parity reference."""
+
     rng = random.Random(seed)
     terminals: list[float] = []
     ruins = 0
@@ -51,11 +138,94 @@ def simulate_bankroll_paths(
 
         terminals.append(bankroll)
 
-    terminals.sort()
+    return _summarize(np.asarray(terminals, dtype=float), ruins=ruins, simulations=simulations)
+
+
+def exact_bankroll_summary(
+    *,
+    initial_bankroll: float,
+    risk_fraction: float,
+    win_probability: float,
+    payout_multiple: float,
+    steps: int = 25,
+    ruin_threshold: float = 40.0,
+) -> MonteCarloSummary:
+    """Exact ruin probability and terminal percentiles via a win-count lattice.
+
+    After ``n`` steps with ``k`` wins the bankroll is
+    ``initial * (1 + f * payout)^k * (1 - f)^(n - k)``, so probability mass is
+    propagated over ``k`` in O(steps²). Mass that breaches the threshold is
+    absorbed with its bankroll at that step, mirroring the sampled engines.
+    """
+
+    if steps > MAX_EXACT_STEPS:
+        raise ValueError(f"Exact lattice supports at most {MAX_EXACT_STEPS} steps")
+
+    bounded_win_prob = min(max(win_probability, 0.0), 1.0)
+    bounded_risk_fraction = max(risk_fraction, 0.0)
+
+    if bounded_risk_fraction <= 0 or initial_bankroll <= 0 or steps <= 0:
+        return _summarize_weighted(
+            np.array([float(initial_bankroll)]), np.array([1.0]), ruin_probability=0.0
+        )
+
+    up = 1.0 + bounded_risk_fraction * payout_multiple
+    down = 1.0 - bounded_risk_fraction
+
+    alive = np.array([1.0])
+    ruin_values: list[np.ndarray] = []
+    ruin_masses: list[np.ndarray] = []
+    for step in range(1, steps + 1):
+        mass = np.zeros(step + 1)
+        mass[:-1] += alive * (1.0 - bounded_win_prob)
+        mass[1:] += alive * bounded_win_prob
+
+        wins = np.arange(step + 1)
+        values = initial_bankroll * np.power(up, wins) * np.power(down, step - wins)
+        breached = values <= ruin_threshold
+        if breached.any():
+            ruin_values.append(values[breached])
+            ruin_masses.append(mass[breached])
+            mass[breached] = 0.0
+        alive = mass
+
+    wins = np.arange(steps + 1)
+    final_values = initial_bankroll * np.power(up, wins) * np.power(down, steps - wins)
+    ruin_probability = float(sum(m.sum() for m in ruin_masses))
+    return _summarize_weighted(
+        np.concatenate([*ruin_values, final_values]),
+        np.concatenate([*ruin_masses, alive]),
+        ruin_probability=ruin_probability,
+    )
+
+
+def _summarize_weighted(
+    values: np.ndarray, weights: np.ndarray, *, ruin_probability: float
+) -> MonteCarloSummary:
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    cumulative = np.cumsum(weights[order])
+
+    def percentile(pct: float) -> float:
+        index = int(np.searchsorted(cumulative, pct * cumulative[-1], side="left"))
+        return float(ordered[min(index, ordered.size - 1)])
+
+    return MonteCarloSummary(
+        ruin_probability=min(max(ruin_probability, 0.0), 1.0),
+        p5_terminal=percentile(0.05),
+        p50_terminal=percentile(0.50),
+        p95_terminal=percentile(0.95),
+    )
+
+
+def _summarize(terminals: np.ndarray, *, ruins: int, simulations: int) -> MonteCarloSummary:
+    ordered = np.sort(terminals)
 
     def percentile(pct: float) -> float:
-        index = int((len(terminals) - 1) * pct)
-        return terminals[index]
+        if ordered.size == 0:
+            return 0.0
+        index = int((ordered.size - 1) * pct)
+        return float(ordered[index])
 
     return MonteCarloSummary(
         ruin_probability=ruins / simulations if simulations else 1.0,
@@ -0,0 +1,224 @@
+"""Columnar, memory-mappable price snapshot store.
+
+Each ticker owns a directory with one raw little-endian file per column
+(``timestamp_ms`` int64, prices float64, ``volume``/``open_interest`` int64).
+Appends are plain file appends; readers memory-map the files and receive
+zero-copy, time-range-sliced views. Rows within a ticker must be appended in
+non-decreasing timestamp order so range lookups are a binary search: bulk
+appends raise on violations, while live appends (``strict=False``) sort each
+batch and drop late or untimed rows with a warning.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import sqlite3
+from threading import Lock
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from Shared.models import PriceSnapshot
+from Shared.sqlite_migrations import columns as table_columns, table_exists
+from Shared.time_utils import epoch_ms_to_iso
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMNS: dict[str, np.dtype] = {
+    "timestamp_ms": np.dtype("<i8"),
+    "yes_bid": np.dtype("<f8"),
+    "yes_ask": np.dtype("<f8"),
+    "no_bid": np.dtype("<f8"),
+    "no_ask": np.dtype("<f8"),
+    "volume": np.dtype("<i8"),
+    "open_interest": np.dtype("<i8"),
+}
+
+
+@dataclass(frozen=True)
+class SnapshotColumns:
+    """Aligned column views for one ticker; arrays may be read-only memory maps."""
+
+    ticker: str
+    timestamp_ms: np.ndarray
+    yes_bid: np.ndarray
+    yes_ask: np.ndarray
+    no_bid: np.ndarray
+    no_ask: np.ndarray
+    volume: np.ndarray
+    open_interest: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.timestamp_ms.shape[0])
+
+    def snapshot_at(self, index: int) -> PriceSnapshot:
+        return PriceSnapshot(
+            ticker=self.ticker,
+            timestamp=epoch_ms_to_iso(int(self.timestamp_ms[index])),
+            timestamp_ms=int(self.timestamp_ms[index]),
+            yes_bid=float(self.yes_bid[index]),
+            yes_ask=float(self.yes_ask[index]),
+            no_bid=float(self.no_bid[index]),
+            no_ask=float(self.no_ask[index]),
+            volume=int(self.volume[index]),
+            open_interest=int(self.open_interest[index]),
+        )
+
+    def iter_snapshots(self) -> Iterator[PriceSnapshot]:
+        for index in range(len(self)):
+            yield self.snapshot_at(index)
+
+
+class ColumnarSnapshotStore:
+    """Append-only per-ticker column files with memory-mapped readers."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    def tickers(self) -> list[str]:
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def row_count(self, ticker: str) -> int:
+        directory = self._ticker_dir(ticker)
+        if not directory.exists():
+            return 0
+        # A torn append leaves some columns longer; the shortest column is authoritative.
+        return min(
+            self._column_path(ticker, name).stat().st_size // dtype.itemsize
+            if self._column_path(ticker, name).exists()
+            else 0
+            for name, dtype in SNAPSHOT_COLUMNS.items()
+        )
+
+    def append(self, snapshots: Iterable[PriceSnapshot], strict: bool = True) -> int:
+        """Append snapshots grouped per ticker and return the number of rows written.
+
+        ``strict=False`` is for live feeds: one late tick must not fail the batch.
+        """
+        by_ticker: dict[str, list[PriceSnapshot]] = {}
+        for snapshot in snapshots:
+            by_ticker.setdefault(snapshot.ticker, []).append(snapshot)
+
+        written = 0
+        with self._lock:
+            for ticker, rows in by_ticker.items():
+                if not strict:
+                    rows = self._in_order(ticker, rows)
+                columns = {
+                    "timestamp_ms": np.array([s.require_timestamp_ms() for s in rows], dtype=SNAPSHOT_COLUMNS["timestamp_ms"]),
+                    "yes_bid": np.array([s.yes_bid for s in rows], dtype=SNAPSHOT_COLUMNS["yes_bid"]),
+                    "yes_ask": np.array([s.yes_ask for s in rows], dtype=SNAPSHOT_COLUMNS["yes_ask"]),
+                    "no_bid": np.array([s.no_bid for s in rows], dtype=SNAPSHOT_COLUMNS["no_bid"]),
+                    "no_ask": np.array([s.no_ask for s in rows], dtype=SNAPSHOT_COLUMNS["no_ask"]),
+                    "volume": np.array([s.volume for s in rows], dtype=SNAPSHOT_COLUMNS["volume"]),
+                    "open_interest": np.array([s.open_interest for s in rows], dtype=SNAPSHOT_COLUMNS["open_interest"]),
+                }
+                written += self._append_columns(ticker, columns)
+        return written
+
+    def append_columns(self, ticker: str, columns: dict[str, np.ndarray]) -> int:
+        """Append already-columnar data (e.g. from a bulk import) for one ticker."""
+        with self._lock:
+            return self._append_columns(ticker, columns)
+
+    def read(self, ticker: str, start_ms: int | None = None, end_ms: int | None = None) -> SnapshotColumns:
+        """Zero-copy views over ``[start_ms, end_ms)`` for one ticker."""
+        count = self.row_count(ticker)
+        arrays = {name: self._map_column(ticker, name, count) for name in SNAPSHOT_COLUMNS}
+        timestamps = arrays["timestamp_ms"]
+        lo = 0 if start_ms is None else int(np.searchsorted(timestamps, start_ms, side="left"))
+        hi = count if end_ms is None else int(np.searchsorted(timestamps, end_ms, side="left"))
+        return SnapshotColumns(ticker=ticker, **{name: array[lo:hi] for name, array in arrays.items()})
+
+    def latest(self, ticker: str) -> PriceSnapshot | None:
+        columns = self.read(ticker)
+        return columns.snapshot_at(len(columns) - 1) if len(columns) else None
+
+    def import_sqlite(self, db_path: str | Path, batch_size: int = 50_000) -> int:
+        """Backfill from a Phase A ``price_snapshots`` table, streaming in batches."""
+        conn = sqlite3.connect(str(db_path))
+        try:
+            # Pre-migration tables have no integer column; fall back to parsing the text.
+            has_ms = "timestamp_ms" in table_columns(conn, "price_snapshots")
+            order = "timestamp_ms" if has_ms else "timestamp"
+            # The union view also covers monthly partitions when the database has them.
+            source = "price_snapshots_all" if table_exists(conn, "price_snapshots_all") else "price_snapshots"
+            cursor = conn.execute(
+                f"""
+                SELECT ticker, timestamp, yes_bid, yes_ask, no_bid, no_ask, volume, open_interest,
+                       {"timestamp_ms" if has_ms else "NULL"}
+                FROM {source}
+                ORDER BY ticker, {order} ASC
+                """
+            )
+            imported = 0
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return imported
+                imported += self.append(
+                    PriceSnapshot(
+                        ticker=row[0],
+                        timestamp=row[1],
+                        yes_bid=row[2],
+                        yes_ask=row[3],
+                        no_bid=row[4],
+                        no_ask=row[5],
+                        volume=row[6] or 0,
+                        open_interest=row[7] or 0,
+                        timestamp_ms=row[8],
+                    )
+                    for row in rows
+                )
+        finally:
+            conn.close()
+
+    def _append_columns(self, ticker: str, columns: dict[str, np.ndarray]) -> int:
+        timestamps = np.asarray(columns["timestamp_ms"], dtype=SNAPSHOT_COLUMNS["timestamp_ms"])
+        if timestamps.size == 0:
+            return 0
+        if np.any(np.diff(timestamps) < 0):
+            raise ValueError(f"Snapshots for {ticker} must be appended in timestamp order")
+
+        count = self.row_count(ticker)
+        if count:
+            last = self._map_column(ticker, "timestamp_ms", count)[-1]
+            if timestamps[0] < last:
+                raise ValueError(f"Snapshots for {ticker} must not precede stored rows")
+
+        self._ticker_dir(ticker).mkdir(parents=True, exist_ok=True)
+        for name, dtype in SNAPSHOT_COLUMNS.items():
+            path = self._column_path(ticker, name)
+            with path.open("r+b" if path.exists() else "wb") as handle:
+                # Drop any torn tail so every column stays aligned on `count` rows.
+                handle.truncate(count * dtype.itemsize)
+                handle.seek(0, 2)
+                handle.write(np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+        return int(timestamps.size)
+
+    def _in_order(self, ticker: str, rows: list[PriceSnapshot]) -> list[PriceSnapshot]:
+        kept = sorted((s for s in rows if s.timestamp_ms is not None), key=lambda s: s.timestamp_ms)
+        count = self.row_count(ticker)
+        if count and kept:
+            last = int(self._map_column(ticker, "timestamp_ms", count)[-1])
+            kept = [s for s in kept if s.timestamp_ms >= last]
+        if len(kept) < len(rows):
+            logger.warning("Dropped %d late or untimed snapshot(s) for %s", len(rows) - len(kept), ticker)
+        return kept
+
+    def _map_column(self, ticker: str, name: str, count: int) -> np.ndarray:
+        dtype = SNAPSHOT_COLUMNS[name]
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._column_path(ticker, name), dtype=dtype, mode="r", shape=(count,))
+
+    def _ticker_dir(self, ticker: str) -> Path:
+        if not ticker or "/" in ticker or "\\" in ticker or ticker in {".", ".."}:
+            raise ValueError(f"Invalid ticker for snapshot store: {ticker!r}")
+        return self.root / ticker
+
+    def _column_path(self, ticker: str, name: str) -> Path:
+        return self._ticker_dir(ticker) / f"{name}.{SNAPSHOT_COLUMNS[name].str[1:]}"
@@ -0,0 +1,101 @@
+"""Versioned, idempotent SQLite schema migrations.
+
+Each database records the last applied migration in ``PRAGMA user_version``.
+:func:`migrate` applies the newer migrations in version order, each inside its
+own transaction together with the version bump, so a failed migration leaves
+the schema at the previous version.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import sqlite3
+from typing import Callable, Sequence
+
+# Exact ISO-8601 text -> epoch milliseconds in SQL (``Z``/offset suffixes and
+# naive UTC, like ``Shared.time_utils.iso_to_epoch_ms``); NULL when unparseable.
+EPOCH_MS_SQL = "(CAST(strftime('%s', {col}) AS INTEGER) * 1000 + CAST(substr(strftime('%f', {col}), 4) AS INTEGER))"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema step: plain ``statements`` followed by an optional ``apply`` hook."""
+
+    version: int
+    description: str
+    statements: tuple[str, ...] = ()
+    apply: Callable[[sqlite3.Connection], None] | None = None
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(conn: sqlite3.Connection, migrations: Sequence[Migration]) -> list[int]:
+    """Apply migrations newer than the database's ``user_version``; returns applied versions."""
+    versions = [migration.version for migration in migrations]
+    if versions != sorted(set(versions)):
+        raise ValueError(f"Migration versions must be unique and increasing: {versions}")
+    applied: list[int] = []
+    current = schema_version(conn)
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another connection may have migrated while we waited for the write lock.
+            if schema_version(conn) >= migration.version:
+                conn.rollback()
+                current = schema_version(conn)
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            if migration.apply is not None:
+                migration.apply(conn)
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        current = migration.version
+        applied.append(migration.version)
+    return applied
+
+
+def table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (table,)).fetchone()
+    return row is not None
+
+
+def columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, declaration: str) -> bool:
+    """``ALTER TABLE ... ADD COLUMN`` unless the column exists; returns whether it was added."""
+    if column in columns(conn, table):
+        return False
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+    return True
+
+
+def add_epoch_ms_column(conn: sqlite3.Connection, table: str, source: str = "timestamp", target: str = "timestamp_ms") -> None:
+    """Add an integer ``target`` mirror of ISO text ``source``, backfilled and kept filled.
+
+    Writers should set ``target`` themselves; the trigger only covers legacy
+    inserts that still write text alone.
+    """
+    add_column(conn, table, target, "INTEGER")
+    if source not in columns(conn, table):
+        return
+    conn.execute(f"UPDATE {table} SET {target} = {EPOCH_MS_SQL.format(col=source)} WHERE {target} IS NULL")
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{target}
+        AFTER INSERT ON {table}
+        WHEN NEW.{target} IS NULL AND NEW.{source} IS NOT NULL
+        BEGIN
+            UPDATE {table} SET {target} = {EPOCH_MS_SQL.format(col="NEW." + source)} WHERE rowid = NEW.rowid;
+        END
+        """
+    )
@@ -0,0 +1,24 @@
+"""Timestamp conversion helpers.
+
+Internally timestamps are integer epoch milliseconds (UTC); ISO-8601 text is only
+parsed or produced at storage and API boundaries.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def iso_to_epoch_ms(value: str) -> int:
+    """Parse ISO-8601 text (``Z`` suffix or naive treated as UTC) to epoch milliseconds."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _EPOCH) // timedelta(milliseconds=1)
+
+
+def epoch_ms_to_iso(value: int) -> str:
+    """Format epoch milliseconds as ISO-8601 UTC text with a ``Z`` suffix."""
+    moment = _EPOCH + timedelta(milliseconds=int(value))
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
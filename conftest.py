@@ -0,0 +1,21 @@
+"""Keep test runs away from the working databases at the repository root.
+
+``Phase_A.api`` initialises the signal log and the Phase H audit logger at
+import time, so their paths must point at a scratch directory before any test
+module (and with it ``Shared.config``) is imported.
+"""
+import os
+from pathlib import Path
+import shutil
+import tempfile
+
+_SCRATCH = Path(tempfile.mkdtemp(prefix="kalshiguard-tests-"))
+
+
+def pytest_configure(config):
+    os.environ["KALSHI_DB_PATH"] = str(_SCRATCH / "kalshi_data.db")
+    os.environ["AUDIT_DB_PATH"] = str(_SCRATCH / "phase_h_audit.db")
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_SCRATCH, ignore_errors=True)
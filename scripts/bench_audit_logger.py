@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark AuditLogger throughput under concurrent Flask-style worker threads.
+
+Each worker mimics a request handler: it logs an event and, every few events,
+queries recent events, as `/health` and `/logs` do.
+
+Usage: python scripts/bench_audit_logger.py [--workers 8] [--events 500] [--async]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Shared.audit_logger import AuditLogger
+
+
+def run(workers: int, events: int, read_every: int, synchronous: str, async_mode: bool = False) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = AuditLogger(Path(tmp) / "bench_audit.db", synchronous=synchronous, async_mode=async_mode)
+
+        def worker(index: int) -> int:
+            reads = 0
+            for event in range(events):
+                logger.log_event(
+                    component="api",
+                    event_type="health_check",
+                    severity="info",
+                    message="Health endpoint queried",
+                    payload={"worker": index, "event": event},
+                )
+                if read_every and event % read_every == 0:
+                    logger.query_events(limit=50, component="api")
+                    reads += 1
+            return reads
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            reads = sum(pool.map(worker, range(workers)))
+        logger.flush()
+        elapsed = time.perf_counter() - started
+        logger.close()
+
+    writes = workers * events
+    return {
+        "mode": "async" if async_mode else "sync",
+        "workers": workers,
+        "writes": writes,
+        "reads": reads,
+        "seconds": round(elapsed, 3),
+        "events_per_sec": round(writes / elapsed, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--read-every", type=int, default=5)
+    parser.add_argument("--synchronous", default="NORMAL")
+    parser.add_argument("--async", dest="async_mode", action="store_true")
+    args = parser.parse_args()
+
+    print(run(args.workers, args.events, args.read_every, args.synchronous, args.async_mode))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
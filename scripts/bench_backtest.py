@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Benchmark parallel BacktestHarness scenarios against a single-process run.
+
+Each scenario replays ``--trades`` paper trades with its own perturbation seed;
+the same scenario list is run with one worker and with ``--workers`` processes.
+
+Usage: python scripts/bench_backtest.py [--scenarios 16] [--trades 200] [--workers 4]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Phase_D.backtest_harness import BacktestHarness, BacktestScenario
+
+
+def run(scenarios: int, trades: int, workers: int) -> list[dict[str, float]]:
+    batch = [BacktestScenario(name=f"seed-{seed}", trades=trades, seed=seed) for seed in range(scenarios)]
+    harness = BacktestHarness()
+    rows = []
+    for count in (1, workers):
+        result = harness.run_scenarios(batch, max_workers=count)
+        rows.append(
+            {
+                "workers": result.workers,
+                "trades": result.total_trades_executed,
+                "seconds": result.elapsed_seconds,
+                "trades_per_sec": result.trades_per_second,
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=16)
+    parser.add_argument("--trades", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    for row in run(args.scenarios, args.trades, args.workers):
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare memory per million snapshots: dict-backed objects, slotted PriceSnapshot, SnapshotBatch.
+
+Usage: python scripts/bench_snapshot_memory.py [--count 1000000]
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Shared.models import PriceSnapshot
+from Shared.snapshot_batch import SnapshotBatch
+from Shared.time_utils import epoch_ms_to_iso
+
+TICKERS = ("FED-RATE-25MAR", "WEATHER-NYC-SNOW", "CPI-MAR-HOT", "SPX-EOY-5K")
+
+
+@dataclass
+class DictSnapshot:
+    """The previous PriceSnapshot layout (regular dataclass with ``__dict__``)."""
+
+    ticker: str
+    timestamp: str
+    yes_bid: float
+    yes_ask: float
+    no_bid: float
+    no_ask: float
+    volume: int = 0
+    open_interest: int = 0
+
+
+def _rows(count: int):
+    for index in range(count):
+        yield (
+            TICKERS[index % len(TICKERS)],
+            epoch_ms_to_iso(1_771_156_800_000 + index * 1_000),
+            float(40 + index % 20),
+            float(42 + index % 20),
+            float(56 - index % 20),
+            float(58 - index % 20),
+            1_000 + index,
+            50_000 + index,
+        )
+
+
+def _measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current
+
+
+def run(count: int) -> dict[str, float]:
+    per_million = 1_000_000 / count
+    _, legacy = _measure(lambda: [DictSnapshot(*row) for row in _rows(count)])
+    slotted, slotted_bytes = _measure(lambda: [PriceSnapshot(*row) for row in _rows(count)])
+    batch, _ = _measure(lambda: SnapshotBatch.from_snapshots(slotted))
+    return {
+        "snapshots": count,
+        "dict_dataclass_mb_per_million": round(legacy * per_million / 1e6, 1),
+        "slotted_frozen_mb_per_million": round(slotted_bytes * per_million / 1e6, 1),
+        "snapshot_batch_mb_per_million": round(batch.nbytes * per_million / 1e6, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(run(args.count))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
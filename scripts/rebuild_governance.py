@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Rebuild the persisted governance aggregates from a full scan of ``trade_signals``.
+
+Compares the stored running aggregates (equity, peak, max drawdown, wins,
+losses, watermark) against the rebuilt ones, prints any mismatches and replaces
+the stored state. Exits non-zero when the stored state disagreed.
+
+Usage: python scripts/rebuild_governance.py [--db kalshi_data.db] [--state kalshi_data.db.governance.json]
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Phase_A.logger import DB_PATH
+from Phase_F.governance_engine import GovernanceEngine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--state")
+    args = parser.parse_args()
+
+    result = GovernanceEngine(db_path=args.db, state_path=args.state).rebuild()
+    print({"rebuilt": result.state.aggregates(), "had_state": result.previous is not None, "mismatches": result.mismatches})
+    for name in result.mismatches:
+        print(f"  {name}: stored={getattr(result.previous, name)!r} rebuilt={getattr(result.state, name)!r}")
+    return 1 if result.mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Replay stored price snapshots through the paper-trading pipeline.
+
+Reads the Phase A ``price_snapshots`` table (or an exported JSON-lines file) in
+event-time order. Pass ``--checkpoint`` to make long runs resumable: rerunning
+the same command continues after the last checkpointed snapshot.
+
+Usage: python scripts/replay_backtest.py [--db kalshi_data.db | --jsonl snapshots.jsonl]
+       [--start 2026-01-01T00:00:00Z] [--end 2026-02-01T00:00:00Z] [--checkpoint replay.json]
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from Phase_A.logger import DB_PATH
+from Phase_D.replay_backtester import JsonLinesSnapshotSource, ReplayBacktester, SqliteSnapshotSource
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--jsonl")
+    parser.add_argument("--start")
+    parser.add_argument("--end")
+    parser.add_argument("--checkpoint")
+    parser.add_argument("--checkpoint-every", type=int, default=1_000)
+    parser.add_argument("--bankroll", type=float, default=50.0)
+    args = parser.parse_args()
+
+    source = JsonLinesSnapshotSource(args.jsonl) if args.jsonl else SqliteSnapshotSource(args.db)
+    backtester = ReplayBacktester(
+        source,
+        starting_bankroll=args.bankroll,
+        checkpoint_path=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+    )
+    print(asdict(backtester.run(start=args.start, end=args.end)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())